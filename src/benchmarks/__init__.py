@@ -0,0 +1,11 @@
+"""
+Performance benchmarks of the manager and service layers.
+
+Run ``python -m src.benchmarks --sizes 10k 100k --output results.json`` to load a
+deterministic synthetic dataset of each size into an in-memory and a file-backed
+database, run the CRUD, query and concurrent workloads against each, and write
+throughput and latency percentiles as JSON for comparing runs.
+
+``python -m src.benchmarks.import_time`` measures the import cost of the models,
+managers and engine setup in fresh interpreters.
+"""
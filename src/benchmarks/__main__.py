@@ -0,0 +1,5 @@
+# Local application imports
+from src.benchmarks.run import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# Standard library imports
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+# Local application imports
+from src.models.model import Goal, Task, TaskHistory, AISuggestion
+from src.services.validation import construct_trusted
+
+# Named dataset sizes, in tasks.
+SIZES: Dict[str, int] = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+STATUSES = ("Not Started", "In Progress", "Completed")
+# Fixed origin of every generated timestamp, so datasets do not depend on the clock.
+EPOCH = datetime(2024, 1, 1)
+WORDS = (
+    "review", "draft", "budget", "report", "call", "plan", "design", "fix", "deploy", "write",
+    "meeting", "email", "invoice", "research", "update", "test", "refactor", "launch", "sync", "notes",
+)
+
+def parse_size(size: str) -> int:
+    """Returns the number of tasks of a named size such as ``100k``, or of a plain number."""
+    if size.lower() in SIZES:
+        return SIZES[size.lower()]
+    try:
+        count = int(size)
+    except ValueError:
+        raise ValueError(f"Unknown dataset size '{size}'. Use one of {sorted(SIZES)} or a number")
+    if count < 1:
+        raise ValueError("Dataset size must be at least 1")
+    return count
+
+def row_counts(task_count: int) -> Dict[str, int]:
+    """
+    Returns the number of rows generated per table for a dataset of ``task_count`` tasks.
+
+    There is one goal per 100 tasks, one history entry per task and one AI
+    suggestion per 10 tasks.
+    """
+    return {
+        "goal": max(1, task_count // 100),
+        "task": task_count,
+        "taskhistory": task_count,
+        "aisuggestion": max(1, task_count // 10),
+    }
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+class DatasetGenerator:
+    """
+    Generates a deterministic synthetic dataset in chunks.
+
+    The same ``task_count`` and ``seed`` always produce the same rows, including the
+    ids, so the ids of tasks and goals can be used by workloads without querying.
+    Each table is generated from its own seeded stream, so generating one table does
+    not shift the values of another. Rows are produced ``chunk_size`` at a time,
+    keeping memory flat at any size; they are valid by construction, so they are
+    built with construct_trusted.
+    """
+
+    def __init__(self, task_count: int, seed: int = 0, chunk_size: int = 5000):
+        """
+        Initializes the generator.
+
+        Args:
+            task_count (int): The number of tasks; other tables scale with it, see row_counts.
+            seed (int): The random seed.
+            chunk_size (int): The number of rows per generated chunk.
+        """
+        self.task_count = task_count
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.counts = row_counts(task_count)
+
+    def _rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table}")
+
+    def _chunks(self, table: str, make) -> Iterator[List]:
+        rng = self._rng(table)
+        count = self.counts[table]
+        for start in range(1, count + 1, self.chunk_size):
+            yield [make(rng, row_id) for row_id in range(start, min(start + self.chunk_size, count + 1))]
+
+    def goals(self) -> Iterator[List[Goal]]:
+        def make(rng: random.Random, goal_id: int) -> Goal:
+            return construct_trusted(Goal, dict(
+                id=goal_id,
+                name=f"Goal {goal_id} {_text(rng, 2)}",
+                description=_text(rng, 8),
+                status=rng.choice(STATUSES),
+                created_at=EPOCH + timedelta(minutes=goal_id),
+            ))
+        return self._chunks("goal", make)
+
+    def tasks(self) -> Iterator[List[Task]]:
+        goal_count = self.counts["goal"]
+
+        def make(rng: random.Random, task_id: int) -> Task:
+            due = EPOCH + timedelta(days=rng.randrange(365), hours=rng.randrange(24))
+            return construct_trusted(Task, dict(
+                id=task_id,
+                goal_id=rng.randint(1, goal_count) if rng.random() < 0.8 else None,
+                name=f"Task {task_id} {_text(rng, 3)}",
+                description=_text(rng, 12),
+                priority=rng.randint(1, 5),
+                status=rng.choice(STATUSES),
+                due_date=due,
+                duration_seconds=rng.choice((900, 1800, 3600, 7200)),
+                reccurence="FREQ=WEEKLY" if rng.random() < 0.05 else None,
+                created_at=due - timedelta(days=30),
+            ))
+        return self._chunks("task", make)
+
+    def task_histories(self) -> Iterator[List[TaskHistory]]:
+        def make(rng: random.Random, history_id: int) -> TaskHistory:
+            return construct_trusted(TaskHistory, dict(
+                id=history_id,
+                task_id=history_id,
+                change_type="Update",
+                previous_state={"status": "Not Started"},
+                new_state={"status": rng.choice(STATUSES), "priority": rng.randint(1, 5)},
+                created_at=EPOCH + timedelta(seconds=history_id),
+            ))
+        return self._chunks("taskhistory", make)
+
+    def ai_suggestions(self) -> Iterator[List[AISuggestion]]:
+        task_count = self.counts["task"]
+
+        def make(rng: random.Random, suggestion_id: int) -> AISuggestion:
+            return construct_trusted(AISuggestion, dict(
+                id=suggestion_id,
+                task_id=rng.randint(1, task_count),
+                name=_text(rng, 2),
+                content=_text(rng, 16),
+                confidence=rng.randint(0, 100),
+                implemented=rng.random() < 0.3,
+                created_at=EPOCH + timedelta(seconds=suggestion_id),
+            ))
+        return self._chunks("aisuggestion", make)
+
+async def load_dataset(generator: DatasetGenerator, chunk_size: Optional[int] = None) -> Dict[str, int]:
+    """
+    Inserts a generated dataset through the managers' bulk insert path.
+
+    Args:
+        generator (DatasetGenerator): The dataset to insert into empty tables.
+        chunk_size (Optional[int]): Rows per INSERT statement.
+
+    Returns:
+        Dict[str, int]: The number of rows inserted per table name.
+    """
+    from src.models.db_manager import GoalManager, TaskManager, TaskHistoryManager, AISuggestionManager
+    steps = (
+        ("goal", generator.goals, GoalManager().create_goals),
+        ("task", generator.tasks, TaskManager().create_tasks),
+        ("taskhistory", generator.task_histories, TaskHistoryManager().create_task_histories),
+        ("aisuggestion", generator.ai_suggestions, AISuggestionManager().create_AIsuggestions),
+    )
+    inserted = {}
+    for table, chunks, create_many in steps:
+        inserted[table] = 0
+        for chunk in chunks():
+            inserted[table] += len(await create_many(chunk, chunk_size=chunk_size))
+    return inserted
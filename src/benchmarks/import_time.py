@@ -0,0 +1,76 @@
+# Standard library imports
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# Modules whose import cost is tracked; tools that only need the models import the first.
+MODULES = ("src.models", "src.models.db_manager", "src.services.db_setup")
+# The async SQLite driver, which must only load once an engine is created.
+DRIVER_MODULE = "aiosqlite"
+
+def _python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parents[2],
+    )
+    return result.stdout + "\n" + result.stderr
+
+def import_microseconds(module: str) -> int:
+    """Returns the cumulative import time of ``module`` in a fresh interpreter, from ``-X importtime``."""
+    for line in _python(f"import {module}").splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if name == module:
+            return int(cumulative)
+    raise RuntimeError(f"No import time reported for {module}")
+
+def loaded_modules(module: str) -> List[str]:
+    """Returns the names of all modules loaded by importing ``module`` in a fresh interpreter."""
+    output = _python(f"import sys, json, {module}; print('MODULES=' + json.dumps(sorted(sys.modules)))")
+    line = next(line for line in output.splitlines() if line.startswith("MODULES="))
+    return json.loads(line[len("MODULES="):])
+
+def measure(modules: Sequence[str] = MODULES, runs: int = 5) -> Dict[str, Any]:
+    """
+    Measures the import time of each module over ``runs`` fresh interpreters.
+
+    Args:
+        modules (Sequence[str]): The modules to import.
+        runs (int): The number of interpreters per module.
+
+    Returns:
+        Dict[str, Any]: Median and min milliseconds per module, and whether the
+            import loaded the database driver or the managers.
+    """
+    results = {}
+    for module in modules:
+        timings = [import_microseconds(module) / 1000 for _ in range(runs)]
+        loaded = set(loaded_modules(module))
+        results[module] = {
+            "median_ms": round(statistics.median(timings), 2),
+            "min_ms": round(min(timings), 2),
+            "runs": runs,
+            "loads_driver": DRIVER_MODULE in loaded,
+            "loads_managers": "src.models.db_manager" in loaded,
+        }
+    return results
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: ``python -m src.benchmarks.import_time --output imports.json``."""
+    parser = argparse.ArgumentParser(description="Measure the import time of the SmartTasker modules.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=None, help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+    report = json.dumps(measure(runs=args.runs), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        args.output.write_text(report)
+
+if __name__ == "__main__":
+    main()
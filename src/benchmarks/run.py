@@ -0,0 +1,139 @@
+# Standard library imports
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# Local application imports
+from src.benchmarks.generator import DatasetGenerator, load_dataset, parse_size
+from src.benchmarks.workloads import WORKLOADS, BenchmarkContext, run_workloads
+
+ENGINES = ("memory", "file")
+
+async def run_benchmark(
+    task_count: int,
+    seed: int = 0,
+    operations: int = 1000,
+    concurrency: int = 8,
+    workloads: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Loads a generated dataset into the configured database and runs the workloads.
+
+    The database is the one configured for the process, see db_setup; it should be
+    empty.
+
+    Args:
+        task_count (int): The dataset size in tasks.
+        seed (int): The seed of the dataset and of the workloads' choices.
+        operations (int): The number of operations per workload.
+        concurrency (int): The number of workers of the concurrent workloads.
+        workloads (Optional[Sequence[str]]): The workloads to run; all by default.
+
+    Returns:
+        Dict[str, Any]: The run's rows, load time and per-workload results.
+    """
+    from src.services.db_setup import create_db_and_tables
+    await create_db_and_tables()
+    generator = DatasetGenerator(task_count, seed=seed)
+    started = time.perf_counter()
+    rows = await load_dataset(generator)
+    load_seconds = time.perf_counter() - started
+    ctx = BenchmarkContext(
+        task_count, generator.counts["goal"], operations=operations, concurrency=concurrency, seed=seed
+    )
+    return {
+        "rows": rows,
+        "load_seconds": round(load_seconds, 3),
+        "load_rows_per_second": round(sum(rows.values()) / load_seconds, 2),
+        "results": await run_workloads(ctx, workloads),
+    }
+
+def _run_isolated(engine: str, size: str, args: argparse.Namespace, directory: Path) -> Dict[str, Any]:
+    """
+    Runs one engine and size in a fresh interpreter, configured through the environment.
+
+    The engine itself is created lazily and could be switched in-process with
+    dispose_engine, but a fresh interpreter also resets the managers' caches, the
+    metrics registry and the memory footprint, so runs do not affect each other.
+    """
+    env = dict(os.environ)
+    if engine == "file":
+        database = directory / f"bench-{size}.sqlite3"
+        env["SMARTTASKER_DATABASE_URL"] = f"sqlite+aiosqlite:///{database}"
+    else:
+        env["SMARTTASKER_DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
+    if args.profile:
+        env["SMARTTASKER_DATABASE_PROFILE"] = args.profile
+    output = directory / f"run-{engine}-{size}.json"
+    command = [
+        sys.executable, "-m", "src.benchmarks", "--single",
+        "--sizes", size, "--seed", str(args.seed), "--operations", str(args.operations),
+        "--concurrency", str(args.concurrency), "--output", str(output),
+    ]
+    if args.workloads:
+        command += ["--workloads", *args.workloads]
+    subprocess.run(command, env=env, check=True)
+    run = json.loads(output.read_text())
+    run["engine"] = engine
+    return run
+
+def _environment() -> Dict[str, str]:
+    import sqlite3
+    import sqlalchemy
+    return {
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "sqlalchemy": sqlalchemy.__version__,
+        "platform": platform.platform(),
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: ``python -m src.benchmarks --sizes 10k 100k --output results.json``."""
+    parser = argparse.ArgumentParser(description="Benchmark the SmartTasker manager and service layers.")
+    parser.add_argument("--sizes", nargs="+", default=["10k"], help="dataset sizes: 10k, 100k, 1m or a task count")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--profile", default=None, help="database profile, see db_setup.PROFILES")
+    parser.add_argument("--workloads", nargs="+", choices=sorted(WORKLOADS), default=None)
+    parser.add_argument("--operations", type=int, default=1000, help="operations per workload")
+    parser.add_argument("--concurrency", type=int, default=8, help="workers of the concurrent workloads")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    for size in args.sizes:
+        parse_size(size)
+
+    if args.single:
+        # One size against the database configured by the environment.
+        from src.services.db_setup import get_database_url, get_profile_name
+        run = asyncio.run(run_benchmark(
+            parse_size(args.sizes[0]), args.seed, args.operations, args.concurrency, args.workloads
+        ))
+        run.update(size=args.sizes[0], profile=get_profile_name(), url=get_database_url())
+        args.output.write_text(json.dumps(run, indent=2))
+        return
+
+    report: Dict[str, Any] = {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "seed": args.seed,
+        "operations": args.operations,
+        "concurrency": args.concurrency,
+        "environment": _environment(),
+        "runs": [],
+    }
+    with tempfile.TemporaryDirectory(prefix="smarttasker-bench-") as directory:
+        for size in args.sizes:
+            for engine in args.engines:
+                print(f"Running {engine} engine with {size} tasks...", file=sys.stderr)
+                report["runs"].append(_run_isolated(engine, size, args, Path(directory)))
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {args.output}", file=sys.stderr)
@@ -0,0 +1,253 @@
+# Standard library imports
+import asyncio
+import math
+import random
+import time
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+# Local application imports
+from src.models.model import Goal, Task
+from src.benchmarks.generator import EPOCH, STATUSES, WORDS
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of already sorted values, e.g. ``fraction=0.99``."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """
+    Summarizes the per-operation latencies of one workload.
+
+    Args:
+        latencies (List[float]): Seconds taken by each operation.
+        elapsed (float): Wall-clock seconds of the whole workload; with concurrent
+            workers this is less than the sum of the latencies.
+
+    Returns:
+        Dict[str, float]: Operation count, throughput in operations per second, and
+            mean, p50, p99 and max latency in milliseconds.
+    """
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "operations": count,
+        "seconds": round(elapsed, 6),
+        "throughput": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(ordered) / count * 1000, 4) if count else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 4),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4) if count else 0.0,
+    }
+
+class BenchmarkContext:
+    """
+    What workloads know about the loaded dataset, and their shared random stream.
+
+    Attributes:
+        task_count (int): Ids ``1..task_count`` are generated tasks.
+        goal_count (int): Ids ``1..goal_count`` are generated goals.
+        operations (int): The number of operations each workload runs.
+        concurrency (int): The number of workers of the concurrent workloads.
+        rng (random.Random): Seeded, so runs pick the same ids in the same order.
+    """
+
+    def __init__(self, task_count: int, goal_count: int, operations: int = 1000, concurrency: int = 8, seed: int = 0):
+        self.task_count = task_count
+        self.goal_count = goal_count
+        self.operations = operations
+        self.concurrency = concurrency
+        self.rng = random.Random(seed)
+        # Ids of tasks created by the create workloads, deleted by the delete workloads.
+        self.created_task_ids: List[int] = []
+        self.service_task_ids: List[int] = []
+
+    def task_id(self) -> int:
+        return self.rng.randint(1, self.task_count)
+
+    def new_task(self) -> Task:
+        return Task(
+            name=f"Bench {self.rng.choice(WORDS)}",
+            description=" ".join(self.rng.choice(WORDS) for _ in range(12)),
+            goal_id=self.rng.randint(1, self.goal_count),
+            priority=self.rng.randint(1, 5),
+            status=self.rng.choice(STATUSES),
+            due_date=EPOCH + timedelta(days=self.rng.randrange(365)),
+        )
+
+    def filters(self) -> dict:
+        """Arguments of a typical filtered task query: one status over a 30 day window."""
+        start = EPOCH + timedelta(days=self.rng.randrange(335))
+        return {"status": self.rng.choice(STATUSES), "due_after": start, "due_before": start + timedelta(days=30), "limit": 100}
+
+async def measure(operation: Callable[[], Awaitable], count: int) -> Dict[str, float]:
+    """Runs ``operation`` ``count`` times in sequence and summarizes the latencies."""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(count):
+        before = time.perf_counter()
+        await operation()
+        latencies.append(time.perf_counter() - before)
+    return summarize(latencies, time.perf_counter() - started)
+
+async def measure_concurrent(operation: Callable[[], Awaitable], count: int, workers: int) -> Dict[str, float]:
+    """Runs ``operation`` ``count`` times spread over ``workers`` concurrent tasks."""
+    latencies: List[float] = []
+    remaining = [count]
+
+    async def _worker() -> None:
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            before = time.perf_counter()
+            await operation()
+            latencies.append(time.perf_counter() - before)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(workers)))
+    return summarize(latencies, time.perf_counter() - started)
+
+# Each workload runs ctx.operations operations against the loaded dataset.
+
+async def manager_create(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.models.db_manager import TaskManager
+    manager = TaskManager()
+
+    async def _create() -> None:
+        ctx.created_task_ids.append((await manager.create_task(ctx.new_task())).id)
+    return await measure(_create, ctx.operations)
+
+async def manager_get(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.models.db_manager import TaskManager
+    manager = TaskManager()
+    return await measure(lambda: manager.get_task(ctx.task_id()), ctx.operations)
+
+async def manager_update(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.models.db_manager import TaskManager
+    manager = TaskManager()
+    return await measure(lambda: manager.update_task_values(ctx.task_id(), priority=ctx.rng.randint(1, 5)), ctx.operations)
+
+async def manager_delete(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.models.db_manager import TaskManager
+    manager = TaskManager()
+    ids = ctx.created_task_ids
+    return await measure(lambda: manager.delete_task(ids.pop()), len(ids))
+
+async def manager_get_all_goals(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.models.db_manager import GoalManager
+    manager = GoalManager()
+    return await measure(manager.get_all_goals, max(1, ctx.operations // 100))
+
+async def manager_get_all_tasks(ctx: BenchmarkContext) -> Dict[str, float]:
+    # Loads the whole table per call, so it runs far fewer times than the other workloads.
+    from src.models.db_manager import TaskManager
+    manager = TaskManager()
+    return await measure(manager.get_all_tasks, max(1, ctx.operations // 500))
+
+async def manager_find_tasks(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.models.db_manager import TaskManager
+    manager = TaskManager()
+    return await measure(lambda: manager.find_tasks(**ctx.filters()), ctx.operations)
+
+async def manager_find_goal_tasks(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.models.db_manager import TaskManager
+    manager = TaskManager()
+    return await measure(
+        lambda: manager.find_tasks(goal_id=ctx.rng.randint(1, ctx.goal_count), status=ctx.rng.choice(STATUSES)),
+        ctx.operations,
+    )
+
+async def service_create(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.services.database_service import DatabaseService
+    from src.services.db_setup import get_engine
+    service = DatabaseService(get_engine())
+
+    async def _create() -> None:
+        ctx.service_task_ids.append((await service.create(ctx.new_task())).id)
+    return await measure(_create, ctx.operations)
+
+async def service_get(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.services.database_service import DatabaseService
+    from src.services.db_setup import get_engine
+    service = DatabaseService(get_engine())
+    return await measure(lambda: service.get(Task, ctx.task_id()), ctx.operations)
+
+async def service_update(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.services.database_service import DatabaseService
+    from src.services.db_setup import get_engine
+    service = DatabaseService(get_engine())
+    return await measure(lambda: service.update(Task, ctx.task_id(), priority=ctx.rng.randint(1, 5)), ctx.operations)
+
+async def service_delete(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.services.database_service import DatabaseService
+    from src.services.db_setup import get_engine
+    service = DatabaseService(get_engine())
+    ids = ctx.service_task_ids
+    return await measure(lambda: service.delete(Task, ids.pop()), len(ids))
+
+async def service_get_all_goals(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.services.database_service import DatabaseService
+    from src.services.db_setup import get_engine
+    service = DatabaseService(get_engine())
+    return await measure(lambda: service.get_all(Goal), max(1, ctx.operations // 100))
+
+async def concurrent_reads(ctx: BenchmarkContext) -> Dict[str, float]:
+    from src.models.db_manager import TaskManager
+    manager = TaskManager()
+    return await measure_concurrent(lambda: manager.get_task(ctx.task_id()), ctx.operations, ctx.concurrency)
+
+async def concurrent_mixed(ctx: BenchmarkContext) -> Dict[str, float]:
+    """A read-heavy mix: 70% gets, 15% filtered queries, 10% updates and 5% creates."""
+    from src.models.db_manager import TaskManager
+    manager = TaskManager()
+
+    def _operation() -> Awaitable:
+        roll = ctx.rng.random()
+        if roll < 0.70:
+            return manager.get_task(ctx.task_id())
+        if roll < 0.85:
+            return manager.find_tasks(**ctx.filters())
+        if roll < 0.95:
+            return manager.update_task_values(ctx.task_id(), priority=ctx.rng.randint(1, 5))
+        return manager.create_task(ctx.new_task())
+    return await measure_concurrent(_operation, ctx.operations, ctx.concurrency)
+
+# Workloads in run order; the delete workloads remove the rows their create workloads added.
+WORKLOADS: Dict[str, Callable[[BenchmarkContext], Awaitable[Dict[str, float]]]] = {
+    "manager_create": manager_create,
+    "manager_get": manager_get,
+    "manager_update": manager_update,
+    "manager_delete": manager_delete,
+    "manager_get_all_goals": manager_get_all_goals,
+    "manager_get_all_tasks": manager_get_all_tasks,
+    "manager_find_tasks": manager_find_tasks,
+    "manager_find_goal_tasks": manager_find_goal_tasks,
+    "service_create": service_create,
+    "service_get": service_get,
+    "service_update": service_update,
+    "service_delete": service_delete,
+    "service_get_all_goals": service_get_all_goals,
+    "concurrent_reads": concurrent_reads,
+    "concurrent_mixed": concurrent_mixed,
+}
+
+async def run_workloads(ctx: BenchmarkContext, names: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the named workloads, all of them by default, in WORKLOADS order.
+
+    Args:
+        ctx (BenchmarkContext): The loaded dataset.
+        names (Optional[Sequence[str]]): The workloads to run.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The summary of each workload, see summarize.
+    """
+    unknown = set(names or ()) - set(WORKLOADS)
+    if unknown:
+        raise ValueError(f"Unknown workload(s): {', '.join(sorted(unknown))}")
+    results = {}
+    for name, workload in WORKLOADS.items():
+        if names is None or name in names:
+            results[name] = await workload(ctx)
+    return results
@@ -1,5 +1,4 @@
-from .model import Goal, Task, TaskHistory, AISuggestion, TaskNotification, Feedback
-from .db_manager import GoalManager
+from .model import Goal, Task, TaskHistory, AISuggestion, TaskNotification, Feedback, GoalStats, GoalProgress
 
 __all__ = [
     'Goal', 
@@ -8,5 +7,14 @@ __all__ = [
     'AISuggestion',
     'TaskNotification',
     'Feedback',
+    'GoalStats',
+    'GoalProgress',
     'GoalManager'
 ]
+
+def __getattr__(name):
+    # The managers import the engine setup, so they are only loaded when first used.
+    if name == "GoalManager":
+        from .db_manager import GoalManager
+        return GoalManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,217 +1,1313 @@
 # Standard library imports
 from datetime import datetime
-from typing import Optional, List, TypeVar, Generic
+from typing import Optional, List, Dict, Tuple, Any, TypeVar, Generic, Callable, Coroutine, Iterator, Sequence, AsyncIterator, Union
 import logging
 
 # Third-party imports
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select
+from sqlmodel import select, insert, update, delete, or_
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.orm import selectinload, joinedload
 
 # Local application imports
-from src.models.model import Goal, Task, TaskHistory, AISuggestion, TaskNotification, Feedback
-from src.services.db_setup import get_engine
+from src.models.model import Goal, Task, TaskHistory, AISuggestion, TaskNotification, Feedback, GoalProgress, TASK_SYSTEM_COLUMNS
+from src.services.db_setup import get_engine, get_reader_engine
+from src.services.pagination import keyset_select, keyset_position, parse_order_by
+from src.services.unit_of_work import current_session, on_transaction_end
+from src.services.cache import LRUCache
+from src.services.columns import check_columns, column_names
+from src.services.history_writer import to_json_state
+from src.services.goal_stats import (
+    GOAL_STATS_TASK_COLUMNS, add_goal_stats_delta, apply_goal_stats, rebuild_goal_stats, compute_progress
+)
+from src.services.unit_of_work import unit_of_work
+from src.services.recurrence import OccurrenceCache, series_end
+from src.services.search import SearchResult, search
+from src.services.archive import ARCHIVE_TABLES, get_archived
+from src.services.history_state import CHECKPOINT, UPDATE, changes_since_checkpoint, state_at
+from src.services.metrics import acquire_connection, instrument
+from src.services.projection import resolve_fields, select_columns, to_records
+from src.services.write_pipeline import WritePipeline
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# TaskHistory storage modes of TaskManager, see its docstring.
+HISTORY_MODES = ("full", "delta")
+# Task columns that Task.series_end is computed from.
+SERIES_END_TASK_COLUMNS = ("reccurence", "due_date")
+
 T = TypeVar('T')
+R = TypeVar('R')
+
+def _chunked(items: Sequence, size: int) -> Iterator[Sequence]:
+    """Yield successive slices of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _load_options(model: type, load: Optional[List[str]]) -> list:
+    """Build eager-loading options for relationship paths such as ``"tasks.task_history"``.
+
+    Collections are loaded with one extra SELECT ... IN query per level and
+    many-to-one or one-to-one relationships are joined into the parent query, so the
+    number of queries does not grow with the number of parents.
+    """
+    options = []
+    for path in load or []:
+        option = None
+        current = model
+        for name in path.split("."):
+            relationship = current.__mapper__.relationships.get(name)
+            if relationship is None:
+                raise ValueError(f"Unknown relationship '{name}' on {current.__name__}")
+            attribute = getattr(current, name)
+            if option is None:
+                option = selectinload(attribute) if relationship.uselist else joinedload(attribute)
+            else:
+                option = option.selectinload(attribute) if relationship.uselist else option.joinedload(attribute)
+            current = relationship.mapper.class_
+        options.append(option)
+    return options
 
 class BaseManager(Generic[T]):
     """Base class for managing database operations."""
 
-    def __init__(self, engine):
-        """Initialize the BaseManager with the database engine."""
+    # Default number of rows sent per statement by the bulk writers.
+    bulk_chunk_size: int = 500
+    # Default number of rows fetched per page by iter_all.
+    iter_batch_size: int = 500
+
+    # Read-through caches for get(), keyed by model class and shared by all managers.
+    _caches: Dict[type, LRUCache] = {}
+    # Single-writer pipeline for writes outside a unit of work, if enabled.
+    _write_pipeline: Optional[WritePipeline] = None
+
+    def __init__(self, engine, reader_engine=None):
+        """Initialize the BaseManager with the database engine, and an engine for reads if they use another one."""
         self._engine = engine
+        self._reader_engine = reader_engine if reader_engine is not None else engine
+
+    @classmethod
+    def enable_cache(cls, model: type, max_entries: int = 1024, ttl: Optional[float] = 60.0, max_bytes: Optional[int] = None) -> LRUCache:
+        """Enable a read-through LRU cache for get() on ``model``.
+
+        Cached objects are detached instances shared between callers, so they should
+        be treated as read-only. Writes through any manager invalidate their entries.
+        """
+        cache = LRUCache(max_entries=max_entries, ttl=ttl, max_bytes=max_bytes)
+        BaseManager._caches[model] = cache
+        return cache
+
+    @classmethod
+    def disable_cache(cls, model: type) -> None:
+        """Disable and drop the cache for ``model``."""
+        BaseManager._caches.pop(model, None)
+
+    @classmethod
+    def cache_stats(cls, model: type) -> Optional[Dict[str, float]]:
+        """Return the hit/miss counters of the cache for ``model``, if enabled."""
+        cache = BaseManager._caches.get(model)
+        return cache.stats() if cache else None
+
+    @classmethod
+    def use_write_pipeline(cls, pipeline: Optional[WritePipeline]) -> None:
+        """Route every write outside a unit of work through ``pipeline``; None turns it off.
+
+        Writes of managers on a different engine than the pipeline's keep their own
+        transactions. The caller owns the pipeline and stops it.
+        """
+        BaseManager._write_pipeline = pipeline
+
+    @classmethod
+    def invalidate_cached(cls, model: type, item_ids) -> None:
+        """Drop cached entries for the given ids of ``model``, e.g. after writing them through DatabaseService."""
+        cache = BaseManager._caches.get(model)
+        if cache is not None:
+            for item_id in item_ids:
+                cache.invalidate(item_id)
 
+    def _invalidate(self, model: type, item_ids) -> None:
+        """Drop cached entries for the given ids of ``model`` once the write is committed.
+
+        Inside a unit of work the old rows stay committed until it ends, and a read
+        outside it could cache them again, so the entries are dropped when its
+        transaction commits or rolls back instead of now.
+        """
+        session = current_session()
+        if session is None:
+            self._drop_cached(model, item_ids)
+        else:
+            item_ids = list(item_ids)
+            on_transaction_end(session, lambda: self._drop_cached(model, item_ids))
+
+    def _drop_cached(self, model: type, item_ids) -> None:
+        """Drop cached entries for the given ids of ``model`` now."""
+        BaseManager.invalidate_cached(model, item_ids)
+
+    def _kept_values(self, model: type, columns) -> Dict[str, Any]:
+        """Extra SET values of an UPDATE of only ``columns``, e.g. to keep a column as it is."""
+        return {}
+
+    async def _execute_read(self, func: Callable[..., Coroutine[Any, Any, R]], *args, **kwargs) -> R:
+        """Run ``func(session, ...)`` on the active unit-of-work session or a new reader session."""
+        session = current_session()
+        if session is not None:
+            return await func(session, *args, **kwargs)
+        async with AsyncSession(self._reader_engine) as session:
+            await acquire_connection(session)
+            return await func(session, *args, **kwargs)
+
+    async def _execute_write(self, func: Callable[..., Coroutine[Any, Any, R]], *args, **kwargs) -> R:
+        """Run ``func(session, ...)`` in a transaction and commit it.
+
+        Inside a unit of work the changes are only flushed and the unit of work
+        commits them. Otherwise a new session is used and committed once; objects
+        are not expired on commit, so no refresh round trip is needed afterwards.
+        With a write pipeline enabled, the write is queued and group-committed.
+        """
+        session = current_session()
+        if session is not None:
+            result = await func(session, *args, **kwargs)
+            await session.flush()
+            return result
+        pipeline = BaseManager._write_pipeline
+        if pipeline is not None and pipeline.engine is self._engine:
+            return await pipeline.submit(func, *args, **kwargs)
+        async with AsyncSession(self._engine, expire_on_commit=False) as session:
+            try:
+                await acquire_connection(session)
+                result = await func(session, *args, **kwargs)
+                await session.commit()
+                return result
+            except BaseException:
+                await session.rollback()
+                raise
+
+    @instrument
     async def create(self, item: T) -> T:  
         """Create a new item in the database."""
-        try:
-            async with AsyncSession(self._engine) as session:
+        async def _create_internal(session: AsyncSession, item: T) -> T:
+            if "created_at" in column_names(type(item)):
                 item.created_at = datetime.now()
-                session.add(item)
-                await session.commit()
-                await session.refresh(item)
-                return item
+            session.add(item)
+            await session.flush()
+            return item
+        try:
+            return await self._execute_write(_create_internal, item)
         except IntegrityError as e:
-            await session.rollback()
             raise ValueError(f"Integrity error: {e}")
         except SQLAlchemyError as e:
-            await session.rollback()
             raise SQLAlchemyError(f"Failed to create item: {str(e)}")
 
-    async def get(self, item_id: int, model: T) -> Optional[T]:
-        """Retrieve an item from the database."""
+    @instrument
+    async def get(self, item_id: int, model: T, load: Optional[List[str]] = None) -> Optional[T]:
+        """Retrieve an item from the database.
+
+        ``load`` lists relationship paths to eager-load, e.g. ``["tasks.task_history"]``.
+        Ids moved to the archive tables are read from there, as detached items
+        without their relationships.
+        """
+        async def _get_internal(session: AsyncSession, item_id: int, model: T) -> Optional[T]:
+            item = await session.get(model, item_id, options=options)
+            if item is None and model in ARCHIVE_TABLES:
+                item = await get_archived(session, model, item_id)
+            return item
+
+        options = _load_options(model, load)
+        # Reads inside a unit of work must see its pending changes, so they bypass the cache.
+        # Eager-loaded lookups bypass it too, as cached items may lack the relationships.
+        cache = BaseManager._caches.get(model) if current_session() is None and not load else None
+        if cache is not None:
+            item = cache.get(item_id)
+            if item is not None:
+                return item
+            # A write invalidating the id while the read runs makes the put below a no-op.
+            version = cache.version
         try:
-            async with AsyncSession(self._engine) as session:
-                return await session.get(model, item_id)
+            item = await self._execute_read(_get_internal, item_id, model)
         except SQLAlchemyError as e:
             raise SQLAlchemyError(f"Failed to retrieve item: {str(e)}")
+        if cache is not None and item is not None:
+            cache.put(item_id, item, version=version)
+        return item
+
+    @instrument
+    async def get_all(self, model: T, load: Optional[List[str]] = None) -> List[T]:
+        """Retrieve all items from the database, eager-loading the ``load`` relationship paths."""
+        async def _get_all_internal(session: AsyncSession, model: T) -> List[T]:
+            return list(await session.exec(select(model).options(*options)))
+
+        options = _load_options(model, load)
+        try:
+            return await self._execute_read(_get_all_internal, model)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to retrieve items: {str(e)}")
+
+    @instrument
+    async def get_many(self, item_ids: List[int], model: T, load: Optional[List[str]] = None) -> List[T]:
+        """Retrieve the items with the given ids, eager-loading the ``load`` relationship paths."""
+        async def _get_many_internal(session: AsyncSession) -> List[T]:
+            items: List[T] = []
+            for chunk in _chunked(item_ids, self.bulk_chunk_size):
+                stmt = select(model).where(model.id.in_(chunk)).options(*options).order_by(model.id)
+                items.extend(await session.exec(stmt))
+            return items
+
+        options = _load_options(model, load)
+        try:
+            return await self._execute_read(_get_many_internal)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to retrieve items: {str(e)}")
+
+    @instrument
+    async def iter_all(self, model: T, batch_size: Optional[int] = None, order_by: Optional[str] = None) -> AsyncIterator[T]:
+        """Stream all items of a model using keyset pagination.
 
-    async def get_all(self, model: T) -> List[T]:
-        """Retrieve all items from the database."""
+        Each page is fetched in its own short session, so memory stays bounded by
+        ``batch_size`` regardless of table size. ``order_by`` is a column name,
+        prefixed with ``-`` for descending order; ties are broken by primary key.
+        """
+        async def _get_page_internal(session: AsyncSession, after) -> List[T]:
+            stmt = keyset_select(model, order_by=order_by, after=after, limit=batch_size)
+            return (await session.exec(stmt)).all()
+
+        batch_size = batch_size or self.iter_batch_size
+        after = None
+        while True:
+            try:
+                page = await self._execute_read(_get_page_internal, after)
+            except SQLAlchemyError as e:
+                raise SQLAlchemyError(f"Failed to retrieve items: {str(e)}")
+            for item in page:
+                yield item
+            if len(page) < batch_size:
+                return
+            after = keyset_position(page[-1], order_by)
+
+    @instrument
+    async def get_page(self, model: T, after_id: Optional[int] = None, limit: int = 100) -> List[T]:
+        """Retrieve up to ``limit`` items with a primary key greater than ``after_id``."""
+        async def _get_page_internal(session: AsyncSession) -> List[T]:
+            after = (after_id, after_id) if after_id is not None else None
+            return list(await session.exec(keyset_select(model, after=after, limit=limit)))
         try:
-            async with AsyncSession(self._engine) as session:
-                return list(await session.exec(select(model)))
+            return await self._execute_read(_get_page_internal)
         except SQLAlchemyError as e:
             raise SQLAlchemyError(f"Failed to retrieve items: {str(e)}")
 
+    @instrument
+    async def list_rows(
+        self,
+        model: T,
+        fields: Optional[Sequence[str]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple]:
+        """Retrieve only the ``fields`` columns of every item, as read-only records.
+
+        Records are named tuples built straight from the result rows, without model
+        instances or identity-map tracking; see src.services.projection. ``fields``
+        defaults to the model's list columns.
+        """
+        fields = resolve_fields(model, fields)
+        stmt = select(*select_columns(model, fields))
+        if order_by is not None:
+            column, descending = parse_order_by(model, order_by)
+            stmt = stmt.order_by(column.desc() if descending else column, model.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return await self._list_records(model, fields, stmt)
+
+    async def _list_records(self, model: T, fields: Tuple[str, ...], stmt) -> List[Tuple]:
+        """Run a projection SELECT of ``fields`` and build its records."""
+        async def _list_records_internal(session: AsyncSession) -> List[Tuple]:
+            result = await session.exec(stmt)
+            # A single-column select yields scalars rather than rows.
+            rows = ((value,) for value in result) if len(fields) == 1 else result
+            return to_records(model, fields, rows)
+        try:
+            return await self._execute_read(_list_records_internal)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to retrieve items: {str(e)}")
+
+    async def _search(self, model: T, query: str, limit: int, **filters) -> List[SearchResult]:
+        """Run a ranked full-text search on the model's FTS5 index."""
+        try:
+            return await self._execute_read(search, model, query, limit, **filters)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to search items: {str(e)}")
+
+    @instrument
     async def update(self, item_id: int, model: T, **kwargs) -> Optional[T]:
-        """Update an existing item in the database."""
-        try:
-            async with AsyncSession(self._engine) as session:
-                item = await session.get(model, item_id)
-
-                if item:
-                    for key, value in kwargs.items():
-                        if hasattr(item, key):
-                            setattr(item, key, value)
-                    session.add(item)
-                    await session.commit()
-                    await session.refresh(item)
-                    return item
-                return None
-        except SQLAlchemyError as e:
-            await session.rollback()
+        """Update an existing item with a single UPDATE ... RETURNING statement."""
+        async def _update_internal(session: AsyncSession) -> Optional[T]:
+            stmt = update(model).where(model.id == item_id).values(**kwargs, **self._kept_values(model, kwargs)).returning(model)
+            return (await session.exec(stmt)).scalars().one_or_none()
+
+        check_columns(model, kwargs)
+        if not kwargs:
+            return await self.get(item_id, model)
+        try:
+            return await self._execute_write(_update_internal)
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {e}")
+        except SQLAlchemyError as e:
             raise SQLAlchemyError(f"Failed to update item: {str(e)}")
+        finally:
+            # Invalidate after the commit so a concurrent read cannot re-cache the old row.
+            self._invalidate(model, [item_id])
 
-    async def delete(self, item_id: int, model: T) -> bool:
-        """Delete an item from the database."""
+    @instrument
+    async def update_values(self, item_id: int, model: T, **kwargs) -> bool:
+        """Update an existing item without loading it; return whether it existed."""
+        async def _update_values_internal(session: AsyncSession) -> bool:
+            stmt = (
+                update(model)
+                .where(model.id == item_id)
+                .values(**kwargs, **self._kept_values(model, kwargs))
+                .execution_options(synchronize_session=False)
+            )
+            return (await session.exec(stmt)).rowcount > 0
+
+        check_columns(model, kwargs)
+        if not kwargs:
+            raise ValueError("No fields to update")
         try:
-            async with AsyncSession(self._engine) as session:
-                item = await session.get(model, item_id)
+            return await self._execute_write(_update_values_internal)
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {e}")
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to update item: {str(e)}")
+        finally:
+            self._invalidate(model, [item_id])
 
-                if item:
-                    await session.delete(item)
-                    await session.commit()
-                    return True
-                return False
+    @instrument
+    async def delete(self, item_id: int, model: T) -> bool:
+        """Delete an item with a single DELETE ... RETURNING statement."""
+        async def _delete_internal(session: AsyncSession) -> bool:
+            stmt = delete(model).where(model.id == item_id).returning(model.id)
+            return (await session.exec(stmt)).first() is not None
+        try:
+            return await self._execute_write(_delete_internal)
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {e}")
         except SQLAlchemyError as e:
-            await session.rollback()
             raise SQLAlchemyError(f"Failed to delete item: {str(e)}")
+        finally:
+            self._invalidate(model, [item_id])
+
+    @instrument
+    async def create_many(self, items: List[T], chunk_size: Optional[int] = None) -> List[int]:
+        """Insert many items in one transaction and return their generated ids.
+
+        Rows are sent as executemany-style INSERT ... RETURNING statements of at most
+        ``chunk_size`` rows. The generated ids are assigned back to the given items,
+        which are not refreshed from the database. ``created_at`` is stamped on items
+        that do not already carry one.
+        """
+        async def _create_many_internal(session: AsyncSession) -> List[int]:
+            ids: List[int] = []
+            for chunk in _chunked(items, chunk_size):
+                rows = []
+                for item in chunk:
+                    if stamp_created_at and item.created_at is None:
+                        item.created_at = created_at
+                    row = item.model_dump()
+                    if row.get("id") is None:
+                        row.pop("id", None)
+                    rows.append(row)
+                stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+                result = await session.exec(stmt, params=rows)
+                ids.extend(result.scalars().all())
+            return ids
+
+        if not items:
+            return []
+        model = type(items[0])
+        chunk_size = chunk_size or self.bulk_chunk_size
+        created_at = datetime.now()
+        stamp_created_at = "created_at" in column_names(model)
+        try:
+            ids = await self._execute_write(_create_many_internal)
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {e}")
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to create items: {str(e)}")
+        for item, item_id in zip(items, ids):
+            item.id = item_id
+        return ids
+
+    @instrument
+    async def update_many(self, item_ids: List[int], model: T, chunk_size: Optional[int] = None, **kwargs) -> int:
+        """Apply the same field values to many items in one transaction.
+
+        Issues one set-based UPDATE per chunk of ids and returns the number of rows updated.
+        """
+        async def _update_many_internal(session: AsyncSession) -> int:
+            updated = 0
+            for chunk in _chunked(item_ids, chunk_size):
+                stmt = (
+                    update(model)
+                    .where(model.id.in_(chunk))
+                    .values(**kwargs, **self._kept_values(model, kwargs))
+                    .execution_options(synchronize_session=False)
+                )
+                result = await session.exec(stmt)
+                updated += result.rowcount
+            return updated
+
+        check_columns(model, kwargs)
+        if not item_ids or not kwargs:
+            return 0
+        chunk_size = chunk_size or self.bulk_chunk_size
+        try:
+            return await self._execute_write(_update_many_internal)
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {e}")
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to update items: {str(e)}")
+        finally:
+            self._invalidate(model, item_ids)
+
+    @instrument
+    async def update_rows(self, model: T, rows: List[Dict[str, Any]], chunk_size: Optional[int] = None) -> int:
+        """Apply different field values to many items in one transaction.
+
+        Each row holds the item's ``id`` and its new values. Rows are sent as one
+        executemany UPDATE by primary key per chunk; returns the number of rows given.
+        """
+        async def _update_rows_internal(session: AsyncSession) -> int:
+            stmt = update(model).values(**self._kept_values(model, {key for row in rows for key in row} - {"id"}))
+            for chunk in _chunked(rows, chunk_size):
+                await session.exec(stmt, params=list(chunk))
+            return len(rows)
+
+        for row in rows:
+            if row.get("id") is None:
+                raise ValueError("Every row needs an id")
+            check_columns(model, row)
+        if not rows:
+            return 0
+        chunk_size = chunk_size or self.bulk_chunk_size
+        try:
+            return await self._execute_write(_update_rows_internal)
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {e}")
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to update items: {str(e)}")
+        finally:
+            self._invalidate(model, [row["id"] for row in rows])
+
+    @instrument
+    async def delete_many(self, item_ids: List[int], model: T, chunk_size: Optional[int] = None) -> int:
+        """Delete many items in one transaction and return the number of rows deleted."""
+        async def _delete_many_internal(session: AsyncSession) -> int:
+            deleted = 0
+            for chunk in _chunked(item_ids, chunk_size):
+                stmt = (
+                    delete(model)
+                    .where(model.id.in_(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+                result = await session.exec(stmt)
+                deleted += result.rowcount
+            return deleted
+
+        if not item_ids:
+            return 0
+        chunk_size = chunk_size or self.bulk_chunk_size
+        try:
+            return await self._execute_write(_delete_many_internal)
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {e}")
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to delete items: {str(e)}")
+        finally:
+            self._invalidate(model, item_ids)
 
 class GoalManager(BaseManager[Goal]):
     """Manages database operations for Goal entities."""
 
     def __init__(self):
-        super().__init__(get_engine())
+        super().__init__(get_engine(), get_reader_engine())
     
     async def create_goal(self, goal: Goal) -> Goal:
         return await self.create(goal)
         
-    async def get_goal(self, goal_id: int) -> Optional[Goal]:
-        return await self.get(goal_id, Goal)
+    async def get_goal(self, goal_id: int, load: Optional[List[str]] = None) -> Optional[Goal]:
+        return await self.get(goal_id, Goal, load=load)
         
-    async def get_all_goals(self) -> List[Goal]:
-        return await self.get_all(Goal)
+    async def get_all_goals(self, load: Optional[List[str]] = None) -> List[Goal]:
+        return await self.get_all(Goal, load=load)
+
+    async def get_goal_with_tasks(self, goal_id: int) -> Optional[Goal]:
+        return await self.get(goal_id, Goal, load=["tasks"])
+
+    def iter_all_goals(self, batch_size: Optional[int] = None, order_by: Optional[str] = None) -> AsyncIterator[Goal]:
+        return self.iter_all(Goal, batch_size=batch_size, order_by=order_by)
+
+    async def get_goals_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[Goal]:
+        return await self.get_page(Goal, after_id=after_id, limit=limit)
+
+    async def list_goals(self, fields: Optional[Sequence[str]] = None, order_by: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple]:
+        return await self.list_rows(Goal, fields=fields, order_by=order_by, limit=limit)
         
     async def update_goal(self, goal_id: int, **kwargs) -> Optional[Goal]:
         return await self.update(goal_id, Goal, **kwargs)
+
+    async def update_goal_values(self, goal_id: int, **kwargs) -> bool:
+        return await self.update_values(goal_id, Goal, **kwargs)
         
     async def delete_goal(self, goal_id: int) -> bool:
         return await self.delete(goal_id, Goal)
 
+    async def create_goals(self, goals: List[Goal], chunk_size: Optional[int] = None) -> List[int]:
+        return await self.create_many(goals, chunk_size=chunk_size)
+
+    async def update_goals(self, goal_ids: List[int], chunk_size: Optional[int] = None, **kwargs) -> int:
+        return await self.update_many(goal_ids, Goal, chunk_size=chunk_size, **kwargs)
+
+    async def delete_goals(self, goal_ids: List[int], chunk_size: Optional[int] = None) -> int:
+        return await self.delete_many(goal_ids, Goal, chunk_size=chunk_size)
+
+    @instrument
+    async def search(self, query: str, limit: int = 20) -> List[SearchResult]:
+        """Full-text search over goal names and descriptions, best bm25 match first."""
+        return await self._search(Goal, query, limit)
+
+    @instrument
+    async def get_progress(self, goal_id: int, use_summary: bool = False) -> Optional[GoalProgress]:
+        """Return task counts by status, total duration and overdue count for a goal.
+
+        With ``use_summary`` the counts are read from the goal_stats table, which is
+        only accurate while TaskManager.maintain_goal_stats is enabled.
+        """
+        progress = await self._compute_progress(goal_id, use_summary)
+        return progress[0] if progress else None
+
+    @instrument
+    async def get_all_progress(self, use_summary: bool = False) -> List[GoalProgress]:
+        """Return the progress of every goal, ordered by goal id."""
+        return await self._compute_progress(None, use_summary)
+
+    @instrument
+    async def rebuild_goal_stats(self) -> int:
+        """Recompute the goal_stats summary table from the task table."""
+        try:
+            return await self._execute_write(rebuild_goal_stats)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to rebuild goal stats: {str(e)}")
+
+    async def _compute_progress(self, goal_id: Optional[int], use_summary: bool) -> List[GoalProgress]:
+        try:
+            return await self._execute_read(compute_progress, goal_id=goal_id, use_summary=use_summary)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to compute goal progress: {str(e)}")
+
 class TaskManager(BaseManager[Task]):
-    """Manages database operations for Task entities."""
+    """Manages database operations for Task entities.
+
+    When a TaskHistoryWriter is given, update_task and delete_task record the
+    changed fields as TaskHistory entries. Inside a unit of work the entries are
+    written in its transaction; otherwise they are queued on the writer.
+
+    With ``history_mode="full"`` an update entry holds the previous and new values
+    of the changed fields. With ``history_mode="delta"`` it holds the new values
+    only; created tasks get a full checkpoint entry, and another one is written
+    every ``checkpoint_interval`` updates, so TaskHistoryManager.state_at can
+    rebuild any past state from the nearest checkpoint.
+
+    When ``maintain_goal_stats`` is enabled, the task write methods of this class
+    also apply per-goal deltas to the goal_stats table in the same transaction.
+    Call GoalManager.rebuild_goal_stats once after enabling it on existing data.
+
+    The task write methods also keep Task.series_end, which get_occurrences uses
+    to skip recurring series that ended before its window.
+    """
+
+    # Whether task writes keep the goal_stats summary table up to date.
+    maintain_goal_stats: bool = False
+    # Expanded occurrences of recurring tasks, shared by all task managers.
+    occurrence_cache: OccurrenceCache = OccurrenceCache()
     
-    def __init__(self):
-        super().__init__(get_engine())
+    def __init__(self, history_writer=None, history_mode: str = "full", checkpoint_interval: int = 50):
+        super().__init__(get_engine(), get_reader_engine())
+        if history_mode not in HISTORY_MODES:
+            raise ValueError(f"Invalid history mode. Must be one of: {HISTORY_MODES}")
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1")
+        self._history_writer = history_writer
+        self.history_mode = history_mode
+        self.checkpoint_interval = checkpoint_interval
+
+    @property
+    def _records_checkpoints(self) -> bool:
+        return self._history_writer is not None and self.history_mode == "delta"
 
+    @instrument
     async def create_task(self, task: Task) -> Task:
-        return await self.create(task)
+        task.series_end = series_end(task.reccurence, task.due_date)
+        if not self.maintain_goal_stats and not self._records_checkpoints:
+            return await self.create(task)
+        async with unit_of_work(self._engine):
+            created = await self.create(task)
+            if self.maintain_goal_stats:
+                await self._apply_goal_stats(added=[created.model_dump()])
+            await self._record_checkpoints([created])
+        return created
         
-    async def get_task(self, task_id: int) -> Optional[Task]:
-        return await self.get(task_id, Task)
+    async def get_task(self, task_id: int, load: Optional[List[str]] = None) -> Optional[Task]:
+        return await self.get(task_id, Task, load=load)
         
-    async def get_all_tasks(self) -> List[Task]:
-        return await self.get_all(Task)
+    async def get_all_tasks(self, load: Optional[List[str]] = None) -> List[Task]:
+        return await self.get_all(Task, load=load)
+
+    async def get_tasks_with_history(self, task_ids: List[int]) -> List[Task]:
+        return await self.get_many(task_ids, Task, load=["task_history"])
+
+    def iter_all_tasks(self, batch_size: Optional[int] = None, order_by: Optional[str] = None) -> AsyncIterator[Task]:
+        return self.iter_all(Task, batch_size=batch_size, order_by=order_by)
+
+    async def get_tasks_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[Task]:
+        return await self.get_page(Task, after_id=after_id, limit=limit)
         
+    def _find_tasks_statement(
+        self,
+        status: Optional[Union[str, List[str]]] = None,
+        goal_id: Optional[int] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        priority_max: Optional[int] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence] = None,
+    ):
+        """Build the SELECT used by find_tasks, or of only ``columns`` for list_tasks."""
+        stmt = select(*columns) if columns is not None else select(Task)
+        if status is not None:
+            if isinstance(status, str):
+                stmt = stmt.where(Task.status == status)
+            else:
+                stmt = stmt.where(Task.status.in_(status))
+        if goal_id is not None:
+            stmt = stmt.where(Task.goal_id == goal_id)
+        if due_after is not None:
+            stmt = stmt.where(Task.due_date >= due_after)
+        if due_before is not None:
+            stmt = stmt.where(Task.due_date < due_before)
+        if priority_max is not None:
+            stmt = stmt.where(Task.priority <= priority_max)
+        if order_by is not None:
+            column, descending = parse_order_by(Task, order_by)
+            stmt = stmt.order_by(column.desc() if descending else column, Task.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    @instrument
+    async def find_tasks(
+        self,
+        status: Optional[Union[str, List[str]]] = None,
+        goal_id: Optional[int] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        priority_max: Optional[int] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Task]:
+        """Find tasks matching all given filters with a single SQL statement.
+
+        ``status`` may be one status or a list of statuses. The due date range is
+        half-open: ``due_after <= due_date < due_before``. ``order_by`` is a column
+        name, prefixed with ``-`` for descending order.
+        """
+        stmt = self._find_tasks_statement(
+            status=status,
+            goal_id=goal_id,
+            due_before=due_before,
+            due_after=due_after,
+            priority_max=priority_max,
+            order_by=order_by,
+            limit=limit,
+        )
+        async def _find_tasks_internal(session: AsyncSession) -> List[Task]:
+            return list(await session.exec(stmt))
+        try:
+            return await self._execute_read(_find_tasks_internal)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to retrieve items: {str(e)}")
+
+    @instrument
+    async def list_tasks(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        status: Optional[Union[str, List[str]]] = None,
+        goal_id: Optional[int] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        priority_max: Optional[int] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple]:
+        """Find tasks like find_tasks, reading only the ``fields`` columns.
+
+        Returns read-only named tuples instead of Task instances, for list views
+        that do not need full models; ``fields`` defaults to id, name, status and
+        due_date. Filters and ordering may use columns that are not in ``fields``.
+        """
+        fields = resolve_fields(Task, fields)
+        stmt = self._find_tasks_statement(
+            status=status,
+            goal_id=goal_id,
+            due_before=due_before,
+            due_after=due_after,
+            priority_max=priority_max,
+            order_by=order_by,
+            limit=limit,
+            columns=select_columns(Task, fields),
+        )
+        return await self._list_records(Task, fields, stmt)
+
+    @instrument
+    async def get_occurrences(self, window_start: datetime, window_end: datetime) -> List[Tuple[Task, datetime]]:
+        """Return ``(task, due time)`` pairs for every occurrence in ``[window_start, window_end)``.
+
+        One-off tasks occur at their due date. Recurring tasks start their series at
+        their due date and are expanded lazily for the window only, through the
+        occurrence cache; a rule that cannot be parsed is treated as a one-off task.
+        Series whose series_end is before the window are not read.
+        """
+        one_off = select(Task).where(
+            Task.reccurence.is_(None), Task.due_date >= window_start, Task.due_date < window_end
+        )
+        recurring = select(Task).where(Task.reccurence.is_not(None), Task.due_date < window_end)
+        # Two statements rather than an OR, so that each is a range of ix_task_recurring_series_end.
+        unbounded = recurring.where(Task.series_end.is_(None))
+        running = recurring.where(Task.series_end >= window_start)
+        async def _get_occurrences_internal(session: AsyncSession) -> Tuple[List[Task], List[Task]]:
+            recurring_tasks = list(await session.exec(unbounded)) + list(await session.exec(running))
+            return list(await session.exec(one_off)), recurring_tasks
+        try:
+            one_off_tasks, recurring_tasks = await self._execute_read(_get_occurrences_internal)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to retrieve items: {str(e)}")
+
+        occurrences = [(task, task.due_date) for task in one_off_tasks]
+        for task in recurring_tasks:
+            try:
+                due_times = self.occurrence_cache.occurrences(
+                    task.id, task.reccurence, task.due_date, window_start, window_end
+                )
+            except ValueError as e:
+                logger.warning(f"Ignoring recurrence of task {task.id}: {e}")
+                due_times = (task.due_date,) if task.due_date >= window_start else ()
+            occurrences.extend((task, due_time) for due_time in due_times)
+        occurrences.sort(key=lambda occurrence: (occurrence[1], occurrence[0].id))
+        return occurrences
+
+    @instrument
+    async def search(self, query: str, limit: int = 20, goal_id: Optional[int] = None) -> List[SearchResult]:
+        """Full-text search over task names and descriptions, best bm25 match first."""
+        return await self._search(Task, query, limit, goal_id=goal_id)
+
+    @instrument
     async def update_task(self, task_id: int, **kwargs) -> Optional[Task]:
-        return await self.update(task_id, Task, **kwargs)
+        if not set(kwargs) & set(SERIES_END_TASK_COLUMNS):
+            return await self._update_task(task_id, **kwargs)
+        async with unit_of_work(self._engine):
+            task = await self._update_task(task_id, **kwargs)
+            ends = await self._refresh_series_ends([task_id])
+        if task is not None and task_id in ends:
+            task.series_end = ends[task_id]
+        return task
+
+    async def _update_task(self, task_id: int, **kwargs) -> Optional[Task]:
+        if self._history_writer is None and not self.maintain_goal_stats:
+            return await self.update(task_id, Task, **kwargs)
+
+        async def _update_task_internal(session: AsyncSession) -> Tuple[Optional[Task], List[TaskHistory]]:
+            tracked = list(kwargs)
+            if self.maintain_goal_stats:
+                tracked += [key for key in GOAL_STATS_TASK_COLUMNS if key not in kwargs]
+            if self._records_checkpoints:
+                # Taken before the table is read, so a batch written meanwhile is counted twice, not missed.
+                queued = self._history_writer.queued_change_types(task_id)
+                since_checkpoint = await changes_since_checkpoint(session, task_id, queued)
+                if since_checkpoint is None:
+                    # No checkpoint yet: the whole row is needed to start the chain.
+                    tracked = [column.key for column in Task.__table__.columns]
+            columns = [getattr(Task, key) for key in tracked]
+            previous = (await session.exec(select(Task.id, *columns).where(Task.id == task_id))).first()
+            if previous is None:
+                return None, []
+            stmt = update(Task).where(Task.id == task_id).values(**kwargs, **self._kept_values(Task, kwargs)).returning(Task)
+            task = (await session.exec(stmt)).scalars().one()
+            previous_state = dict(zip(tracked, previous[1:]))
+            if self.maintain_goal_stats:
+                await self._apply_goal_stats([previous_state], [task.model_dump()], session)
+            changed = [key for key in kwargs if previous_state[key] != getattr(task, key)]
+            if self._history_writer is None or not changed:
+                return task, []
+            if self._records_checkpoints:
+                return task, self._delta_entries(task, previous_state, changed, since_checkpoint)
+            return task, [TaskHistory(
+                task_id=task_id,
+                change_type="Update",
+                previous_state=to_json_state({key: previous_state[key] for key in changed}),
+                new_state=to_json_state({key: getattr(task, key) for key in changed}),
+            )]
+
+        check_columns(Task, kwargs)
+        if not kwargs:
+            return await self.get_task(task_id)
+        try:
+            return await self._write_with_history(_update_task_internal)
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {e}")
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to update item: {str(e)}")
+        finally:
+            self._invalidate(Task, [task_id])
+
+    async def update_task_values(self, task_id: int, **kwargs) -> bool:
+        derived = self.maintain_goal_stats or self._history_writer is not None or set(kwargs) & set(SERIES_END_TASK_COLUMNS)
+        if kwargs and derived:
+            # goal_stats, history and series_end need the row after the change, so take the update_task path.
+            return await self.update_task(task_id, **kwargs) is not None
+        return await self.update_values(task_id, Task, **kwargs)
         
+    @instrument
     async def delete_task(self, task_id: int) -> bool:
-        return await self.delete(task_id, Task)
+        if self._history_writer is None and not self.maintain_goal_stats:
+            return await self.delete(task_id, Task)
+
+        async def _delete_task_internal(session: AsyncSession) -> Tuple[bool, List[TaskHistory]]:
+            stmt = delete(Task).where(Task.id == task_id).returning(*Task.__table__.columns)
+            previous = (await session.exec(stmt)).mappings().first()
+            if previous is None:
+                return False, []
+            if self.maintain_goal_stats:
+                await self._apply_goal_stats(removed=[previous], session=session)
+            if self._history_writer is None:
+                return True, []
+            # The task row is gone, so the entry cannot reference it; its id is kept in the state.
+            return True, [TaskHistory(
+                task_id=None,
+                change_type="Delete",
+                previous_state=to_json_state(dict(previous)),
+            )]
+
+        try:
+            return await self._write_with_history(_delete_task_internal)
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {e}")
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to delete item: {str(e)}")
+        finally:
+            self._invalidate(Task, [task_id])
+
+    @instrument
+    async def create_tasks(self, tasks: List[Task], chunk_size: Optional[int] = None) -> List[int]:
+        for task in tasks:
+            task.series_end = series_end(task.reccurence, task.due_date)
+        if not self.maintain_goal_stats and not self._records_checkpoints:
+            return await self.create_many(tasks, chunk_size=chunk_size)
+        async with unit_of_work(self._engine):
+            ids = await self.create_many(tasks, chunk_size=chunk_size)
+            if self.maintain_goal_stats:
+                await self._apply_goal_stats(added=[task.model_dump() for task in tasks])
+            await self._record_checkpoints(tasks, chunk_size=chunk_size)
+        return ids
+
+    @instrument
+    async def update_tasks(self, task_ids: List[int], chunk_size: Optional[int] = None, **kwargs) -> int:
+        goal_stats = self.maintain_goal_stats and bool(set(kwargs) & set(GOAL_STATS_TASK_COLUMNS))
+        series = bool(set(kwargs) & set(SERIES_END_TASK_COLUMNS))
+        if not goal_stats and not series:
+            return await self.update_many(task_ids, Task, chunk_size=chunk_size, **kwargs)
+        async with unit_of_work(self._engine):
+            previous = await self._goal_stats_rows(task_ids) if goal_stats else []
+            updated = await self.update_many(task_ids, Task, chunk_size=chunk_size, **kwargs)
+            if goal_stats:
+                await self._apply_goal_stats(removed=previous, added=[{**row, **kwargs} for row in previous])
+            if series:
+                await self._refresh_series_ends(task_ids)
+        return updated
+
+    @instrument
+    async def update_task_rows(self, rows: List[Dict[str, Any]], chunk_size: Optional[int] = None) -> int:
+        columns = {key for row in rows for key in row}
+        goal_stats = self.maintain_goal_stats and bool(columns & set(GOAL_STATS_TASK_COLUMNS))
+        series = bool(columns & set(SERIES_END_TASK_COLUMNS))
+        if not goal_stats and not series:
+            return await self.update_rows(Task, rows, chunk_size=chunk_size)
+        task_ids = [row["id"] for row in rows]
+        async with unit_of_work(self._engine):
+            previous = await self._goal_stats_rows(task_ids) if goal_stats else []
+            updated = await self.update_rows(Task, rows, chunk_size=chunk_size)
+            if goal_stats:
+                values = {row["id"]: row for row in rows}
+                await self._apply_goal_stats(removed=previous, added=[{**row, **values[row["id"]]} for row in previous])
+            if series:
+                await self._refresh_series_ends(task_ids)
+        return updated
+
+    @instrument
+    async def get_scheduling_rows(self) -> List[Dict[str, Any]]:
+        """Read the scheduling columns of every task that is not completed."""
+        columns = [
+            Task.id, Task.priority, Task.due_date, Task.duration_seconds,
+            Task.is_time_fixed, Task.start_date, Task.suggested_start_time,
+        ]
+        stmt = select(*columns).where(or_(Task.status.is_(None), Task.status != "Completed"))
+        async def _get_scheduling_rows_internal(session: AsyncSession) -> List[Dict[str, Any]]:
+            return [dict(row._mapping) for row in await session.exec(stmt)]
+        try:
+            return await self._execute_read(_get_scheduling_rows_internal)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to retrieve items: {str(e)}")
+
+    @instrument
+    async def delete_tasks(self, task_ids: List[int], chunk_size: Optional[int] = None) -> int:
+        if not self.maintain_goal_stats:
+            return await self.delete_many(task_ids, Task, chunk_size=chunk_size)
+        async with unit_of_work(self._engine):
+            previous = await self._goal_stats_rows(task_ids)
+            deleted = await self.delete_many(task_ids, Task, chunk_size=chunk_size)
+            await self._apply_goal_stats(removed=previous)
+        return deleted
+
+    def _drop_cached(self, model: type, item_ids) -> None:
+        """Drop cached entries and expanded occurrences for the given task ids."""
+        super()._drop_cached(model, item_ids)
+        for item_id in item_ids:
+            self.occurrence_cache.invalidate(item_id)
+
+    def _kept_values(self, model: type, columns) -> Dict[str, Any]:
+        """Keep updated_at when only TASK_SYSTEM_COLUMNS change, so TaskAnalytics does not re-read the rows."""
+        if model is Task and columns and set(columns) <= TASK_SYSTEM_COLUMNS:
+            return {"updated_at": Task.updated_at}
+        return {}
+
+    async def _goal_stats_rows(self, task_ids: List[int]) -> List[dict]:
+        """Read the goal stats columns of the given tasks."""
+        async def _goal_stats_rows_internal(session: AsyncSession) -> List[dict]:
+            rows = []
+            columns = [Task.id, *[getattr(Task, key) for key in GOAL_STATS_TASK_COLUMNS]]
+            for chunk in _chunked(task_ids, self.bulk_chunk_size):
+                result = await session.exec(select(*columns).where(Task.id.in_(chunk)))
+                rows.extend(dict(row._mapping) for row in result)
+            return rows
+        return await self._execute_read(_goal_stats_rows_internal)
+
+    async def _refresh_series_ends(self, task_ids: Sequence[int]) -> Dict[int, Optional[datetime]]:
+        """Recompute series_end of the given tasks; return the changed values by task id."""
+        async def _refresh_series_ends_internal(session: AsyncSession) -> Dict[int, Optional[datetime]]:
+            ends = {}
+            columns = [Task.id, Task.reccurence, Task.due_date, Task.series_end]
+            for chunk in _chunked(task_ids, self.bulk_chunk_size):
+                for task_id, rule_text, due_date, previous in await session.exec(select(*columns).where(Task.id.in_(chunk))):
+                    end = series_end(rule_text, due_date)
+                    if end != previous:
+                        ends[task_id] = end
+            rows = [{"id": task_id, "series_end": end} for task_id, end in ends.items()]
+            stmt = update(Task).values(**self._kept_values(Task, ["series_end"]))
+            for chunk in _chunked(rows, self.bulk_chunk_size):
+                await session.exec(stmt, params=list(chunk))
+            return ends
+        ends = await self._execute_write(_refresh_series_ends_internal)
+        self._invalidate(Task, list(ends))
+        return ends
+
+    async def _apply_goal_stats(self, removed: Sequence = (), added: Sequence = (), session: Optional[AsyncSession] = None) -> None:
+        """Apply the goal_stats deltas for removed and added task states."""
+        deltas: Dict[int, Dict[str, int]] = {}
+        for task in removed:
+            add_goal_stats_delta(deltas, task, -1)
+        for task in added:
+            add_goal_stats_delta(deltas, task, 1)
+        if session is not None:
+            await apply_goal_stats(session, deltas)
+        else:
+            await self._execute_write(apply_goal_stats, deltas)
+
+    async def _record_checkpoints(self, tasks: List[Task], chunk_size: Optional[int] = None) -> None:
+        """Write a checkpoint of each created task in delta history mode."""
+        if not self._records_checkpoints or not tasks:
+            return
+        await self.create_many([
+            TaskHistory(
+                task_id=task.id,
+                change_type=CHECKPOINT,
+                new_state=to_json_state(task.model_dump()),
+                created_at=task.created_at,
+            )
+            for task in tasks
+        ], chunk_size=chunk_size)
+
+    def _delta_entries(self, task: Task, previous_state: Dict[str, Any], changed: List[str], since_checkpoint: Optional[int]) -> List[TaskHistory]:
+        """Build the delta-mode entries of one update, adding checkpoints where due."""
+        entries = []
+        if since_checkpoint is None:
+            # Tasks created before delta mode start their chain with the state before this change.
+            entries.append(TaskHistory(task_id=task.id, change_type=CHECKPOINT, new_state=to_json_state(previous_state)))
+            since_checkpoint = 0
+        entries.append(TaskHistory(
+            task_id=task.id,
+            change_type=UPDATE,
+            new_state=to_json_state({key: getattr(task, key) for key in changed}),
+        ))
+        if since_checkpoint + 1 >= self.checkpoint_interval:
+            entries.append(TaskHistory(task_id=task.id, change_type=CHECKPOINT, new_state=to_json_state(task.model_dump())))
+        return entries
+
+    async def _write_with_history(self, func: Callable[[AsyncSession], Coroutine[Any, Any, Tuple[R, List[TaskHistory]]]]) -> R:
+        """Run a write returning ``(result, history entries)`` and record the entries.
+
+        Inside a unit of work the entries join its transaction; otherwise they are
+        queued on the history writer once the write has committed. A stopped writer
+        is refused before writing; if it stops while the write runs, the committed
+        write still succeeds and its entries are logged and dropped.
+        """
+        writer = self._history_writer
+        if writer is not None and writer.stopped and current_session() is None:
+            raise RuntimeError("TaskHistoryWriter is stopped")
+
+        async def _internal(session: AsyncSession) -> Tuple[R, List[TaskHistory]]:
+            result, entries = await func(session)
+            changed_at = datetime.now()
+            for entry in entries:
+                entry.created_at = changed_at
+            if session is current_session():
+                session.add_all(entries)
+                return result, []
+            return result, entries
+
+        result, entries = await self._execute_write(_internal)
+        for entry in entries:
+            try:
+                await writer.record(entry)
+            except RuntimeError as e:
+                logger.error(f"Dropped {entry.change_type} history of task {entry.task_id}: {e}")
+        return result
     
 class TaskHistoryManager(BaseManager[TaskHistory]):
     """Manages database operations for TaskHistory entities."""
 
     def __init__(self):
-        super().__init__(get_engine())
+        super().__init__(get_engine(), get_reader_engine())
 
     async def create_task_history(self, task_history: TaskHistory) -> TaskHistory:
         return await self.create(task_history)
     
-    async def get_task_history(self, task_history_id: int) -> Optional[TaskHistory]:
-        return await self.get(task_history_id, TaskHistory)
+    async def get_task_history(self, task_history_id: int, load: Optional[List[str]] = None) -> Optional[TaskHistory]:
+        return await self.get(task_history_id, TaskHistory, load=load)
     
-    async def get_all_task_histories(self) -> List[TaskHistory]:
-        return await self.get_all(TaskHistory)
+    async def get_all_task_histories(self, load: Optional[List[str]] = None) -> List[TaskHistory]:
+        return await self.get_all(TaskHistory, load=load)
+
+    def iter_all_task_histories(self, batch_size: Optional[int] = None, order_by: Optional[str] = None) -> AsyncIterator[TaskHistory]:
+        return self.iter_all(TaskHistory, batch_size=batch_size, order_by=order_by)
+
+    async def get_task_histories_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[TaskHistory]:
+        return await self.get_page(TaskHistory, after_id=after_id, limit=limit)
     
     async def update_task_history(self, task_history_id: int, **kwargs) -> Optional[TaskHistory]:
         return await self.update(task_history_id, TaskHistory, **kwargs)
+
+    async def update_task_history_values(self, task_history_id: int, **kwargs) -> bool:
+        return await self.update_values(task_history_id, TaskHistory, **kwargs)
     
     async def delete_task_history(self, task_history_id: int) -> bool:
         return await self.delete(task_history_id, TaskHistory)
+
+    @instrument
+    async def state_at(self, task_id: int, timestamp: datetime) -> Optional[Dict[str, Any]]:
+        """Rebuild a task's state at ``timestamp`` from its nearest earlier checkpoint.
+
+        Needs history recorded in delta mode; returns None when no checkpoint precedes
+        ``timestamp``. Dates in the state are ISO 8601 strings.
+        """
+        try:
+            return await self._execute_read(state_at, task_id, timestamp)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to retrieve item: {str(e)}")
+
+    async def create_task_histories(self, task_histories: List[TaskHistory], chunk_size: Optional[int] = None) -> List[int]:
+        return await self.create_many(task_histories, chunk_size=chunk_size)
+
+    async def update_task_histories(self, task_history_ids: List[int], chunk_size: Optional[int] = None, **kwargs) -> int:
+        return await self.update_many(task_history_ids, TaskHistory, chunk_size=chunk_size, **kwargs)
+
+    async def delete_task_histories(self, task_history_ids: List[int], chunk_size: Optional[int] = None) -> int:
+        return await self.delete_many(task_history_ids, TaskHistory, chunk_size=chunk_size)
     
 class AISuggestionManager(BaseManager[AISuggestion]):
     """Manages database operations for AISuggestion entities."""
 
     def __init__(self):
-        super().__init__(get_engine())
+        super().__init__(get_engine(), get_reader_engine())
 
     async def create_AIsuggestion(self, AIsuggestion: AISuggestion) -> AISuggestion:
         return await self.create(AIsuggestion)
     
-    async def get_AIsuggestion(self, AIsuggestion_id: int) -> Optional[AISuggestion]:
-        return await self.get(AIsuggestion_id, AISuggestion)
+    async def get_AIsuggestion(self, AIsuggestion_id: int, load: Optional[List[str]] = None) -> Optional[AISuggestion]:
+        return await self.get(AIsuggestion_id, AISuggestion, load=load)
     
-    async def get_all_AIsuggestions(self) -> List[AISuggestion]:
-        return await self.get_all(AISuggestion)
+    async def get_all_AIsuggestions(self, load: Optional[List[str]] = None) -> List[AISuggestion]:
+        return await self.get_all(AISuggestion, load=load)
+
+    def iter_all_AIsuggestions(self, batch_size: Optional[int] = None, order_by: Optional[str] = None) -> AsyncIterator[AISuggestion]:
+        return self.iter_all(AISuggestion, batch_size=batch_size, order_by=order_by)
+
+    async def get_AIsuggestions_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[AISuggestion]:
+        return await self.get_page(AISuggestion, after_id=after_id, limit=limit)
     
     async def update_AIsuggestion(self, AIsuggestion_id: int, **kwargs) -> Optional[AISuggestion]:
         return await self.update(AIsuggestion_id, AISuggestion, **kwargs)
+
+    async def update_AIsuggestion_values(self, AIsuggestion_id: int, **kwargs) -> bool:
+        return await self.update_values(AIsuggestion_id, AISuggestion, **kwargs)
     
     async def delete_AIsuggestion(self, AIsuggestion_id: int) -> bool:
         return await self.delete(AIsuggestion_id, AISuggestion)
+
+    async def create_AIsuggestions(self, AIsuggestions: List[AISuggestion], chunk_size: Optional[int] = None) -> List[int]:
+        return await self.create_many(AIsuggestions, chunk_size=chunk_size)
+
+    async def update_AIsuggestions(self, AIsuggestion_ids: List[int], chunk_size: Optional[int] = None, **kwargs) -> int:
+        return await self.update_many(AIsuggestion_ids, AISuggestion, chunk_size=chunk_size, **kwargs)
+
+    async def delete_AIsuggestions(self, AIsuggestion_ids: List[int], chunk_size: Optional[int] = None) -> int:
+        return await self.delete_many(AIsuggestion_ids, AISuggestion, chunk_size=chunk_size)
     
 class TaskNotificationManager(BaseManager[TaskNotification]):
-    """Manages database operations for TaskNotification entities."""
+    """Manages database operations for TaskNotification entities.
 
-    def __init__(self):
-        super().__init__(get_engine())
+    When a NotificationDispatcher is given, notifications created, changed or
+    deleted through this manager are passed to it, so it never rescans the table.
+    """
+
+    def __init__(self, dispatcher=None):
+        super().__init__(get_engine(), get_reader_engine())
+        self._dispatcher = dispatcher
 
     async def create_task_notification(self, task_notification: TaskNotification) -> TaskNotification:
-        return await self.create(task_notification)
+        created = await self.create(task_notification)
+        if self._dispatcher is not None:
+            self._dispatcher.schedule(created)
+        return created
     
-    async def get_task_notification(self, task_notification_id: int) -> Optional[TaskNotification]:
-        return await self.get(task_notification_id, TaskNotification)
+    async def get_task_notification(self, task_notification_id: int, load: Optional[List[str]] = None) -> Optional[TaskNotification]:
+        return await self.get(task_notification_id, TaskNotification, load=load)
     
-    async def get_all_task_notifications(self) -> List[TaskNotification]:
-        return await self.get_all(TaskNotification)
+    async def get_all_task_notifications(self, load: Optional[List[str]] = None) -> List[TaskNotification]:
+        return await self.get_all(TaskNotification, load=load)
+
+    @instrument
+    async def get_unsent_task_notifications(self) -> List[TaskNotification]:
+        """Return the unsent notifications ordered by due time, through the partial index."""
+        stmt = (
+            select(TaskNotification)
+            .where(TaskNotification.sent_at.is_(None))
+            .order_by(TaskNotification.notify_at, TaskNotification.id)
+        )
+        async def _get_unsent_internal(session: AsyncSession) -> List[TaskNotification]:
+            return list(await session.exec(stmt))
+        try:
+            return await self._execute_read(_get_unsent_internal)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"Failed to retrieve items: {str(e)}")
+
+    def iter_all_task_notifications(self, batch_size: Optional[int] = None, order_by: Optional[str] = None) -> AsyncIterator[TaskNotification]:
+        return self.iter_all(TaskNotification, batch_size=batch_size, order_by=order_by)
+
+    async def get_task_notifications_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[TaskNotification]:
+        return await self.get_page(TaskNotification, after_id=after_id, limit=limit)
     
     async def update_task_notification(self, task_notification_id: int, **kwargs) -> Optional[TaskNotification]:
-        return await self.update(task_notification_id, TaskNotification, **kwargs)
+        updated = await self.update(task_notification_id, TaskNotification, **kwargs)
+        if self._dispatcher is not None and updated is not None:
+            self._dispatcher.schedule(updated)
+        return updated
+
+    async def update_task_notification_values(self, task_notification_id: int, **kwargs) -> bool:
+        if self._dispatcher is not None:
+            # The dispatcher needs the updated row, so take the returning path.
+            return await self.update_task_notification(task_notification_id, **kwargs) is not None
+        return await self.update_values(task_notification_id, TaskNotification, **kwargs)
     
     async def delete_task_notfication(self, task_notification_id: int) -> bool:
-        return await self.delete(task_notification_id, TaskNotification)
+        deleted = await self.delete(task_notification_id, TaskNotification)
+        if self._dispatcher is not None:
+            self._dispatcher.cancel(task_notification_id)
+        return deleted
+
+    async def create_task_notifications(self, task_notifications: List[TaskNotification], chunk_size: Optional[int] = None) -> List[int]:
+        ids = await self.create_many(task_notifications, chunk_size=chunk_size)
+        if self._dispatcher is not None:
+            for task_notification in task_notifications:
+                self._dispatcher.schedule(task_notification)
+        return ids
+
+    async def update_task_notifications(self, task_notification_ids: List[int], chunk_size: Optional[int] = None, **kwargs) -> int:
+        updated = await self.update_many(task_notification_ids, TaskNotification, chunk_size=chunk_size, **kwargs)
+        await self._reschedule(task_notification_ids)
+        return updated
+
+    @instrument
+    async def update_task_notification_rows(self, rows: List[Dict[str, Any]], chunk_size: Optional[int] = None) -> int:
+        return await self.update_rows(TaskNotification, rows, chunk_size=chunk_size)
+
+    async def delete_task_notifications(self, task_notification_ids: List[int], chunk_size: Optional[int] = None) -> int:
+        deleted = await self.delete_many(task_notification_ids, TaskNotification, chunk_size=chunk_size)
+        if self._dispatcher is not None:
+            for task_notification_id in task_notification_ids:
+                self._dispatcher.cancel(task_notification_id)
+        return deleted
+
+    async def _reschedule(self, task_notification_ids: List[int]) -> None:
+        """Pass the current rows of bulk-updated notifications to the dispatcher."""
+        if self._dispatcher is None:
+            return
+        for task_notification in await self.get_many(task_notification_ids, TaskNotification):
+            self._dispatcher.schedule(task_notification)
     
 class FeedbackManager(BaseManager[Feedback]):
     """Manages database operations for Feedback entities."""
 
     def __init__(self):
-        super().__init__(get_engine())
+        super().__init__(get_engine(), get_reader_engine())
 
     async def create_feedback(self, feedback: Feedback) -> Feedback:
         return await self.create(feedback)
     
-    async def get_feedback(self, feedback_id: int) -> Optional[Feedback]:
-        return await self.get(feedback_id, Feedback)
+    async def get_feedback(self, feedback_id: int, load: Optional[List[str]] = None) -> Optional[Feedback]:
+        return await self.get(feedback_id, Feedback, load=load)
     
-    async def get_all_feedbacks(self) -> List[Feedback]:
-        return await self.get_all(Feedback)
+    async def get_all_feedbacks(self, load: Optional[List[str]] = None) -> List[Feedback]:
+        return await self.get_all(Feedback, load=load)
+
+    def iter_all_feedbacks(self, batch_size: Optional[int] = None, order_by: Optional[str] = None) -> AsyncIterator[Feedback]:
+        return self.iter_all(Feedback, batch_size=batch_size, order_by=order_by)
+
+    async def get_feedbacks_page(self, after_id: Optional[int] = None, limit: int = 100) -> List[Feedback]:
+        return await self.get_page(Feedback, after_id=after_id, limit=limit)
     
     async def update_feedback(self, feedback_id: int, **kwargs) -> Optional[Feedback]:
         return await self.update(feedback_id, Feedback, **kwargs)
+
+    async def update_feedback_values(self, feedback_id: int, **kwargs) -> bool:
+        return await self.update_values(feedback_id, Feedback, **kwargs)
     
     async def delete_feedback(self, feedback_id: int) -> bool:
-        return await self.delete(feedback_id, Feedback)
\ No newline at end of file
+        return await self.delete(feedback_id, Feedback)
+
+    async def create_feedbacks(self, feedbacks: List[Feedback], chunk_size: Optional[int] = None) -> List[int]:
+        return await self.create_many(feedbacks, chunk_size=chunk_size)
+
+    async def update_feedbacks(self, feedback_ids: List[int], chunk_size: Optional[int] = None, **kwargs) -> int:
+        return await self.update_many(feedback_ids, Feedback, chunk_size=chunk_size, **kwargs)
+
+    async def delete_feedbacks(self, feedback_ids: List[int], chunk_size: Optional[int] = None) -> int:
+        return await self.delete_many(feedback_ids, Feedback, chunk_size=chunk_size)
\ No newline at end of file
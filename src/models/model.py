@@ -1,8 +1,39 @@
 from datetime import date, datetime, timedelta
 from typing import Optional, Dict, List
-from sqlmodel import Field, SQLModel, Relationship, JSON, Column
+from sqlmodel import Field, SQLModel, Relationship, JSON, Column, Index, text
 from pydantic import model_validator
 
+# Statuses a Goal or Task may have.
+VALID_STATUSES = frozenset({"Not Started", "In Progress", "Completed", None})
+_INVALID_STATUS = "Invalid status. Must be one of: Not Started, In Progress, Completed or None"
+# Task columns the application computes or suggests rather than the user sets;
+# an UPDATE of only these leaves Task.updated_at as it is.
+TASK_SYSTEM_COLUMNS = frozenset({"suggested_start_time", "series_end"})
+
+def goal_errors(data) -> List[str]:
+    """Returns the problems that make ``data`` an invalid Goal; the checks of Goal.validate_goal."""
+    errors = []
+    name = data.get("name")
+    if not name or not name.strip():
+        errors.append("Goal name cannot be empty")
+    if data.get("status") not in VALID_STATUSES:
+        errors.append(_INVALID_STATUS)
+    start_date = data.get("start_date")
+    end_date = data.get("end_date")
+    if start_date and end_date and start_date > end_date:
+        errors.append("Start date cannot be after end date")
+    return errors
+
+def task_errors(data) -> List[str]:
+    """Returns the problems that make ``data`` an invalid Task; the checks of Task.validate_task."""
+    errors = []
+    name = data.get("name")
+    if not name or not name.strip():
+        errors.append("Task name cannot be empty")
+    if data.get("status") not in VALID_STATUSES:
+        errors.append(_INVALID_STATUS)
+    return errors
+
 class Goal(SQLModel, table=True):
     """
     Represents a goal in the task management system.
@@ -18,26 +49,31 @@ class Goal(SQLModel, table=True):
 
     @model_validator(mode="before")
     def validate_goal(cls, data):
-        name = data.get("name")
-        if not name or len(name.strip()) == 0:
-            raise ValueError("Goal name cannot be empty")
-
-        status = data.get("status")
-        valid_statuses = {"Not Started", "In Progress", "Completed", None}
-        if status not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {valid_statuses}")
-
-        start_date = data.get("start_date")
-        end_date = data.get("end_date")
-
-        if start_date and end_date and start_date > end_date:
-            raise ValueError("Start date cannot be after end date")
+        errors = goal_errors(data)
+        if errors:
+            raise ValueError(errors[0])
         return data
 
 
 class Task(SQLModel, table=True):
+    __table_args__ = (
+        # Composite indexes backing TaskManager.find_tasks and the dashboard queries.
+        Index("ix_task_status_due_date", "status", "due_date"),
+        Index("ix_task_goal_id_status", "goal_id", "status"),
+        Index("ix_task_priority_due_date", "priority", "due_date"),
+        # Occurrence window index for TaskManager.get_occurrences: one-off tasks by
+        # due date, and recurring tasks by the due date their series starts from.
+        Index("ix_task_due_date", "due_date"),
+        Index("ix_task_recurring_due_date", "due_date", sqlite_where=text("reccurence IS NOT NULL")),
+        Index("ix_task_recurring_series_end", "series_end", sqlite_where=text("reccurence IS NOT NULL")),
+        # Rows changed since a point in time, for TaskAnalytics.refresh.
+        Index("ix_task_updated_at", "updated_at"),
+        # Ids of archived rows must never be handed out again; see services/archive.py.
+        {"sqlite_autoincrement": True},
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    goal_id: Optional[int] = Field(default=None, foreign_key="goal.id")  # Foreign key is essential
+    goal_id: Optional[int] = Field(default=None, foreign_key="goal.id", ondelete="SET NULL")  # Foreign key is essential
     goal: Optional[Goal] = Relationship(back_populates="tasks")
     name: str
     description: str
@@ -49,23 +85,23 @@ class Task(SQLModel, table=True):
     duration_seconds: Optional[int] = Field(default=None)
     is_time_fixed: Optional[bool] = Field(default=False)
     reccurence: Optional[str] = Field(default=None)
+    # Last occurrence of a bounded recurring series, kept by TaskManager from
+    # reccurence and due_date; NULL for unbounded series and rows it did not write.
+    series_end: Optional[datetime] = Field(default=None)
     ai_generated: Optional[bool] = Field(default=False)
     created_at: Optional[datetime] = Field(default=None)
-    updated_at: Optional[datetime] = Field(default=None)
+    # Set by every UPDATE of the row, including the managers' bulk updates, except
+    # the TaskManager updates of TASK_SYSTEM_COLUMNS only.
+    updated_at: Optional[datetime] = Field(default=None, sa_column_kwargs={"onupdate": datetime.now})
     ai_suggestion: Optional["AISuggestion"] = Relationship(back_populates="task")
     task_notification: Optional["TaskNotification"] = Relationship(back_populates="task")
     task_history: List["TaskHistory"] = Relationship(back_populates="task")
 
     @model_validator(mode="before")
     def validate_task(cls, data):
-        name = data.get("name")
-        if not name or len(name.strip()) == 0:
-            raise ValueError("Task name cannot be empty")
-
-        status = data.get("status")
-        valid_statuses = {"Not Started", "In Progress", "Completed", None}
-        if status not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {valid_statuses}")
+        errors = task_errors(data)
+        if errors:
+            raise ValueError(errors[0])
         return data
 
     @property
@@ -80,8 +116,14 @@ class Task(SQLModel, table=True):
 
 
 class TaskHistory(SQLModel, table=True):  
+    __table_args__ = (
+        # A task's history in time order, for checkpoint lookups and TaskHistoryManager.state_at.
+        Index("ix_taskhistory_task_id_created_at", "task_id", "created_at"),
+        {"sqlite_autoincrement": True},
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    task_id: Optional[int] = Field(default=None, foreign_key="task.id")  # Foreign key
+    task_id: Optional[int] = Field(default=None, foreign_key="task.id", ondelete="SET NULL")  # Foreign key
     task: Task = Relationship(back_populates="task_history")
     change_type: str = Field()
     previous_state: Optional[Dict] = Field(default=None, sa_column=Column(JSON))
@@ -90,8 +132,10 @@ class TaskHistory(SQLModel, table=True):
 
 
 class AISuggestion(SQLModel, table=True):
+    __table_args__ = {"sqlite_autoincrement": True}
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    task_id: Optional[int] = Field(default=None, foreign_key="task.id")  # Foreign key
+    task_id: Optional[int] = Field(default=None, foreign_key="task.id", ondelete="SET NULL", index=True)  # Foreign key
     task: Optional[Task] = Relationship(back_populates="ai_suggestion")
     name: str = Field()
     content: str = Field()
@@ -102,19 +146,59 @@ class AISuggestion(SQLModel, table=True):
 
 
 class TaskNotification(SQLModel, table=True):
+    __table_args__ = (
+        # Unsent notifications by due time, for seeding the NotificationDispatcher.
+        Index("ix_tasknotification_unsent_notify_at", "notify_at", sqlite_where=text("sent_at IS NULL")),
+        {"sqlite_autoincrement": True},
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    task_id: Optional[int] = Field(default=None, foreign_key="task.id")  # Foreign key
+    task_id: Optional[int] = Field(default=None, foreign_key="task.id", ondelete="SET NULL", index=True)  # Foreign key
     task: Task = Relationship(back_populates="task_notification")
     name: str = Field()
     message: str = Field()
+    notify_at: Optional[datetime] = Field(default=None)  # When to send; None sends as soon as possible
     sent_at: Optional[datetime] = Field(default=None)
     read_at: Optional[datetime] = Field(default=None)
 
 
 class Feedback(SQLModel, table=True):
+    __table_args__ = {"sqlite_autoincrement": True}
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    ai_suggestion_id: Optional[int] = Field(default=None, foreign_key="aisuggestion.id") # Foreign key
+    ai_suggestion_id: Optional[int] = Field(default=None, foreign_key="aisuggestion.id", ondelete="SET NULL", index=True) # Foreign key
     ai_suggestion: AISuggestion = Relationship(back_populates="feedback")
     feedback_type: Optional[bool] = Field(default=None)
     comment: Optional[str] = Field(default=None)
-    created_at: Optional[datetime] = Field(default=None)
\ No newline at end of file
+    created_at: Optional[datetime] = Field(default=None)
+
+
+class GoalStats(SQLModel, table=True):
+    """
+    Per-goal task totals, kept up to date by TaskManager when goal stats tracking is enabled.
+    """
+    __tablename__ = "goal_stats"
+
+    goal_id: Optional[int] = Field(default=None, foreign_key="goal.id", primary_key=True, ondelete="CASCADE")
+    total_tasks: int = Field(default=0)
+    not_started: int = Field(default=0)
+    in_progress: int = Field(default=0)
+    completed: int = Field(default=0)
+    total_duration_seconds: int = Field(default=0)
+
+
+class GoalProgress(SQLModel):
+    """
+    Task progress of a goal, as computed by GoalManager.get_progress.
+    """
+    goal_id: int
+    total_tasks: int = 0
+    not_started: int = 0
+    in_progress: int = 0
+    completed: int = 0
+    total_duration_seconds: int = 0
+    overdue: int = 0
+
+    @property
+    def completion_rate(self) -> float:
+        return self.completed / self.total_tasks if self.total_tasks else 0.0
@@ -0,0 +1,210 @@
+# Standard library imports
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+# Third-party imports
+from sqlmodel import select, or_
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is the optional "analytics" dependency.
+    np = None
+
+# Local application imports
+from src.models.model import Task
+
+# Task columns held as arrays, in select order.
+COLUMNS = ("id", "goal_id", "priority", "status", "due_date", "duration_seconds")
+# Integer code of each status in the status array; any other status is -1.
+STATUS_CODES = {"Not Started": 0, "In Progress": 1, "Completed": 2}
+COMPLETED = STATUS_CODES["Completed"]
+# Stands for NULL in the integer arrays, whose real values are never negative.
+MISSING = -1
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Task analytics needs NumPy: pip install 'SmartTasker[analytics]'")
+
+def _to_arrays(rows: Sequence[Sequence[Any]]) -> Dict[str, Any]:
+    """Converts result rows in COLUMNS order into one array per column."""
+    def integers(index: int):
+        return np.fromiter(
+            (row[index] if row[index] is not None else MISSING for row in rows), dtype=np.int64, count=len(rows)
+        )
+    return {
+        "id": integers(0),
+        "goal_id": integers(1),
+        "priority": integers(2),
+        "status": np.fromiter((STATUS_CODES.get(row[3], MISSING) for row in rows), dtype=np.int8, count=len(rows)),
+        "due_date": np.array([row[4] if row[4] is not None else "NaT" for row in rows], dtype="datetime64[us]"),
+        "duration_seconds": integers(5),
+    }
+
+def _concatenate(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if not parts:
+        return _to_arrays([])
+    return {name: np.concatenate([part[name] for part in parts]) for name in COLUMNS}
+
+class TaskAnalytics:
+    """
+    A columnar, in-memory view of the tasks for workload and progress questions.
+
+    The columns in COLUMNS are read in keyset-paginated batches and kept as NumPy
+    arrays sorted by id, so each question is answered with a few vectorized
+    operations instead of a loop over Task instances. Call refresh to load the
+    view and again to pick up changes: after the first load only tasks added or
+    updated since the last refresh are read, plus the ids needed to drop deleted
+    and archived tasks.
+
+    Changes are found through ``Task.updated_at``, which every UPDATE sets except
+    those of only TASK_SYSTEM_COLUMNS, such as the scheduler's suggested start
+    times, which the view does not hold. Each refresh re-reads rows changed within ``overlap`` seconds before the previous
+    one started, so writes committed while it ran are not missed.
+    """
+
+    def __init__(self, engine: Optional[AsyncEngine] = None, batch_size: int = 5000, overlap: float = 5.0):
+        """
+        Initializes an empty view; call refresh to load it.
+
+        Args:
+            engine (Optional[AsyncEngine]): The engine to read from. Defaults to the reader engine.
+            batch_size (int): The number of rows read per query.
+            overlap (float): Seconds of changes re-read by each incremental refresh.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        _require_numpy()
+        if engine is None:
+            from src.services.db_setup import get_reader_engine
+            engine = get_reader_engine()
+        self._engine = engine
+        self.batch_size = batch_size
+        self.overlap = overlap
+        self._columns = _to_arrays([])
+        self._max_id: Optional[int] = None
+        self._changed_since: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._columns["id"])
+
+    @property
+    def columns(self) -> Dict[str, Any]:
+        """The column arrays keyed by name; NULL is -1 in the integer arrays and NaT in ``due_date``."""
+        return self._columns
+
+    async def refresh(self) -> int:
+        """
+        Loads all tasks on the first call, and only the changed ones afterwards.
+
+        Returns:
+            int: The number of task rows read.
+        """
+        started = datetime.now()
+        if self._max_id is None:
+            self._columns = await self._read()
+            read = len(self)
+        else:
+            changed = await self._read(or_(Task.id > self._max_id, Task.updated_at >= self._changed_since))
+            current_ids = await self._read_ids()
+            self._merge(changed, current_ids)
+            read = len(changed["id"])
+        self._max_id = int(self._columns["id"].max()) if len(self) else 0
+        self._changed_since = started - timedelta(seconds=self.overlap)
+        return read
+
+    def workload_by_day(
+        self,
+        start: date,
+        days: int = 90,
+        include_completed: bool = False,
+        default_duration: timedelta = timedelta(0),
+    ) -> Dict[date, float]:
+        """
+        Sums the hours of the tasks due on each day of a window.
+
+        Args:
+            start (date): The first day.
+            days (int): The number of days.
+            include_completed (bool): Whether completed tasks count.
+            default_duration (timedelta): The duration of tasks without one.
+
+        Returns:
+            Dict[date, float]: Hours due per day, for every day of the window.
+        """
+        columns = self._columns
+        day = (columns["due_date"].astype("datetime64[D]") - np.datetime64(start, "D")).astype(np.int64)
+        mask = ~np.isnat(columns["due_date"]) & (day >= 0) & (day < days)
+        if not include_completed:
+            mask &= columns["status"] != COMPLETED
+        durations = columns["duration_seconds"][mask]
+        durations = np.where(durations == MISSING, default_duration.total_seconds(), durations)
+        hours = np.bincount(day[mask], weights=durations, minlength=days) / 3600
+        return {start + timedelta(days=offset): float(hours[offset]) for offset in range(days)}
+
+    def overdue_by_priority(self, now: Optional[datetime] = None) -> Dict[Optional[int], int]:
+        """
+        Counts the tasks past their due date that are not completed, per priority.
+
+        Args:
+            now (Optional[datetime]): The current time. Defaults to datetime.now().
+
+        Returns:
+            Dict[Optional[int], int]: Overdue tasks per priority; None for tasks without one.
+        """
+        columns = self._columns
+        now = np.datetime64(now or datetime.now(), "us")
+        mask = (columns["due_date"] < now) & (columns["status"] != COMPLETED)
+        priorities, counts = np.unique(columns["priority"][mask], return_counts=True)
+        return {
+            (None if priority == MISSING else int(priority)): int(count)
+            for priority, count in zip(priorities, counts)
+        }
+
+    def completion_rate_by_goal(self) -> Dict[int, float]:
+        """
+        Computes the share of completed tasks of each goal that has tasks.
+
+        Returns:
+            Dict[int, float]: The completion rate between 0 and 1, keyed by goal id.
+        """
+        columns = self._columns
+        mask = columns["goal_id"] != MISSING
+        goal_ids, positions = np.unique(columns["goal_id"][mask], return_inverse=True)
+        totals = np.bincount(positions, minlength=len(goal_ids))
+        completed = np.bincount(positions, weights=columns["status"][mask] == COMPLETED, minlength=len(goal_ids))
+        return {int(goal_id): float(rate) for goal_id, rate in zip(goal_ids, completed / totals)}
+
+    async def _pages(self, columns: Sequence, condition=None) -> AsyncIterator[List[Any]]:
+        """Yields the rows matching ``condition`` in id order, one batch per session."""
+        after = 0
+        while True:
+            stmt = select(*columns).where(Task.id > after).order_by(Task.id).limit(self.batch_size)
+            if condition is not None:
+                stmt = stmt.where(condition)
+            async with AsyncSession(self._engine) as session:
+                rows = (await session.exec(stmt)).all()
+            if rows:
+                yield rows
+            if len(rows) < self.batch_size:
+                return
+            after = rows[-1] if len(columns) == 1 else rows[-1][0]
+
+    async def _read(self, condition=None) -> Dict[str, Any]:
+        """Reads the COLUMNS of the tasks matching ``condition`` into arrays."""
+        columns = [getattr(Task, name) for name in COLUMNS]
+        return _concatenate([_to_arrays(rows) async for rows in self._pages(columns, condition)])
+
+    async def _read_ids(self):
+        """Reads the ids of all tasks into one array."""
+        ids = [np.fromiter(rows, dtype=np.int64, count=len(rows)) async for rows in self._pages([Task.id])]
+        return np.concatenate(ids) if ids else np.empty(0, dtype=np.int64)
+
+    def _merge(self, changed: Dict[str, Any], current_ids) -> None:
+        """Replaces the changed rows, adds the new ones and drops the ids no longer in the table."""
+        keep = np.isin(self._columns["id"], current_ids) & ~np.isin(self._columns["id"], changed["id"])
+        merged = {name: np.concatenate([self._columns[name][keep], changed[name]]) for name in COLUMNS}
+        order = np.argsort(merged["id"], kind="stable")
+        self._columns = {name: merged[name][order] for name in COLUMNS}
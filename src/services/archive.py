@@ -0,0 +1,193 @@
+# Standard library imports
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Third-party imports
+from sqlmodel import SQLModel, select, insert, delete, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import Column, Index, Table
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Local application imports
+from src.models.model import Task, TaskHistory, AISuggestion, TaskNotification, Feedback
+from src.services.goal_stats import GOAL_STATS_TASK_COLUMNS, add_goal_stats_delta, apply_goal_stats
+from src.services.validation import construct_trusted
+
+def _archive_table(model: type) -> Table:
+    """
+    Declares the cold copy of a model's table.
+
+    The archive table has the same columns but no foreign keys, so rows can be moved
+    in any order, and only an index on the column archived rows are looked up by.
+    """
+    source = model.__table__
+    table = Table(
+        f"archive_{source.name}",
+        SQLModel.metadata,
+        *[Column(column.name, column.type, primary_key=column.primary_key) for column in source.columns],
+    )
+    for key in ("task_id", "ai_suggestion_id"):
+        if key in table.c:
+            Index(f"ix_archive_{source.name}_{key}", table.c[key])
+    return table
+
+# Archive table of each archived model; created with the other tables by create_db_and_tables.
+ARCHIVE_TABLES: Dict[type, Table] = {
+    model: _archive_table(model) for model in (Task, TaskHistory, AISuggestion, TaskNotification, Feedback)
+}
+
+async def get_archived(session: AsyncSession, model: type, item_id: int) -> Optional[Any]:
+    """
+    Reads an archived row back as a detached model instance.
+
+    Args:
+        session (AsyncSession): The session to run in.
+        model (type): The model class of the row.
+        item_id (int): The row id.
+
+    Returns:
+        Optional[Any]: The archived item, or None if it is not archived either.
+    """
+    table = ARCHIVE_TABLES[model]
+    row = (await session.exec(select(*table.columns).where(table.c.id == item_id))).first()
+    return construct_trusted(model, row._mapping) if row is not None else None
+
+async def _move(session: AsyncSession, model: type, condition) -> int:
+    """Copies the matching rows into the archive table and deletes them from the hot table."""
+    source = model.__table__
+    archive = ARCHIVE_TABLES[model]
+    names = [column.name for column in source.columns]
+    await session.exec(insert(archive).from_select(names, select(*source.columns).where(condition)))
+    result = await session.exec(delete(source).where(condition))
+    return result.rowcount
+
+def _invalidate_caches(model: type, item_ids: List[int]) -> None:
+    from src.models.db_manager import BaseManager, TaskManager
+    cache = BaseManager._caches.get(model)
+    for item_id in item_ids:
+        if cache is not None:
+            cache.invalidate(item_id)
+        if model is Task:
+            TaskManager.occurrence_cache.invalidate(item_id)
+
+class Archiver:
+    """
+    Moves cold rows out of the hot tables into ``archive_*`` tables.
+
+    Completed tasks are moved together with their history, AI suggestions, the
+    suggestions' feedback, and notifications; old history can also be moved on its
+    own. Work is done in batches of ``batch_size`` rows, each in its own short
+    transaction with an optional pause between batches, so archival can run while
+    the application keeps writing. BaseManager.get reads through to the archive
+    tables, so fetching an archived id still returns the item.
+
+    Archived tasks leave the goal_stats totals when TaskManager.maintain_goal_stats
+    is on, so goal progress always describes the hot tables.
+    """
+
+    def __init__(self, engine: Optional[AsyncEngine] = None, batch_size: int = 500, pause: float = 0.0):
+        """
+        Initializes the archiver.
+
+        Args:
+            engine (Optional[AsyncEngine]): The engine to use. Defaults to the application engine.
+            batch_size (int): The maximum number of tasks or history rows moved per transaction.
+            pause (float): Seconds to sleep between batches, leaving room for other writers.
+        """
+        if engine is None:
+            from src.services.db_setup import get_engine
+            engine = get_engine()
+        self._engine = engine
+        self.batch_size = batch_size
+        self.pause = pause
+
+    async def archive_completed_tasks(self, before: datetime, max_batches: Optional[int] = None) -> int:
+        """
+        Archives completed tasks last changed before ``before``, with their related rows.
+
+        A task's last change is its ``updated_at``, or ``created_at`` if it was never updated.
+
+        Args:
+            before (datetime): The cutoff.
+            max_batches (Optional[int]): Stop after this many batches; None runs until done.
+
+        Returns:
+            int: The number of tasks archived.
+        """
+        changed_at = func.coalesce(Task.updated_at, Task.created_at)
+        stmt = (
+            select(Task.id)
+            .where(Task.status == "Completed", changed_at < before)
+            .order_by(Task.id)
+            .limit(self.batch_size)
+        )
+
+        async def _archive_batch(session: AsyncSession) -> List[int]:
+            task_ids = list(await session.exec(stmt))
+            if not task_ids:
+                return []
+            from src.models.db_manager import TaskManager
+            if TaskManager.maintain_goal_stats:
+                columns = [getattr(Task, key) for key in GOAL_STATS_TASK_COLUMNS]
+                deltas: Dict[int, Dict[str, int]] = {}
+                for row in await session.exec(select(*columns).where(Task.id.in_(task_ids))):
+                    add_goal_stats_delta(deltas, row._mapping, -1)
+                await apply_goal_stats(session, deltas)
+            suggestion_ids = select(AISuggestion.id).where(AISuggestion.task_id.in_(task_ids))
+            await _move(session, Feedback, Feedback.ai_suggestion_id.in_(suggestion_ids))
+            for model in (AISuggestion, TaskNotification, TaskHistory):
+                await _move(session, model, model.task_id.in_(task_ids))
+            await _move(session, Task, Task.id.in_(task_ids))
+            return task_ids
+
+        return await self._run_batches(_archive_batch, Task, max_batches)
+
+    async def archive_history(self, before: datetime, max_batches: Optional[int] = None) -> int:
+        """
+        Archives TaskHistory entries created before ``before``, of any task.
+
+        TaskHistoryManager.state_at only reads the hot table, so keep the cutoff older
+        than the states that should stay reconstructible.
+
+        Args:
+            before (datetime): The cutoff.
+            max_batches (Optional[int]): Stop after this many batches; None runs until done.
+
+        Returns:
+            int: The number of entries archived.
+        """
+        stmt = (
+            select(TaskHistory.id)
+            .where(TaskHistory.created_at < before)
+            .order_by(TaskHistory.id)
+            .limit(self.batch_size)
+        )
+
+        async def _archive_batch(session: AsyncSession) -> List[int]:
+            history_ids = list(await session.exec(stmt))
+            if history_ids:
+                await _move(session, TaskHistory, TaskHistory.id.in_(history_ids))
+            return history_ids
+
+        return await self._run_batches(_archive_batch, TaskHistory, max_batches)
+
+    async def _run_batches(self, archive_batch, model: type, max_batches: Optional[int]) -> int:
+        moved = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            async with AsyncSession(self._engine) as session:
+                try:
+                    item_ids = await archive_batch(session)
+                    await session.commit()
+                except BaseException:
+                    await session.rollback()
+                    raise
+            _invalidate_caches(model, item_ids)
+            moved += len(item_ids)
+            batches += 1
+            if len(item_ids) < self.batch_size:
+                break
+            if self.pause:
+                await asyncio.sleep(self.pause)
+        return moved
@@ -0,0 +1,157 @@
+# Standard library imports
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+def estimate_size(value: Any) -> int:
+    """
+    Roughly estimates the memory held by a cached object.
+
+    Counts the object itself plus the direct values of its attributes, which is
+    close enough for flat model rows.
+
+    Args:
+        value (Any): The cached object.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    size = sys.getsizeof(value)
+    attributes = getattr(value, "__dict__", None)
+    if attributes:
+        size += sum(sys.getsizeof(v) for v in attributes.values())
+    return size
+
+class LRUCache:
+    """
+    A bounded least-recently-used cache with time-to-live expiry.
+
+    Entries are evicted in LRU order once ``max_entries`` or ``max_bytes`` is
+    exceeded, and treated as misses once older than ``ttl`` seconds. Hit, miss and
+    eviction counters are kept to judge whether the cache pays for itself.
+
+    Every invalidation bumps a version counter. A reader takes ``version`` before
+    loading a value and passes it to ``put``, which skips the value if its key was
+    invalidated since, so a load racing a write cannot cache the old value. The
+    last ``max_entries`` invalidations are remembered per key; puts older than any
+    forgotten one are skipped, which keeps that bookkeeping bounded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 60.0,
+        max_bytes: Optional[int] = None,
+        sizer: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes the cache.
+
+        Args:
+            max_entries (int): The maximum number of entries kept.
+            ttl (Optional[float]): Seconds an entry stays valid; None never expires.
+            max_bytes (Optional[int]): Optional bound on the estimated memory held.
+            sizer (Callable[[Any], int]): Estimates the size of a value in bytes.
+            clock (Callable[[], float]): The time source, in seconds.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizer = sizer
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._version = 0
+        # Version of each key's latest invalidation, oldest first.
+        self._invalidated: "OrderedDict[Hashable, int]" = OrderedDict()
+        # Invalidations up to this version are no longer remembered per key.
+        self._forgotten = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Returns the cached value, or None on a miss or an expired entry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at, _ = entry
+        if expires_at is not None and expires_at <= self._clock():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    @property
+    def version(self) -> int:
+        """The number of invalidations so far; take it before loading a value to put."""
+        return self._version
+
+    def put(self, key: Hashable, value: Any, version: Optional[int] = None) -> None:
+        """
+        Stores a value, evicting least recently used entries beyond the bounds.
+
+        Args:
+            key (Hashable): The key.
+            value (Any): The value.
+            version (Optional[int]): The ``version`` taken before the value was loaded;
+                the value is not stored if the key was invalidated after it.
+        """
+        if version is not None and (version < self._forgotten or self._invalidated.get(key, 0) > version):
+            return
+        if key in self._entries:
+            self._remove(key)
+        size = self._sizer(value) if self.max_bytes is not None else 0
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (value, expires_at, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes and len(self._entries) > 1
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drops a single entry if present and refuses older loads of it."""
+        self._version += 1
+        self._invalidated[key] = self._version
+        self._invalidated.move_to_end(key)
+        if len(self._invalidated) > self.max_entries:
+            _, self._forgotten = self._invalidated.popitem(last=False)
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drops all entries and refuses every load in flight; the counters are kept."""
+        self._entries.clear()
+        self._bytes = 0
+        self._version += 1
+        self._invalidated.clear()
+        self._forgotten = self._version
+
+    def stats(self) -> Dict[str, float]:
+        """Returns the hit, miss and eviction counters plus the current size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
@@ -0,0 +1,23 @@
+# Standard library imports
+from functools import lru_cache
+from typing import Any, FrozenSet, Mapping
+
+@lru_cache(maxsize=None)
+def column_names(model: Any) -> FrozenSet[str]:
+    """Returns the names of the table columns of a model class."""
+    return frozenset(column.key for column in model.__table__.columns)
+
+def check_columns(model: Any, values: Mapping[str, Any]) -> None:
+    """
+    Validates that every key in ``values`` is a column of ``model``.
+
+    Args:
+        model: The model class being written.
+        values (Mapping[str, Any]): The field values to write.
+
+    Raises:
+        ValueError: If any key is not a column, e.g. a typo or a relationship.
+    """
+    unknown = set(values) - column_names(model)
+    if unknown:
+        raise ValueError(f"Unknown field(s) for {model.__name__}: {', '.join(sorted(unknown))}")
@@ -0,0 +1,339 @@
+# Standard library imports
+import argparse
+import asyncio
+import csv
+import json
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+# Third-party imports
+from sqlmodel import select, insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import JSON, Boolean, Date, DateTime, Float, Integer, Table
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Local application imports
+from src.models.model import Goal, Task, TaskHistory, AISuggestion, TaskNotification, Feedback
+from src.services.archive import ARCHIVE_TABLES
+from src.services.validation import construct_many_trusted, validate_rows
+
+# Exported models, parents before children so foreign keys resolve on import.
+TRANSFER_MODELS = (Goal, Task, TaskHistory, AISuggestion, TaskNotification, Feedback)
+# Every exported ``(model, table)``: the models' tables, then their archive tables,
+# which have no foreign keys and so can come last.
+TRANSFER_TABLES: Tuple[Tuple[type, Table], ...] = tuple(
+    (model, model.__table__) for model in TRANSFER_MODELS
+) + tuple((model, ARCHIVE_TABLES[model]) for model in TRANSFER_MODELS if model in ARCHIVE_TABLES)
+FORMATS = ("ndjson", "csv")
+
+def _python_type(column_type: Any) -> type:
+    for sql_type, python_type in ((DateTime, datetime), (Date, date), (JSON, dict), (Boolean, bool), (Integer, int), (Float, float)):
+        if isinstance(column_type, sql_type):
+            return python_type
+    return str
+
+def _column_types(table: Table) -> Dict[str, type]:
+    return {column.name: _python_type(column.type) for column in table.columns}
+
+def _table(model: type, archived: bool) -> Table:
+    if not archived:
+        return model.__table__
+    if model not in ARCHIVE_TABLES:
+        raise ValueError(f"{model.__name__} has no archive table")
+    return ARCHIVE_TABLES[model]
+
+# NULL in a CSV string column, where an empty cell is the empty string. String values
+# starting with a backslash get one more, so a literal "\N" is written "\\N".
+CSV_NULL = "\\N"
+
+def _encode(value: Any, fmt: str, python_type: type) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if fmt == "csv":
+        if value is None:
+            return CSV_NULL if python_type is str else ""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        if isinstance(value, str) and value.startswith("\\"):
+            return "\\" + value
+    return value
+
+def _decode(value: Any, python_type: type, fmt: str) -> Any:
+    """Converts a value read from a file back to its column type; CSV cells are all strings."""
+    if fmt == "csv" and isinstance(value, str):
+        if python_type is str:
+            if value == CSV_NULL:
+                return None
+            return value[1:] if value.startswith("\\") else value
+        if value == "":
+            return None
+    if value is None:
+        return None
+    if python_type in (datetime, date):
+        return python_type.fromisoformat(value)
+    if python_type is dict:
+        return json.loads(value) if isinstance(value, str) else value
+    if python_type is bool and isinstance(value, str):
+        return value == "True"
+    if python_type in (int, float) and isinstance(value, str):
+        return python_type(value)
+    return value
+
+def file_name(table: Table, fmt: str) -> str:
+    """Returns the name of a table's file in an export directory, e.g. ``task.ndjson``."""
+    return f"{table.name}.{fmt}"
+
+def _check_format(fmt: str) -> None:
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}', expected one of: {', '.join(FORMATS)}")
+
+def _read_rows(stream: TextIO, fmt: str) -> Iterator[Dict[str, Any]]:
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    else:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+def _bulk_creator(model: type) -> Callable:
+    """The bulk insert of a model's manager, so imports keep goal stats up to date."""
+    from src.models.db_manager import (
+        GoalManager, TaskManager, TaskHistoryManager, AISuggestionManager, TaskNotificationManager, FeedbackManager
+    )
+    return {
+        Goal: GoalManager().create_goals,
+        Task: TaskManager().create_tasks,
+        TaskHistory: TaskHistoryManager().create_task_histories,
+        AISuggestion: AISuggestionManager().create_AIsuggestions,
+        TaskNotification: TaskNotificationManager().create_task_notifications,
+        Feedback: FeedbackManager().create_feedbacks,
+    }[model]
+
+@asynccontextmanager
+async def _snapshot(engine: Optional[AsyncEngine] = None) -> AsyncIterator[AsyncSession]:
+    """
+    Opens a session whose reads all see one snapshot of the database.
+
+    The SQLite driver only starts transactions before writes, so each SELECT would
+    otherwise see the latest commit; BEGIN is sent explicitly and the read
+    transaction is rolled back at the end.
+    """
+    if engine is None:
+        from src.services.db_setup import get_reader_engine
+        engine = get_reader_engine()
+    async with AsyncSession(engine) as session:
+        connection = await session.connection()
+        await connection.exec_driver_sql("BEGIN")
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+async def _export_table(session: AsyncSession, table: Table, stream: TextIO, fmt: str, batch_size: Optional[int]) -> int:
+    """Writes every row of a table to a stream, reading it by keyset pages in ``session``."""
+    from src.models.db_manager import BaseManager
+    batch_size = batch_size or BaseManager.iter_batch_size
+    types = _column_types(table)
+    names = list(types)
+    writer = csv.DictWriter(stream, fieldnames=names) if fmt == "csv" else None
+    if writer is not None:
+        writer.writeheader()
+    count = 0
+    after = None
+    while True:
+        stmt = select(*table.columns).order_by(table.c.id).limit(batch_size)
+        if after is not None:
+            stmt = stmt.where(table.c.id > after)
+        rows = (await session.exec(stmt)).all()
+        for values in rows:
+            row = {name: _encode(value, fmt, types[name]) for name, value in zip(names, values)}
+            if writer is not None:
+                writer.writerow(row)
+            else:
+                stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+        count += len(rows)
+        if len(rows) < batch_size:
+            return count
+        after = rows[-1].id
+
+async def export_model(
+    model: type,
+    stream: TextIO,
+    fmt: str = "ndjson",
+    batch_size: Optional[int] = None,
+    archived: bool = False,
+    engine: Optional[AsyncEngine] = None,
+) -> int:
+    """
+    Writes every row of a model to a text stream.
+
+    Rows are read with keyset pagination in one read transaction and written as
+    they arrive, so memory use does not grow with the table. Dates are written as
+    ISO 8601 strings. In CSV, JSON columns are JSON strings and an empty cell is
+    NULL, except in string columns, where it is the empty string and NULL is
+    written as CSV_NULL (``\\N``); string values starting with a backslash are
+    escaped with another one. NDJSON keeps ``""`` and ``null`` apart as they are.
+
+    Args:
+        model (type): The model to export.
+        stream (TextIO): The stream to write to; open CSV files with ``newline=""``.
+        fmt (str): ``"ndjson"`` or ``"csv"``.
+        batch_size (Optional[int]): Rows per page. Defaults to BaseManager.iter_batch_size.
+        archived (bool): Export the model's archive table instead of its table.
+        engine (Optional[AsyncEngine]): The engine to read from. Defaults to the reader engine.
+
+    Returns:
+        int: The number of rows written.
+    """
+    _check_format(fmt)
+    table = _table(model, archived)
+    async with _snapshot(engine) as session:
+        return await _export_table(session, table, stream, fmt, batch_size)
+
+async def import_model(
+    model: type,
+    stream: TextIO,
+    fmt: str = "ndjson",
+    chunk_size: Optional[int] = None,
+    archived: bool = False,
+) -> int:
+    """
+    Inserts the rows of a model read from a text stream.
+
+    Rows are inserted through the manager's bulk insert, one transaction per chunk,
+    so memory use is bounded by ``chunk_size``. Each chunk is checked with
+    validate_rows first and a chunk with invalid rows raises ValueError naming
+    them; the chunks before it stay imported. Ids are kept, so rows of other models
+    that reference them stay linked; import parents before children, as
+    TRANSFER_MODELS lists them, into tables that do not hold those ids yet.
+    Archived rows are inserted into the model's archive table directly.
+
+    Args:
+        model (type): The model to import.
+        stream (TextIO): The stream to read from, as written by export_model.
+        fmt (str): ``"ndjson"`` or ``"csv"``.
+        chunk_size (Optional[int]): Rows per transaction. Defaults to BaseManager.bulk_chunk_size.
+        archived (bool): Import into the model's archive table.
+
+    Returns:
+        int: The number of rows inserted.
+    """
+    from src.models.db_manager import BaseManager
+    _check_format(fmt)
+    chunk_size = chunk_size or BaseManager.bulk_chunk_size
+    table = _table(model, archived)
+    types = _column_types(table)
+    create_many = _archive_creator(table) if archived else _bulk_creator(model)
+    count = 0
+    chunk: List[Dict[str, Any]] = []
+    for row in _read_rows(stream, fmt):
+        chunk.append({name: _decode(row.get(name), python_type, fmt) for name, python_type in types.items()})
+        if len(chunk) == chunk_size:
+            count += await _import_chunk(model, chunk, count, create_many, chunk_size)
+            chunk = []
+    if chunk:
+        count += await _import_chunk(model, chunk, count, create_many, chunk_size)
+    return count
+
+def _archive_creator(table: Table) -> Callable:
+    """A bulk insert into an archive table, shaped like the managers' create_many."""
+    async def _create_archived(items: List[Any], chunk_size: int) -> List[int]:
+        from src.services.db_setup import get_engine
+        rows = [item.model_dump() for item in items]
+        async with AsyncSession(get_engine()) as session:
+            try:
+                for start in range(0, len(rows), chunk_size):
+                    await session.exec(insert(table), params=rows[start:start + chunk_size])
+                await session.commit()
+            except BaseException:
+                await session.rollback()
+                raise
+        return [row["id"] for row in rows]
+    return _create_archived
+
+async def _import_chunk(model: type, rows: List[Dict[str, Any]], offset: int, create_many: Callable, chunk_size: int) -> int:
+    errors = validate_rows(model, rows)
+    if errors:
+        details = "; ".join(
+            f"row {offset + index + 1}: {', '.join(problems)}" for index, problems in list(errors.items())[:10]
+        )
+        raise ValueError(f"Invalid {model.__name__} rows: {details}")
+    return len(await create_many(construct_many_trusted(model, rows), chunk_size=chunk_size))
+
+async def export_data(
+    directory: Path,
+    fmt: str = "ndjson",
+    batch_size: Optional[int] = None,
+    engine: Optional[AsyncEngine] = None,
+) -> Dict[str, int]:
+    """
+    Exports every table in TRANSFER_TABLES to one file per table in ``directory``, see file_name.
+
+    All tables are read in one read transaction, so the files hold one consistent
+    snapshot even while the application keeps writing.
+
+    Args:
+        directory (Path): The directory to write to; it is created if missing.
+        fmt (str): ``"ndjson"`` or ``"csv"``.
+        batch_size (Optional[int]): Rows per page.
+        engine (Optional[AsyncEngine]): The engine to read from. Defaults to the reader engine.
+
+    Returns:
+        Dict[str, int]: The number of rows written per table name.
+    """
+    _check_format(fmt)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    counts = {}
+    async with _snapshot(engine) as session:
+        for _, table in TRANSFER_TABLES:
+            with open(directory / file_name(table, fmt), "w", encoding="utf-8", newline="") as stream:
+                counts[table.name] = await _export_table(session, table, stream, fmt, batch_size)
+    return counts
+
+async def import_data(directory: Path, fmt: str = "ndjson", chunk_size: Optional[int] = None) -> Dict[str, int]:
+    """
+    Imports the files written by export_data, parents first; missing files are skipped.
+
+    Args:
+        directory (Path): The export directory.
+        fmt (str): ``"ndjson"`` or ``"csv"``.
+        chunk_size (Optional[int]): Rows per transaction.
+
+    Returns:
+        Dict[str, int]: The number of rows inserted per table name.
+    """
+    _check_format(fmt)
+    counts = {}
+    for model, table in TRANSFER_TABLES:
+        path = Path(directory) / file_name(table, fmt)
+        if not path.exists():
+            continue
+        with open(path, encoding="utf-8", newline="") as stream:
+            archived = table is not model.__table__
+            counts[table.name] = await import_model(model, stream, fmt, chunk_size, archived=archived)
+    return counts
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: ``python -m src.services.data_transfer export|import DIR``."""
+    parser = argparse.ArgumentParser(description="Export or import SmartTasker data.")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("directory", type=Path, help="the directory holding one file per table")
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--batch-size", type=int, default=None, help="rows per page or transaction")
+    args = parser.parse_args(argv)
+    from src.services.db_setup import create_db_and_tables
+
+    async def _run() -> Dict[str, int]:
+        await create_db_and_tables()
+        if args.command == "export":
+            return await export_data(args.directory, args.format, args.batch_size)
+        return await import_data(args.directory, args.format, args.batch_size)
+
+    for table_name, count in asyncio.run(_run()).items():
+        print(f"{table_name}: {count}")
+
+if __name__ == "__main__":
+    main()
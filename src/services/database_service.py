@@ -1,22 +1,30 @@
 # Standard library imports
 from datetime import datetime
-from typing import Optional, List, Any, TypeVar, Generic, Callable, Coroutine
+from typing import Optional, List, Any, TypeVar, Generic, Callable, Coroutine, AsyncIterator
 import logging
 
 # Third-party imports
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select, SQLModel
+from sqlmodel import select, update, delete, SQLModel
 from sqlalchemy import exc
 
 # Local application imports
 from src.models.model import Goal, Task, TaskHistory, AISuggestion, TaskNotification, Feedback
 from src.services.db_setup import get_engine
+from src.services.pagination import keyset_select, keyset_position
+from src.services.columns import check_columns
+from src.services.metrics import acquire_connection, instrument
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+def _invalidate_manager_caches(model: type, item_ids: List[int]) -> None:
+    """Drops the written ids from the managers' read-through caches, which share these rows."""
+    from src.models.db_manager import BaseManager
+    BaseManager.invalidate_cached(model, item_ids)
+
 class DatabaseService:
     """
     A service class for interacting with the database.
@@ -45,8 +53,10 @@ class DatabaseService:
         Returns:
             Optional[T]: The result of the function execution, or None if an error occurred.
         """
-        async with AsyncSession(self.engine) as session:
+        # Objects stay loaded after commit, so writes need no refresh round trip.
+        async with AsyncSession(self.engine, expire_on_commit=False) as session:
             try:
+                await acquire_connection(session)
                 result = await func(session, *args, **kwargs)  # Pass session to the func
                 return result
             except exc.IntegrityError as e:
@@ -58,6 +68,7 @@ class DatabaseService:
                 logger.error(f"An error occurred: {e}")
                 raise  # Re-raise the exception
 
+    @instrument
     async def create(self, item: SQLModel) -> Optional[SQLModel]:
         """
         Creates a new item in the database.
@@ -71,10 +82,10 @@ class DatabaseService:
         async def _create_internal(session: AsyncSession, item: SQLModel) -> SQLModel:
             session.add(item)
             await session.commit()
-            await session.refresh(item)
             return item
         return await self._execute_with_session(_create_internal, item)
 
+    @instrument
     async def get(self, item: SQLModel, item_id: int) -> Optional[SQLModel]:
         """
         Retrieves an item by its ID.
@@ -90,6 +101,7 @@ class DatabaseService:
             return await session.get(item, item_id)
         return await self._execute_with_session(_get_internal, item, item_id)
         
+    @instrument
     async def get_all(self, item: SQLModel) -> List[Any]:
         """
         Retrieves all items of a specific type.
@@ -104,9 +116,58 @@ class DatabaseService:
             return (await session.exec(select(item))).all()
         return await self._execute_with_session(_get_all_internal, item)
         
+    @instrument
+    async def iter_all(self, item: SQLModel, batch_size: int = 500, order_by: Optional[str] = None) -> AsyncIterator[SQLModel]:
+        """
+        Streams all items of a specific type using keyset pagination.
+
+        Each page is loaded in its own session and filtered on the last seen key
+        instead of an OFFSET, so memory use is bounded by ``batch_size``.
+
+        Args:
+            item (SQLModel): The type of items to retrieve.
+            batch_size (int): The number of rows fetched per page.
+            order_by (Optional[str]): The column to order by, prefixed with ``-`` for
+                descending order. Defaults to the primary key.
+
+        Yields:
+            SQLModel: The retrieved items, one at a time.
+        """
+        async def _get_page_internal(session: AsyncSession, item: SQLModel, after) -> List[Any]:
+            stmt = keyset_select(item, order_by=order_by, after=after, limit=batch_size)
+            return (await session.exec(stmt)).all()
+
+        after = None
+        while True:
+            page = await self._execute_with_session(_get_page_internal, item, after)
+            for row in page:
+                yield row
+            if len(page) < batch_size:
+                return
+            after = keyset_position(page[-1], order_by)
+
+    @instrument
+    async def get_page(self, item: SQLModel, after_id: Optional[int] = None, limit: int = 100) -> List[Any]:
+        """
+        Retrieves one page of items ordered by primary key.
+
+        Args:
+            item (SQLModel): The type of items to retrieve.
+            after_id (Optional[int]): Only items with a greater ID are returned.
+            limit (int): The maximum number of items to return.
+
+        Returns:
+            List[SQLModel]: The items in the page; empty when there are no more.
+        """
+        async def _get_page_internal(session: AsyncSession, item: SQLModel) -> List[Any]:
+            after = (after_id, after_id) if after_id is not None else None
+            return (await session.exec(keyset_select(item, after=after, limit=limit))).all()
+        return await self._execute_with_session(_get_page_internal, item)
+        
+    @instrument
     async def update(self, item: SQLModel, item_id: int, **kwargs) -> Optional[SQLModel]:
         """
-        Updates an existing item.
+        Updates an existing item with a single UPDATE ... RETURNING statement.
 
         Args:
             item (SQLModel): The type of item to update.
@@ -114,24 +175,29 @@ class DatabaseService:
             **kwargs: The fields to update and their new values.
 
         Returns:
-            Optional[SQLModel]: The updated item, or None if not found or an error occurred.
+            Optional[SQLModel]: The updated item, or None if not found.
+
+        Raises:
+            ValueError: If a field is not a column of the item type.
         """
         async def _update_internal(session: AsyncSession, item: SQLModel, item_id: int, **kwargs) -> Optional[SQLModel]:
-            item = await session.get(item, item_id)
-            if item:
-                for key, value in kwargs.items():
-                    if hasattr(item, key):
-                        setattr(item, key, value)
-                session.add(item)
-                await session.commit()
-                await session.refresh(item)
-                return item
-            return None
-        return await self._execute_with_session(_update_internal, item, item_id, **kwargs)
+            stmt = update(item).where(item.id == item_id).values(**kwargs).returning(item)
+            updated = (await session.exec(stmt)).scalars().one_or_none()
+            await session.commit()
+            return updated
+
+        check_columns(item, kwargs)
+        if not kwargs:
+            return await self.get(item, item_id)
+        try:
+            return await self._execute_with_session(_update_internal, item, item_id, **kwargs)
+        finally:
+            _invalidate_manager_caches(item, [item_id])
         
+    @instrument
     async def delete(self, item: SQLModel, item_id: int) -> bool:
         """
-        Deletes an item by its ID.
+        Deletes an item by its ID with a single DELETE ... RETURNING statement.
 
         Args:
             item (SQLModel): The type of item to delete.
@@ -141,10 +207,11 @@ class DatabaseService:
             bool: True if the item was deleted, False if not found or an error occurred.
         """
         async def _delete_internal(session: AsyncSession, item: SQLModel, item_id: int) -> bool:
-            item = await session.get(item, item_id)
-            if item:
-                await session.delete(item)
-                await session.commit()
-                return True
-            return False
-        return await self._execute_with_session(_delete_internal, item, item_id)
+            stmt = delete(item).where(item.id == item_id).returning(item.id)
+            deleted = (await session.exec(stmt)).first() is not None
+            await session.commit()
+            return deleted
+        try:
+            return await self._execute_with_session(_delete_internal, item, item_id)
+        finally:
+            _invalidate_manager_caches(item, [item_id])
@@ -1,18 +1,199 @@
+# Standard library imports
+import os
+from typing import Any, Dict, Optional
+
 # Third-party imports
-from sqlmodel import SQLModel, create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine
+from sqlmodel import SQLModel
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 # Local application imports
 from src.models import model  # Import all models for SQLModel metadata
+from src.services.search import install_search
+from src.services.metrics import install_instrumentation
+
+# The database URL and engine profile are read from the environment, e.g.
+#   SMARTTASKER_DATABASE_URL=sqlite+aiosqlite:///data.sqlite3
+#   SMARTTASKER_DATABASE_PROFILE=fast
+DATABASE_URL_ENV = "SMARTTASKER_DATABASE_URL"
+DATABASE_PROFILE_ENV = "SMARTTASKER_DATABASE_PROFILE"
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Read-only connections of a file-backed database; 0 sends reads to the writer engine.
+#   SMARTTASKER_READ_POOL_SIZE=8
+READ_POOL_SIZE_ENV = "SMARTTASKER_READ_POOL_SIZE"
+DEFAULT_READ_POOL_SIZE = 8
+
+# Pragmas applied to every new SQLite connection, by profile name.
+#   durable: WAL with a full fsync on every commit.
+#   fast:    WAL with fsync only at checkpoints; a power loss may drop the
+#            last commits but never corrupts the database.
+#   test:    no journal on disk and no fsync, for throwaway databases.
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "foreign_keys": "ON",
+        "busy_timeout": 5000,
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "foreign_keys": "ON",
+        "busy_timeout": 5000,
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    "test": {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "foreign_keys": "ON",
+        "busy_timeout": 1000,
+        "temp_store": "MEMORY",
+    },
+}
+
+def get_database_url() -> str:
+    """Returns the configured database URL, defaulting to an in-memory database."""
+    return os.environ.get(DATABASE_URL_ENV, DEFAULT_DATABASE_URL)
+
+def is_memory_url(url: str) -> bool:
+    """
+    Returns True when the SQLite URL points to an in-memory database.
+
+    That is an empty database or ``:memory:``, and the SQLite URI forms
+    ``file::memory:`` and ``file:name?mode=memory``, with any query options,
+    e.g. ``sqlite+aiosqlite:///file::memory:?cache=shared&uri=true``.
+    """
+    parsed = make_url(url)
+    database = parsed.database or ""
+    return (
+        database in ("", ":memory:")
+        or database.startswith("file::memory:")
+        or (database.startswith("file:") and parsed.query.get("mode") == "memory")
+    )
+
+def get_profile_name(url: Optional[str] = None) -> str:
+    """Returns the configured profile name; in-memory databases default to ``test``."""
+    url = url or get_database_url()
+    return os.environ.get(DATABASE_PROFILE_ENV, "test" if is_memory_url(url) else "fast")
+
+def get_read_pool_size() -> int:
+    """Returns the configured number of read-only connections."""
+    return int(os.environ.get(READ_POOL_SIZE_ENV, DEFAULT_READ_POOL_SIZE))
+
+def read_only_url(url: str) -> str:
+    """Returns the URL of read-only connections to the SQLite file of ``url``."""
+    parsed = make_url(url)
+    query = {**parsed.query, "mode": "ro", "uri": "true"}
+    return parsed.set(database=f"file:{parsed.database}", query=query).render_as_string(hide_password=False)
+
+def reader_pragmas(profile: str) -> Dict[str, Any]:
+    """Returns the pragmas of a profile's read-only connections, which cannot change the journal mode."""
+    pragmas = {name: value for name, value in PROFILES[profile].items() if name != "journal_mode"}
+    pragmas["query_only"] = "ON"
+    return pragmas
 
-# DATABASE_URL = "sqlite+aiosqlite:///data.sqlite3"
-DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+def apply_pragmas(engine: AsyncEngine, pragmas: Dict[str, Any]) -> None:
+    """Registers a connect hook that applies ``pragmas`` to every new connection."""
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
 
-_engine: AsyncEngine = AsyncEngine(create_engine(DATABASE_URL, echo=False, future=True))
+def create_engine_for_profile(
+    url: Optional[str] = None,
+    profile: Optional[str] = None,
+    echo: bool = False,
+    pool_size: Optional[int] = None,
+    read_only: bool = False,
+) -> AsyncEngine:
+    """
+    Creates an AsyncEngine with the pragmas of a named profile.
+
+    Args:
+        url (Optional[str]): The database URL. Defaults to the configured URL.
+        profile (Optional[str]): One of ``durable``, ``fast`` or ``test``. Defaults to
+            the configured profile.
+        echo (bool): Whether to log all SQL statements.
+        pool_size (Optional[int]): Keep exactly this many connections to a file-backed
+            database open. Defaults to the driver's pooling, a new connection per session.
+        read_only (bool): Open the file with ``mode=ro`` and ``query_only`` connections.
+
+    Returns:
+        AsyncEngine: The configured engine.
+    """
+    url = url or get_database_url()
+    profile = profile or get_profile_name(url)
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown database profile '{profile}'. Must be one of: {sorted(PROFILES)}")
+
+    options: Dict[str, Any] = {}
+    if pool_size is not None and not is_memory_url(url):
+        options = {"poolclass": AsyncAdaptedQueuePool, "pool_size": pool_size, "max_overflow": 0}
+    if read_only:
+        engine = create_async_engine(read_only_url(url), echo=echo, **options)
+        apply_pragmas(engine, reader_pragmas(profile))
+    else:
+        engine = create_async_engine(url, echo=echo, **options)
+        apply_pragmas(engine, PROFILES[profile])
+    install_instrumentation(engine)
+    return engine
+
+# The application engines, created on the first get_engine() or get_reader_engine()
+# call so that importing the models neither opens a database nor fixes the URL
+# before configuration runs.
+_engine: Optional[AsyncEngine] = None
+_reader_engine: Optional[AsyncEngine] = None
 
 async def create_db_and_tables():
-    async with _engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        await install_search(conn)
+
+def _has_reader_pool(url: str) -> bool:
+    return not is_memory_url(url) and get_read_pool_size() > 0
 
 def get_engine() -> AsyncEngine:
-    return _engine
\ No newline at end of file
+    """
+    Returns the application engine, creating it from the configured URL and profile on first use.
+
+    All writes go through it. With a read pool, see get_reader_engine, it holds a
+    single connection, so writers queue for it instead of for SQLite's write lock.
+    """
+    global _engine
+    if _engine is None:
+        url = get_database_url()
+        _engine = create_engine_for_profile(url, pool_size=1 if _has_reader_pool(url) else None)
+    return _engine
+
+def get_reader_engine() -> AsyncEngine:
+    """
+    Returns the engine for reads outside a transaction.
+
+    For a file-backed database it is a bounded pool of read-only connections, which
+    in WAL mode read the last committed state without waiting for the writer. An
+    in-memory database is private to its connection, so reads use get_engine.
+    """
+    global _reader_engine
+    url = get_database_url()
+    if not _has_reader_pool(url):
+        return get_engine()
+    if _reader_engine is None:
+        _reader_engine = create_engine_for_profile(url, pool_size=get_read_pool_size(), read_only=True)
+    return _reader_engine
+
+async def dispose_engine() -> None:
+    """Closes the application engines' connections; the next get_engine() call re-reads the configuration."""
+    global _engine, _reader_engine
+    for engine in (_reader_engine, _engine):
+        if engine is not None:
+            await engine.dispose()
+    _engine = _reader_engine = None
@@ -0,0 +1,138 @@
+# Standard library imports
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional
+
+# Third-party imports
+from sqlmodel import select, delete, func, case, and_, or_
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+# Local application imports
+from src.models.model import Goal, GoalStats, GoalProgress, Task
+
+# Task columns that feed the per-goal totals.
+GOAL_STATS_TASK_COLUMNS = ("goal_id", "status", "duration_seconds")
+
+# GoalStats counter column for each task status; other statuses only count in total_tasks.
+STATUS_COLUMNS = {
+    "Not Started": "not_started",
+    "In Progress": "in_progress",
+    "Completed": "completed",
+}
+
+COUNTER_COLUMNS = ("total_tasks", "not_started", "in_progress", "completed", "total_duration_seconds")
+
+def add_goal_stats_delta(deltas: Dict[int, Dict[str, int]], task: Mapping[str, Any], sign: int) -> None:
+    """
+    Adds (``sign=1``) or removes (``sign=-1``) one task's contribution to per-goal deltas.
+
+    Args:
+        deltas (Dict[int, Dict[str, int]]): The accumulated deltas, keyed by goal id.
+        task (Mapping[str, Any]): The task's ``goal_id``, ``status`` and ``duration_seconds``.
+        sign (int): 1 when the task is added to its goal, -1 when it is removed.
+    """
+    goal_id = task.get("goal_id")
+    if goal_id is None:
+        return
+    delta = deltas.setdefault(goal_id, dict.fromkeys(COUNTER_COLUMNS, 0))
+    delta["total_tasks"] += sign
+    status_column = STATUS_COLUMNS.get(task.get("status"))
+    if status_column:
+        delta[status_column] += sign
+    delta["total_duration_seconds"] += sign * int(task.get("duration_seconds") or 0)
+
+async def apply_goal_stats(session: AsyncSession, deltas: Dict[int, Dict[str, int]]) -> None:
+    """
+    Applies per-goal deltas to the goal_stats table with one upsert statement.
+
+    Args:
+        session (AsyncSession): The session of the task write, so both commit together.
+        deltas (Dict[int, Dict[str, int]]): The deltas built by add_goal_stats_delta.
+    """
+    rows = [{"goal_id": goal_id, **delta} for goal_id, delta in deltas.items() if any(delta.values())]
+    if not rows:
+        return
+    stmt = sqlite_insert(GoalStats)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["goal_id"],
+        set_={column: getattr(GoalStats, column) + stmt.excluded[column] for column in COUNTER_COLUMNS},
+    )
+    await session.exec(stmt, params=rows)
+
+def _task_totals() -> list:
+    """Aggregate expressions matching the GoalStats counters."""
+    return [
+        func.count(Task.id).label("total_tasks"),
+        *[
+            func.coalesce(func.sum(case((Task.status == status, 1), else_=0)), 0).label(column)
+            for status, column in STATUS_COLUMNS.items()
+        ],
+        func.coalesce(func.sum(Task.duration_seconds), 0).label("total_duration_seconds"),
+    ]
+
+def _overdue_condition(now: datetime):
+    return and_(
+        or_(Task.status.is_(None), Task.status != "Completed"),
+        Task.due_date < now,
+    )
+
+async def rebuild_goal_stats(session: AsyncSession) -> int:
+    """
+    Recomputes the whole goal_stats table from the task table.
+
+    Args:
+        session (AsyncSession): The session to run in; the caller commits.
+
+    Returns:
+        int: The number of goals with tasks.
+    """
+    await session.exec(delete(GoalStats))
+    stmt = select(Task.goal_id, *_task_totals()).where(Task.goal_id.is_not(None)).group_by(Task.goal_id)
+    rows = [dict(row._mapping) for row in await session.exec(stmt)]
+    if rows:
+        await session.exec(sqlite_insert(GoalStats), params=rows)
+    return len(rows)
+
+async def compute_progress(session: AsyncSession, goal_id: Optional[int] = None, use_summary: bool = False, now: Optional[datetime] = None) -> List[GoalProgress]:
+    """
+    Computes goal progress with grouped SQL.
+
+    Without the summary table, tasks are grouped per goal through the (goal_id, status)
+    index. With it, counts come from goal_stats, one row per goal. The overdue count
+    depends on the current time, so it is always computed from overdue tasks only.
+
+    Args:
+        session (AsyncSession): The session to run in.
+        goal_id (Optional[int]): A single goal, or None for every goal.
+        use_summary (bool): Whether to read the counts from goal_stats.
+        now (Optional[datetime]): The reference time for overdue tasks. Defaults to now.
+
+    Returns:
+        List[GoalProgress]: The progress of each goal, ordered by goal id.
+    """
+    now = now or datetime.now()
+    if use_summary:
+        stmt = (
+            select(Goal.id, *[func.coalesce(getattr(GoalStats, column), 0).label(column) for column in COUNTER_COLUMNS])
+            .select_from(Goal)
+            .outerjoin(GoalStats, GoalStats.goal_id == Goal.id)
+        )
+    else:
+        stmt = (
+            select(Goal.id, *_task_totals())
+            .select_from(Goal)
+            .outerjoin(Task, Task.goal_id == Goal.id)
+            .group_by(Goal.id)
+        )
+    overdue_stmt = select(Task.goal_id, func.count(Task.id)).where(_overdue_condition(now)).group_by(Task.goal_id)
+    if goal_id is not None:
+        stmt = stmt.where(Goal.id == goal_id)
+        overdue_stmt = overdue_stmt.where(Task.goal_id == goal_id)
+
+    overdue = dict((await session.exec(overdue_stmt)).all())
+    progress = []
+    for row in await session.exec(stmt.order_by(Goal.id)):
+        values = dict(row._mapping)
+        current_goal_id = values.pop("id")
+        progress.append(GoalProgress(goal_id=current_goal_id, overdue=overdue.get(current_goal_id, 0), **values))
+    return progress
@@ -0,0 +1,94 @@
+# Standard library imports
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+# Third-party imports
+from sqlmodel import select, func, and_, or_
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Local application imports
+from src.models.model import TaskHistory
+
+# change_type of a full snapshot of a task, stored in new_state.
+CHECKPOINT = "Checkpoint"
+# change_type of a field-level change; new_state holds the changed fields only.
+UPDATE = "Update"
+
+def _after(created_at: datetime, entry_id: int):
+    """Entries written after the given one, in (created_at, id) order."""
+    return or_(
+        TaskHistory.created_at > created_at,
+        and_(TaskHistory.created_at == created_at, TaskHistory.id > entry_id),
+    )
+
+async def _latest_checkpoint(session: AsyncSession, task_id: int, at: Optional[datetime] = None) -> Optional[TaskHistory]:
+    stmt = select(TaskHistory).where(TaskHistory.task_id == task_id, TaskHistory.change_type == CHECKPOINT)
+    if at is not None:
+        stmt = stmt.where(TaskHistory.created_at <= at)
+    stmt = stmt.order_by(TaskHistory.created_at.desc(), TaskHistory.id.desc()).limit(1)
+    return (await session.exec(stmt)).first()
+
+async def changes_since_checkpoint(session: AsyncSession, task_id: int, queued: Sequence[str] = ()) -> Optional[int]:
+    """
+    Counts the updates recorded for a task after its latest checkpoint.
+
+    Entries queued on a TaskHistoryWriter are not in the table yet, so their
+    change types are passed as ``queued``, oldest first, and counted too. When
+    they hold a checkpoint the table is not read at all.
+
+    Args:
+        session (AsyncSession): The session to run in.
+        task_id (int): The task.
+        queued (Sequence[str]): The change types of the task's entries not written yet.
+
+    Returns:
+        Optional[int]: The number of updates, or None if the task has no checkpoint yet.
+    """
+    queued = list(queued)
+    if CHECKPOINT in queued:
+        after_checkpoint = queued[len(queued) - queued[::-1].index(CHECKPOINT):]
+        return after_checkpoint.count(UPDATE)
+    checkpoint = await _latest_checkpoint(session, task_id)
+    if checkpoint is None:
+        return None
+    stmt = select(func.count(TaskHistory.id)).where(
+        TaskHistory.task_id == task_id,
+        TaskHistory.change_type == UPDATE,
+        _after(checkpoint.created_at, checkpoint.id),
+    )
+    return (await session.exec(stmt)).one() + queued.count(UPDATE)
+
+async def state_at(session: AsyncSession, task_id: int, at: datetime) -> Optional[Dict[str, Any]]:
+    """
+    Rebuilds a task's state at a point in time from its history.
+
+    Starts from the latest checkpoint at or before ``at`` and applies the field
+    changes recorded after it, up to ``at``. Both lookups are range scans of the
+    (task_id, created_at) index.
+
+    Args:
+        session (AsyncSession): The session to run in.
+        task_id (int): The task.
+        at (datetime): The point in time.
+
+    Returns:
+        Optional[Dict[str, Any]]: The state, with dates as ISO 8601 strings, or None
+            if no checkpoint precedes ``at``.
+    """
+    checkpoint = await _latest_checkpoint(session, task_id, at)
+    if checkpoint is None:
+        return None
+    state = dict(checkpoint.new_state or {})
+    stmt = (
+        select(TaskHistory.new_state)
+        .where(
+            TaskHistory.task_id == task_id,
+            TaskHistory.change_type == UPDATE,
+            TaskHistory.created_at <= at,
+            _after(checkpoint.created_at, checkpoint.id),
+        )
+        .order_by(TaskHistory.created_at, TaskHistory.id)
+    )
+    for changes in await session.exec(stmt):
+        state.update(changes or {})
+    return state
@@ -0,0 +1,175 @@
+# Standard library imports
+import asyncio
+import logging
+from collections import deque
+from datetime import date, datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Local application imports
+from src.models.model import TaskHistory
+from src.services.unit_of_work import clear_current_session
+
+logger = logging.getLogger(__name__)
+
+# Queue markers; they are not written, only counted as processed.
+_FLUSH = object()
+_STOP = object()
+
+def to_json_state(values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts field values into a JSON-serialisable state dict.
+
+    Dates and datetimes are stored as ISO 8601 strings.
+
+    Args:
+        values (Dict[str, Any]): The field values to store.
+
+    Returns:
+        Dict[str, Any]: The state, ready for a TaskHistory JSON column.
+    """
+    return {
+        key: value.isoformat() if isinstance(value, (date, datetime)) else value
+        for key, value in values.items()
+    }
+
+class TaskHistoryWriter:
+    """
+    An append-only, batched writer for TaskHistory rows.
+
+    Entries are put on a bounded in-process queue and written by one background task
+    through the bulk insert path, one transaction per batch. A batch is written once
+    it holds ``batch_size`` entries or ``flush_interval`` seconds after its first
+    entry, whichever comes first. When the queue is full, ``record`` waits, which
+    applies backpressure to the writers producing history. ``stop`` drains everything
+    queued before it, so no recorded entry is lost on an orderly shutdown.
+
+    The change types of the entries queued for each task are tracked until they
+    are written, so callers counting a task's history, such as the delta mode of
+    TaskManager, can include the entries that are not in the table yet.
+    """
+
+    def __init__(self, manager=None, batch_size: int = 200, flush_interval: float = 0.5, max_queue: int = 10000):
+        """
+        Initializes the writer.
+
+        Args:
+            manager: The TaskHistoryManager used for the bulk inserts. Defaults to a new one.
+            batch_size (int): The maximum number of entries written per transaction.
+            flush_interval (float): The maximum seconds an entry waits before being written.
+            max_queue (int): The number of queued entries at which ``record`` blocks.
+        """
+        if manager is None:
+            from src.models.db_manager import TaskHistoryManager
+            manager = TaskHistoryManager()
+        self._manager = manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._queued: Dict[int, Deque[str]] = {}
+        self.written = 0
+        self.failed = 0
+
+    async def __aenter__(self) -> "TaskHistoryWriter":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    @property
+    def stopped(self) -> bool:
+        """Whether stop was called; a stopped writer refuses new entries."""
+        return self._closed
+
+    def start(self) -> None:
+        """Starts the background writer task if it is not running."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def record(self, entry: TaskHistory) -> None:
+        """Queues an entry, waiting while the queue is full."""
+        if self._closed:
+            raise RuntimeError("TaskHistoryWriter is stopped")
+        if entry.created_at is None:
+            entry.created_at = datetime.now()
+        self.start()
+        await self._queue.put(entry)
+        # Tracked once queued; the writer task cannot have taken it before this line runs.
+        if entry.task_id is not None:
+            self._queued.setdefault(entry.task_id, deque()).append(entry.change_type)
+
+    def queued_change_types(self, task_id: int) -> Tuple[str, ...]:
+        """Returns the change types of a task's entries that are queued but not written yet, oldest first."""
+        return tuple(self._queued.get(task_id, ()))
+
+    async def flush(self) -> None:
+        """Writes every entry queued so far and waits until they are committed."""
+        if self._task is None:
+            return
+        await self._queue.put(_FLUSH)
+        await self._queue.join()
+
+    async def stop(self) -> None:
+        """Writes every queued entry and stops the background task."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is None:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        # The task is created from a caller's context; never write on its unit of work.
+        clear_current_session()
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            taken = 1
+            batch: List[TaskHistory] = []
+            deadline = loop.time() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                if item is _FLUSH:
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                taken += 1
+            if batch:
+                await self._write(batch)
+            for _ in range(taken):
+                self._queue.task_done()
+
+    async def _write(self, batch: List[TaskHistory]) -> None:
+        try:
+            await self._manager.create_task_histories(batch)
+            self.written += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"Failed to write {len(batch)} task history entries: {e}")
+        finally:
+            for entry in batch:
+                self._forget(entry)
+
+    def _forget(self, entry: TaskHistory) -> None:
+        """Stops tracking a written or dropped entry; batches leave the queue oldest first."""
+        queued = self._queued.get(entry.task_id)
+        if queued is None:
+            return
+        queued.popleft()
+        if not queued:
+            del self._queued[entry.task_id]
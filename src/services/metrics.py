@@ -0,0 +1,320 @@
+# Standard library imports
+import bisect
+import functools
+import inspect
+import logging
+import os
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+# Third-party imports
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+slow_query_logger = logging.getLogger(f"{__name__}.slow_query")
+
+# Instrumentation is configured from the environment at import and by configure(), e.g.
+#   SMARTTASKER_METRICS=1
+#   SMARTTASKER_SLOW_QUERY_MS=200
+METRICS_ENV = "SMARTTASKER_METRICS"
+SLOW_QUERY_ENV = "SMARTTASKER_SLOW_QUERY_MS"
+
+# Upper bounds, in seconds, of the histogram buckets; slower values go in a last, open bucket.
+BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+# Longest parameter text kept per slow query; executemany parameters can be large.
+MAX_PARAMETERS_LENGTH = 1000
+
+class Settings:
+    """
+    The instrumentation switches.
+
+    Attributes:
+        enabled (bool): Whether instrumented methods and statements are recorded.
+        slow_query_seconds (Optional[float]): Statements slower than this are logged; None turns
+            the slow-query log off.
+        log_parameters (bool): Whether the slow-query log includes the statement parameters.
+    """
+    __slots__ = ("enabled", "slow_query_seconds", "log_parameters")
+
+    def __init__(self):
+        self.enabled = os.environ.get(METRICS_ENV, "") not in ("", "0", "false")
+        slow_query_ms = os.environ.get(SLOW_QUERY_ENV)
+        self.slow_query_seconds = float(slow_query_ms) / 1000 if slow_query_ms else None
+        self.log_parameters = True
+
+settings = Settings()
+
+class Histogram:
+    """A fixed-bucket histogram of durations in seconds."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction: float) -> float:
+        """Returns the upper bound of the bucket holding the given fraction of values, capped at the max."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return min(BUCKETS[index], self.max) if index < len(BUCKETS) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+            "buckets": dict(zip([*map(str, BUCKETS), "inf"], self.counts)),
+        }
+
+class MethodMetrics:
+    """
+    What was recorded for one instrumented method.
+
+    Attributes:
+        calls (int): Calls, including the failed ones.
+        errors (int): Calls that raised.
+        statements (int): SQL statements executed during the calls.
+        rows (int): Rows returned or affected, as counted from the return values.
+        duration (Histogram): Wall-clock time per call.
+        db_time (Histogram): Time per call spent executing statements.
+        pool_wait (Histogram): Time per call spent acquiring connections from the pool.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.statements = 0
+        self.rows = 0
+        self.duration = Histogram()
+        self.db_time = Histogram()
+        self.pool_wait = Histogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "statements": self.statements,
+            "rows": self.rows,
+            "duration": self.duration.snapshot(),
+            "db_time": self.db_time.snapshot(),
+            "pool_wait": self.pool_wait.snapshot(),
+        }
+
+class MetricsRegistry:
+    """
+    The in-process store of recorded metrics.
+
+    Methods are keyed by ``Class.method``. Every statement also feeds the
+    ``statements`` histogram, also when it runs outside an instrumented method, and
+    the last ``max_slow_queries`` slow statements are kept in ``slow_queries``.
+    """
+
+    def __init__(self, max_slow_queries: int = 100):
+        self.methods: Dict[str, MethodMetrics] = {}
+        self.statements = Histogram()
+        self.slow_queries: Deque[Dict[str, Any]] = deque(maxlen=max_slow_queries)
+
+    def method(self, name: str) -> MethodMetrics:
+        metrics = self.methods.get(name)
+        if metrics is None:
+            metrics = self.methods[name] = MethodMetrics()
+        return metrics
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns everything recorded as plain data, e.g. for JSON."""
+        return {
+            "methods": {name: metrics.snapshot() for name, metrics in sorted(self.methods.items())},
+            "statements": self.statements.snapshot(),
+            "slow_queries": list(self.slow_queries),
+        }
+
+    def reset(self) -> None:
+        self.methods.clear()
+        self.statements = Histogram()
+        self.slow_queries.clear()
+
+registry = MetricsRegistry()
+
+def configure(enabled: Optional[bool] = None, slow_query_ms: Optional[float] = None, log_parameters: Optional[bool] = None) -> None:
+    """
+    Changes the instrumentation switches; arguments left as None keep their value.
+
+    Args:
+        enabled (Optional[bool]): Whether to record method and statement metrics.
+        slow_query_ms (Optional[float]): The slow-query threshold in milliseconds; a
+            negative value turns the slow-query log off.
+        log_parameters (Optional[bool]): Whether slow queries are logged with their parameters.
+    """
+    if enabled is not None:
+        settings.enabled = enabled
+    if slow_query_ms is not None:
+        settings.slow_query_seconds = slow_query_ms / 1000 if slow_query_ms >= 0 else None
+    if log_parameters is not None:
+        settings.log_parameters = log_parameters
+
+class _Call:
+    """The counters of one instrumented call in progress."""
+    __slots__ = ("statements", "db_time", "pool_wait")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_time = 0.0
+        self.pool_wait = 0.0
+
+# Instrumented calls in progress in the current context, innermost last.
+_calls: ContextVar[Tuple[_Call, ...]] = ContextVar("smarttasker_metrics_calls", default=())
+
+def _count_rows(result: Any) -> int:
+    if result is None:
+        return 0
+    if isinstance(result, (bool, int)):
+        return int(result)
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    return 1
+
+def _record(name: str, call: _Call, started: float, rows: int, failed: bool) -> None:
+    metrics = registry.method(name)
+    metrics.calls += 1
+    metrics.errors += failed
+    metrics.statements += call.statements
+    metrics.rows += rows
+    metrics.duration.observe(time.perf_counter() - started)
+    metrics.db_time.observe(call.db_time)
+    metrics.pool_wait.observe(call.pool_wait)
+
+def instrument(func: Callable) -> Callable:
+    """
+    Records calls of an async method or async generator method in the registry.
+
+    The method is recorded as ``<class of self>.<method name>``, so a BaseManager
+    method called on a TaskManager is recorded as ``TaskManager.<name>``. Statements
+    run by nested instrumented calls also count towards the outer call. When
+    instrumentation is disabled the wrapper only checks the switch.
+    """
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        async def _generator_wrapper(self, *args, **kwargs):
+            if not settings.enabled:
+                async for item in func(self, *args, **kwargs):
+                    yield item
+                return
+            call = _Call()
+            started = time.perf_counter()
+            rows = 0
+            failed = True
+            generator = func(self, *args, **kwargs)
+            try:
+                while True:
+                    # The call is only current while the generator runs, not while the
+                    # consumer holds an item, so the consumer's statements are not counted.
+                    token = _calls.set(_calls.get() + (call,))
+                    try:
+                        item = await generator.__anext__()
+                    except StopAsyncIteration:
+                        failed = False
+                        break
+                    finally:
+                        _calls.reset(token)
+                    rows += 1
+                    try:
+                        yield item
+                    except GeneratorExit:
+                        # The consumer stopped early, which is not an error.
+                        failed = False
+                        raise
+            finally:
+                await generator.aclose()
+                _record(f"{type(self).__name__}.{func.__name__}", call, started, rows, failed)
+        return _generator_wrapper
+
+    @functools.wraps(func)
+    async def _wrapper(self, *args, **kwargs):
+        if not settings.enabled:
+            return await func(self, *args, **kwargs)
+        call = _Call()
+        token = _calls.set(_calls.get() + (call,))
+        started = time.perf_counter()
+        result = None
+        failed = True
+        try:
+            result = await func(self, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            _calls.reset(token)
+            _record(f"{type(self).__name__}.{func.__name__}", call, started, _count_rows(result), failed)
+    return _wrapper
+
+async def acquire_connection(session) -> None:
+    """
+    Checks out the session's connection, recording the wait when a call is instrumented.
+
+    Sessions connect lazily on their first statement; calling this first separates
+    the time spent waiting for a pooled connection from the statement time.
+    """
+    calls = _calls.get()
+    if not settings.enabled or not calls:
+        return
+    started = time.perf_counter()
+    await session.connection()
+    waited = time.perf_counter() - started
+    for call in calls:
+        call.pool_wait += waited
+
+def _format_parameters(parameters: Any) -> str:
+    text = repr(parameters)
+    if len(text) > MAX_PARAMETERS_LENGTH:
+        text = text[:MAX_PARAMETERS_LENGTH] + "..."
+    return text
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if settings.enabled or settings.slow_query_seconds is not None:
+        conn.info["smarttasker_query_started"] = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.pop("smarttasker_query_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    if settings.enabled:
+        registry.statements.observe(elapsed)
+        for call in _calls.get():
+            call.statements += 1
+            call.db_time += elapsed
+    threshold = settings.slow_query_seconds
+    if threshold is not None and elapsed >= threshold:
+        entry = {"statement": statement, "seconds": elapsed, "executemany": executemany}
+        if settings.log_parameters:
+            entry["parameters"] = _format_parameters(parameters)
+        registry.slow_queries.append(entry)
+        slow_query_logger.warning(
+            "Slow query (%.1f ms): %s%s", elapsed * 1000, statement,
+            f" parameters={entry['parameters']}" if settings.log_parameters else "",
+        )
+
+def install_instrumentation(engine: AsyncEngine) -> None:
+    """Registers the statement timing hooks on an engine; db_setup does this for every engine it creates."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,218 @@
+# Standard library imports
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Local application imports
+from src.models.model import TaskNotification
+from src.services.unit_of_work import clear_current_session
+
+logger = logging.getLogger(__name__)
+
+async def log_notification(notification: TaskNotification) -> None:
+    """The default handler: logs the notification."""
+    logger.info(f"Notification {notification.id} for task {notification.task_id}: {notification.name}")
+
+class NotificationDispatcher:
+    """
+    Sends task notifications when they are due, from an in-memory timer heap.
+
+    On start the heap is seeded once from the indexed query of unsent rows. After
+    that, notifications created, changed or deleted through a TaskNotificationManager
+    given this dispatcher are pushed to the heap directly, so the table is never
+    polled. A background task sleeps until the earliest notification is due, passes
+    it to the handler, and stamps ``sent_at`` through per-row bulk updates, one
+    transaction per ``batch_size`` notifications or ``flush_interval`` seconds.
+
+    A notification whose handler raises is queued again after ``retry_delay``
+    seconds, doubled on each further failure. After ``max_attempts`` failed attempts
+    it is dropped unstamped, so it is sent again by the next dispatcher started.
+    Changed notifications leave stale heap entries behind; they are skipped when
+    popped instead of being searched for and removed, and the heap is rebuilt from
+    the pending notifications once the stale entries outnumber them.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[TaskNotification], Awaitable[None]] = log_notification,
+        manager=None,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        clock: Callable[[], datetime] = datetime.now,
+        max_attempts: int = 5,
+        retry_delay: float = 1.0,
+    ):
+        """
+        Initializes the dispatcher.
+
+        Args:
+            handler (Callable[[TaskNotification], Awaitable[None]]): Sends one notification.
+            manager: The TaskNotificationManager used to read and stamp rows. Defaults to a new one.
+            batch_size (int): The maximum number of ``sent_at`` stamps written per transaction.
+            flush_interval (float): The maximum seconds a stamp waits before being written.
+            clock (Callable[[], datetime]): The current time, comparable with ``notify_at``.
+            max_attempts (int): The number of times a notification is passed to the handler
+                before it is dropped.
+            retry_delay (float): The seconds before a failed notification is retried; the
+                delay doubles after each failed attempt.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if manager is None:
+            from src.models.db_manager import TaskNotificationManager
+            manager = TaskNotificationManager()
+        self._manager = manager
+        self._handler = handler
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        # (due time, id) entries; _pending holds the current due time and row of each id.
+        self._heap: List[Tuple[datetime, int]] = []
+        self._pending: Dict[int, Tuple[datetime, TaskNotification]] = {}
+        # Failed attempts of each notification being retried.
+        self._attempts: Dict[int, int] = {}
+        self._stamps: List[Dict[str, Any]] = []
+        self._flush_deadline: Optional[float] = None
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.sent = 0
+        self.failed = 0
+
+    async def __aenter__(self) -> "NotificationDispatcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def start(self) -> None:
+        """Seeds the heap from the unsent rows and starts the background task."""
+        if self._task is not None:
+            return
+        for notification in await self._manager.get_unsent_task_notifications():
+            self.schedule(notification)
+        self._stopping = False
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the background task and writes the pending ``sent_at`` stamps."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    def schedule(self, notification: TaskNotification) -> None:
+        """Adds or reschedules a notification; sent ones are removed instead."""
+        if notification.sent_at is not None:
+            self.cancel(notification.id)
+            return
+        self._attempts.pop(notification.id, None)
+        self._push(notification.notify_at or datetime.min, notification)
+
+    def cancel(self, notification_id: int) -> None:
+        """Removes a notification, e.g. after it was deleted."""
+        self._pending.pop(notification_id, None)
+        self._attempts.pop(notification_id, None)
+        self._compact()
+
+    async def flush(self) -> None:
+        """Writes the pending ``sent_at`` stamps now."""
+        stamps, self._stamps = self._stamps, []
+        self._flush_deadline = None
+        if not stamps:
+            return
+        try:
+            await self._manager.update_task_notification_rows(stamps)
+        except Exception as e:
+            logger.error(f"Failed to stamp {len(stamps)} sent notifications: {e}")
+
+    def _next_timeout(self, loop: asyncio.AbstractEventLoop) -> Optional[float]:
+        timeouts = []
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+        if self._heap:
+            timeouts.append((self._heap[0][0] - self._clock()).total_seconds())
+        if self._flush_deadline is not None:
+            timeouts.append(self._flush_deadline - loop.time())
+        return max(min(timeouts), 0) if timeouts else None
+
+    def _push(self, due: datetime, notification: TaskNotification) -> None:
+        self._pending[notification.id] = (due, notification)
+        heapq.heappush(self._heap, (due, notification.id))
+        if self._heap[0] == (due, notification.id):
+            self._wakeup.set()
+        self._compact()
+
+    def _compact(self) -> None:
+        """Rebuilds the heap from the pending notifications once most of its entries are stale."""
+        if len(self._heap) - len(self._pending) <= len(self._pending):
+            return
+        self._heap = [(due, notification_id) for notification_id, (due, _) in self._pending.items()]
+        heapq.heapify(self._heap)
+
+    def _retry(self, notification: TaskNotification) -> None:
+        """Queues a failed notification again with exponential backoff, or drops it after max_attempts."""
+        attempts = self._attempts.get(notification.id, 0) + 1
+        if attempts >= self.max_attempts:
+            self._attempts.pop(notification.id, None)
+            logger.error(f"Dropped notification {notification.id} after {attempts} failed attempts")
+            return
+        self._attempts[notification.id] = attempts
+        delay = timedelta(seconds=self.retry_delay * 2 ** (attempts - 1))
+        self._push(self._clock() + delay, notification)
+
+    def _is_stale(self, entry: Tuple[datetime, int]) -> bool:
+        current = self._pending.get(entry[1])
+        return current is None or current[0] != entry[0]
+
+    async def _run(self) -> None:
+        # The task is created from a caller's context; never write on its unit of work.
+        clear_current_session()
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            timeout = self._next_timeout(loop)
+            self._wakeup.clear()
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            await self._fire_due()
+            if len(self._stamps) >= self.batch_size or (
+                self._flush_deadline is not None and self._flush_deadline <= loop.time()
+            ):
+                await self.flush()
+        await self.flush()
+
+    async def _fire_due(self) -> None:
+        now = self._clock()
+        loop = asyncio.get_running_loop()
+        while self._heap and self._heap[0][0] <= now and len(self._stamps) < self.batch_size:
+            entry = heapq.heappop(self._heap)
+            if self._is_stale(entry):
+                continue
+            _, notification = self._pending.pop(entry[1])
+            try:
+                await self._handler(notification)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Failed to send notification {notification.id}: {e}")
+                self._retry(notification)
+                continue
+            self._attempts.pop(notification.id, None)
+            self.sent += 1
+            sent_at = self._clock()
+            notification.sent_at = sent_at
+            self._stamps.append({"id": notification.id, "sent_at": sent_at})
+            if self._flush_deadline is None:
+                self._flush_deadline = loop.time() + self.flush_interval
@@ -0,0 +1,78 @@
+# Standard library imports
+from typing import Any, Optional, Tuple
+
+# Third-party imports
+from sqlmodel import select, and_, or_
+
+def parse_order_by(model: Any, order_by: Optional[str] = None) -> Tuple[Any, bool]:
+    """
+    Resolves an ``order_by`` column name to a model column.
+
+    Args:
+        model: The model class being paged.
+        order_by (Optional[str]): A column name, prefixed with ``-`` for descending order.
+            Defaults to the primary key.
+
+    Returns:
+        Tuple[Any, bool]: The column and whether the order is descending.
+    """
+    descending = False
+    name = order_by or "id"
+    if name.startswith("-"):
+        descending = True
+        name = name[1:]
+    if name not in model.__table__.columns:
+        raise ValueError(f"Cannot order {model.__name__} by unknown column '{name}'")
+    return getattr(model, name), descending
+
+def keyset_select(model: Any, order_by: Optional[str] = None, after: Optional[Tuple[Any, Any]] = None, limit: int = 100):
+    """
+    Builds a keyset-paginated SELECT for one page of ``model`` rows.
+
+    Rows are ordered by ``(order_by, id)`` so pages are stable even when the ordering
+    column has duplicates. The position of the previous page is passed as ``after`` and
+    compared in the WHERE clause, so no OFFSET scan is needed. NULLs sort first in
+    ascending order and last in descending order, as SQLite does.
+
+    Args:
+        model: The model class being paged.
+        order_by (Optional[str]): The ordering column name, ``-`` prefixed for descending.
+        after (Optional[Tuple[Any, Any]]): ``(order value, id)`` of the last row already seen.
+        limit (int): The maximum number of rows in the page.
+
+    Returns:
+        The SELECT statement for the page.
+    """
+    column, descending = parse_order_by(model, order_by)
+    pk = model.id
+    stmt = select(model)
+
+    if after is not None:
+        last_value, last_id = after
+        if column is pk:
+            stmt = stmt.where(pk < last_id if descending else pk > last_id)
+        elif not descending:
+            if last_value is None:
+                stmt = stmt.where(or_(and_(column.is_(None), pk > last_id), column.is_not(None)))
+            else:
+                stmt = stmt.where(or_(column > last_value, and_(column == last_value, pk > last_id)))
+        else:
+            if last_value is None:
+                stmt = stmt.where(and_(column.is_(None), pk < last_id))
+            else:
+                stmt = stmt.where(
+                    or_(column < last_value, and_(column == last_value, pk < last_id), column.is_(None))
+                )
+
+    if column is pk:
+        stmt = stmt.order_by(pk.desc() if descending else pk)
+    elif descending:
+        stmt = stmt.order_by(column.desc(), pk.desc())
+    else:
+        stmt = stmt.order_by(column, pk)
+    return stmt.limit(limit)
+
+def keyset_position(item: Any, order_by: Optional[str] = None) -> Tuple[Any, Any]:
+    """Returns the ``(order value, id)`` position of a row for use as ``after``."""
+    name = (order_by or "id").lstrip("-")
+    return getattr(item, name), item.id
@@ -0,0 +1,48 @@
+# Standard library imports
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Iterable, List, Sequence, Tuple
+
+# Local application imports
+from src.services.columns import check_columns
+
+# Columns of a list view when no fields are given.
+DEFAULT_FIELDS = {
+    "task": ("id", "name", "status", "due_date"),
+    "goal": ("id", "name", "status"),
+}
+
+def resolve_fields(model: type, fields: Iterable[str] = None) -> Tuple[str, ...]:
+    """
+    Returns the validated projection fields, or the model's default list fields.
+
+    Raises:
+        ValueError: If a field is not a column, e.g. a typo or a relationship.
+    """
+    if fields is None:
+        return DEFAULT_FIELDS.get(model.__tablename__, ("id",))
+    fields = tuple(fields)
+    if not fields:
+        raise ValueError("At least one field is needed")
+    check_columns(model, dict.fromkeys(fields))
+    return fields
+
+@lru_cache(maxsize=None)
+def record_type(model: type, fields: Tuple[str, ...]) -> type:
+    """
+    Returns the record class of a projection, e.g. ``TaskRecord(id, name, status, due_date)``.
+
+    Records are named tuples: read-only, without a per-instance ``__dict__``
+    (``__slots__ = ()``), and built straight from result rows. One class is made
+    per model and field list.
+    """
+    return namedtuple(f"{model.__name__}Record", fields)
+
+def select_columns(model: type, fields: Sequence[str]) -> List[Any]:
+    """Returns the model columns of a projection, for ``select(*columns)``."""
+    return [getattr(model, name) for name in fields]
+
+def to_records(model: type, fields: Tuple[str, ...], rows: Iterable[Sequence[Any]]) -> List[Any]:
+    """Builds the records of a projection from result rows in ``fields`` order."""
+    make = record_type(model, fields)._make
+    return [make(row) for row in rows]
@@ -0,0 +1,292 @@
+# Standard library imports
+import calendar
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Hashable, Iterator, Optional, Tuple
+
+# Local application imports
+from src.services.cache import LRUCache
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+class RecurrenceRule:
+    """
+    A parsed recurrence rule.
+
+    Attributes:
+        freq (str): One of FREQUENCIES.
+        interval (int): The number of periods between occurrences.
+        count (Optional[int]): The total number of occurrences, if bounded.
+        until (Optional[datetime]): The last possible occurrence time, inclusive.
+        byday (Tuple[int, ...]): Sorted weekday numbers (Monday is 0) for weekly rules.
+    """
+    __slots__ = ("freq", "interval", "count", "until", "byday")
+
+    def __init__(self, freq: str, interval: int = 1, count: Optional[int] = None, until: Optional[datetime] = None, byday: Tuple[int, ...] = ()):
+        self.freq = freq
+        self.interval = interval
+        self.count = count
+        self.until = until
+        self.byday = byday
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RecurrenceRule) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self) -> str:
+        return f"RecurrenceRule({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)})"
+
+def _parse_until(value: str) -> datetime:
+    for fmt in ("%Y%m%dT%H%M%SZ", "%Y%m%dT%H%M%S", "%Y%m%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid UNTIL value: {value}")
+
+@lru_cache(maxsize=4096)
+def parse_rule(text: str) -> RecurrenceRule:
+    """
+    Parses a recurrence rule in a subset of the iCalendar RRULE syntax.
+
+    Supported parts are FREQ (DAILY, WEEKLY, MONTHLY, YEARLY), INTERVAL, COUNT,
+    UNTIL (``YYYYMMDD`` or ``YYYYMMDDTHHMMSS``) and BYDAY for weekly rules, e.g.
+    ``FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;COUNT=10``. An ``RRULE:`` prefix is
+    accepted, and a bare frequency such as ``daily`` is read as ``FREQ=DAILY``.
+
+    Args:
+        text (str): The rule, as stored in Task.reccurence.
+
+    Returns:
+        RecurrenceRule: The parsed rule.
+
+    Raises:
+        ValueError: If the rule is malformed or uses an unsupported part.
+    """
+    body = text.strip()
+    if body.upper().startswith("RRULE:"):
+        body = body[len("RRULE:"):]
+    if body.upper() in FREQUENCIES:
+        body = f"FREQ={body}"
+
+    parts: Dict[str, str] = {}
+    for part in filter(None, body.split(";")):
+        key, sep, value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid recurrence rule part: {part}")
+        parts[key.strip().upper()] = value.strip().upper()
+
+    freq = parts.pop("FREQ", None)
+    if freq not in FREQUENCIES:
+        raise ValueError(f"Invalid recurrence frequency. Must be one of: {FREQUENCIES}")
+    try:
+        interval = int(parts.pop("INTERVAL", 1))
+        count = int(parts["COUNT"]) if "COUNT" in parts else None
+    except ValueError:
+        raise ValueError(f"Invalid recurrence rule: {text}")
+    parts.pop("COUNT", None)
+    if interval < 1 or (count is not None and count < 1):
+        raise ValueError("INTERVAL and COUNT must be positive")
+    until = _parse_until(parts.pop("UNTIL")) if "UNTIL" in parts else None
+    if count is not None and until is not None:
+        raise ValueError("COUNT and UNTIL cannot both be set")
+
+    byday: Tuple[int, ...] = ()
+    if "BYDAY" in parts:
+        if freq != "WEEKLY":
+            raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+        days = parts.pop("BYDAY").split(",")
+        if not days or any(day not in WEEKDAYS for day in days):
+            raise ValueError(f"Invalid BYDAY value. Days must be in: {WEEKDAYS}")
+        byday = tuple(sorted({WEEKDAYS.index(day) for day in days}))
+    if parts:
+        raise ValueError(f"Unsupported recurrence rule part(s): {', '.join(sorted(parts))}")
+    return RecurrenceRule(freq, interval, count, until, byday)
+
+def _ceil_div(numerator: int, denominator: int) -> int:
+    return -(-numerator // denominator)
+
+def _fixed_step(rule: RecurrenceRule, dtstart: datetime, window_start: Optional[datetime]) -> Iterator[Tuple[int, datetime]]:
+    """Daily and plain weekly rules: the k-th occurrence is ``dtstart + k * step``."""
+    step = timedelta(days=rule.interval * (7 if rule.freq == "WEEKLY" else 1))
+    k = 0
+    if window_start is not None and window_start > dtstart:
+        k = _ceil_div((window_start - dtstart) // timedelta(microseconds=1), step // timedelta(microseconds=1))
+    while True:
+        yield k, dtstart + k * step
+        k += 1
+
+def _weekly_byday(rule: RecurrenceRule, dtstart: datetime, window_start: Optional[datetime]) -> Iterator[Tuple[int, datetime]]:
+    """Weekly rules with BYDAY: the listed weekdays of every ``interval``-th week."""
+    week0 = dtstart - timedelta(days=dtstart.weekday())
+    period = timedelta(weeks=rule.interval)
+    days = rule.byday
+    # Occurrences in the first week are those on or after dtstart's weekday.
+    first_week = sum(1 for day in days if day >= dtstart.weekday())
+    p = 0
+    if window_start is not None and window_start > week0:
+        p = (window_start - week0) // period
+    while True:
+        week_start = week0 + p * period
+        index = 0 if p == 0 else first_week + (p - 1) * len(days)
+        for day in days:
+            if p == 0 and day < dtstart.weekday():
+                continue
+            yield index, week_start + timedelta(days=day)
+            index += 1
+        p += 1
+
+def _monthly(rule: RecurrenceRule, dtstart: datetime, window_start: Optional[datetime]) -> Iterator[Tuple[int, datetime]]:
+    """Monthly and yearly rules: the same day every ``interval`` months or years.
+
+    Months without that day (e.g. the 31st, or February 29th) are skipped.
+    """
+    step = rule.interval * (12 if rule.freq == "YEARLY" else 1)
+    origin = dtstart.year * 12 + dtstart.month - 1
+    # Past the 28th some periods are skipped, so an occurrence's index is only
+    # known by counting from the start; COUNT bounds that walk.
+    countable = dtstart.day <= 28
+    p = 0
+    if window_start is not None and (countable or rule.count is None):
+        p = max(((window_start.year * 12 + window_start.month - 1) - origin) // step, 0)
+    index = p
+    while True:
+        year, month = divmod(origin + p * step, 12)
+        if dtstart.day <= calendar.monthrange(year, month + 1)[1]:
+            yield index, dtstart.replace(year=year, month=month + 1)
+            index += 1
+        p += 1
+
+_EXPANDERS = {
+    "DAILY": _fixed_step,
+    "WEEKLY": _fixed_step,
+    "MONTHLY": _monthly,
+    "YEARLY": _monthly,
+}
+
+def iter_occurrences(rule: RecurrenceRule, dtstart: datetime, window_start: Optional[datetime] = None, window_end: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Lazily yields the occurrences of a rule within ``[window_start, window_end)``.
+
+    The expansion jumps arithmetically to the first period of the window instead of
+    walking from ``dtstart``, so a window years after the start costs the same as
+    the first one. Without ``window_end`` an unbounded rule yields forever.
+
+    Args:
+        rule (RecurrenceRule): The parsed rule.
+        dtstart (datetime): The first occurrence.
+        window_start (Optional[datetime]): The start of the window, inclusive.
+        window_end (Optional[datetime]): The end of the window, exclusive.
+
+    Yields:
+        datetime: The occurrences, in order.
+    """
+    expand = _weekly_byday if rule.byday else _EXPANDERS[rule.freq]
+    for index, occurrence in expand(rule, dtstart, window_start):
+        if rule.count is not None and index >= rule.count:
+            return
+        if rule.until is not None and occurrence > rule.until:
+            return
+        if window_end is not None and occurrence >= window_end:
+            return
+        if window_start is not None and occurrence < window_start:
+            continue
+        yield occurrence
+
+def series_end(rule_text: Optional[str], dtstart: Optional[datetime]) -> Optional[datetime]:
+    """
+    Returns a bound on the last occurrence of a series, or None if it never ends.
+
+    COUNT rules are expanded to their last occurrence; UNTIL rules end at their
+    UNTIL time, which no occurrence is after. A rule that cannot be parsed ends at
+    ``dtstart``, as TaskManager.get_occurrences treats it as a one-off task.
+
+    Args:
+        rule_text (Optional[str]): The recurrence rule, see parse_rule.
+        dtstart (Optional[datetime]): The first occurrence.
+
+    Returns:
+        Optional[datetime]: The series end, or None for an unbounded series.
+    """
+    if rule_text is None or dtstart is None:
+        return None
+    try:
+        rule = parse_rule(rule_text)
+    except ValueError:
+        return dtstart
+    if rule.count is None:
+        return rule.until
+    last = dtstart
+    for last in iter_occurrences(rule, dtstart):
+        pass
+    return last
+
+class OccurrenceCache:
+    """
+    Caches the expanded occurrences of tasks per requested window.
+
+    Each task's entry remembers the rule and start it was expanded from, so a task
+    whose rule or dates changed is expanded again even if ``invalidate`` was not
+    called for it. Tasks are evicted in LRU order, and each keeps its most recent
+    ``max_windows`` windows.
+    """
+
+    def __init__(self, max_tasks: int = 1024, max_windows: int = 8):
+        """
+        Initializes the cache.
+
+        Args:
+            max_tasks (int): The maximum number of tasks kept.
+            max_windows (int): The maximum number of windows kept per task.
+        """
+        self._cache = LRUCache(max_entries=max_tasks, ttl=None)
+        self.max_windows = max_windows
+
+    def occurrences(self, key: Hashable, rule_text: str, dtstart: datetime, window_start: datetime, window_end: datetime) -> Tuple[datetime, ...]:
+        """
+        Returns the occurrences of a task in ``[window_start, window_end)``.
+
+        Args:
+            key (Hashable): The task id.
+            rule_text (str): The task's recurrence rule.
+            dtstart (datetime): The task's first occurrence.
+            window_start (datetime): The start of the window, inclusive.
+            window_end (datetime): The end of the window, exclusive.
+
+        Returns:
+            Tuple[datetime, ...]: The occurrences, in order.
+
+        Raises:
+            ValueError: If the rule cannot be parsed.
+        """
+        signature = (rule_text, dtstart)
+        entry = self._cache.get(key)
+        if entry is None or entry[0] != signature:
+            entry = (signature, {})
+            self._cache.put(key, entry)
+        windows = entry[1]
+        window = (window_start, window_end)
+        result = windows.get(window)
+        if result is None:
+            result = tuple(iter_occurrences(parse_rule(rule_text), dtstart, window_start, window_end))
+            if len(windows) >= self.max_windows:
+                windows.pop(next(iter(windows)))
+            windows[window] = result
+        return result
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drops the cached expansions of a task."""
+        self._cache.invalidate(key)
+
+    def clear(self) -> None:
+        """Drops every cached expansion."""
+        self._cache.clear()
+
+    def stats(self):
+        """Returns the hit and miss counters of the per-task cache."""
+        return self._cache.stats()
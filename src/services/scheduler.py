@@ -0,0 +1,341 @@
+# Standard library imports
+import heapq
+import math
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Default priority of tasks without one; lower numbers are scheduled first.
+DEFAULT_PRIORITY = 3
+
+class IntervalSet:
+    """
+    Free time as sorted, disjoint, half-open ``[start, end)`` intervals in integer seconds.
+
+    The start and end points are kept in two parallel sorted lists, so locating the
+    interval containing a point is a binary search, and reserving or releasing a
+    span only rewrites the few intervals it touches.
+    """
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, start: int, end: int):
+        self._starts: List[int] = [start] if end > start else []
+        self._ends: List[int] = [end] if end > start else []
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self):
+        return iter(zip(self._starts, self._ends))
+
+    def find(self, earliest: int, duration: int) -> Optional[int]:
+        """Returns the earliest start >= ``earliest`` of a free span of ``duration`` seconds."""
+        starts, ends = self._starts, self._ends
+        i = max(bisect_right(starts, earliest) - 1, 0)
+        for j in range(i, len(starts)):
+            start = starts[j] if starts[j] > earliest else earliest
+            if ends[j] - start >= duration:
+                return start
+        return None
+
+    def reserve(self, start: int, end: int) -> None:
+        """Removes ``[start, end)`` from the free time."""
+        starts, ends = self._starts, self._ends
+        i = bisect_right(ends, start)
+        j = i
+        new_starts, new_ends = [], []
+        while j < len(starts) and starts[j] < end:
+            if starts[j] < start:
+                new_starts.append(starts[j])
+                new_ends.append(start)
+            if ends[j] > end:
+                new_starts.append(end)
+                new_ends.append(ends[j])
+            j += 1
+        starts[i:j] = new_starts
+        ends[i:j] = new_ends
+
+    def release(self, start: int, end: int) -> None:
+        """Adds ``[start, end)`` back to the free time, merging adjacent intervals."""
+        if end <= start:
+            return
+        starts, ends = self._starts, self._ends
+        i = bisect_left(ends, start)
+        j = i
+        while j < len(starts) and starts[j] <= end:
+            start = min(start, starts[j])
+            end = max(end, ends[j])
+            j += 1
+        starts[i:j] = [start]
+        ends[i:j] = [end]
+
+class SchedulableTask:
+    """The scheduling fields of a task, without ORM overhead."""
+    __slots__ = ("id", "priority", "due_date", "duration_seconds", "is_time_fixed", "start_date")
+
+    def __init__(
+        self,
+        id: int,
+        priority: Optional[int] = None,
+        due_date: Optional[datetime] = None,
+        duration_seconds: Optional[int] = None,
+        is_time_fixed: Optional[bool] = False,
+        start_date: Optional[datetime] = None,
+    ):
+        self.id = id
+        self.priority = priority
+        self.due_date = due_date
+        self.duration_seconds = duration_seconds
+        self.is_time_fixed = is_time_fixed
+        self.start_date = start_date
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "SchedulableTask":
+        """Builds a task from a mapping or result row with the task's column names."""
+        return cls(**{name: row.get(name) for name in cls.__slots__ if name in row})
+
+    @property
+    def fixed(self) -> bool:
+        return bool(self.is_time_fixed) and self.start_date is not None
+
+class Scheduler:
+    """
+    Places tasks into free time slots of a scheduling window.
+
+    Fixed-time tasks keep their start date and block their span. The other tasks
+    are taken from a heap ordered by priority (lower first), then due date, then id,
+    and each is placed in the earliest free span long enough for it, never before
+    its own start date. Placements are remembered, so ``reschedule`` and ``remove``
+    only reflow the slots a single change affects instead of the whole calendar.
+    """
+
+    def __init__(self, window_start: datetime, window_end: datetime, default_duration: timedelta = timedelta(minutes=30)):
+        """
+        Initializes an empty schedule.
+
+        Args:
+            window_start (datetime): The earliest time a task may be placed.
+            window_end (datetime): The time by which placed tasks must end.
+            default_duration (timedelta): The duration assumed for tasks without one.
+        """
+        if window_end <= window_start:
+            raise ValueError("window_end must be after window_start")
+        self.window_start = window_start
+        self.window_end = window_end
+        self._horizon = self._offset(window_end)
+        self._default_duration = int(default_duration.total_seconds())
+        self._free = IntervalSet(0, self._horizon)
+        self._tasks: Dict[int, SchedulableTask] = {}
+        # task id -> (start, end) offsets, plus the same spans sorted by start.
+        self._placed: Dict[int, Tuple[int, int]] = {}
+        self._index: List[Tuple[int, int, int]] = []
+        self._longest = 0
+
+    @property
+    def placements(self) -> Dict[int, Optional[datetime]]:
+        """The suggested start time of every known task; None if it did not fit."""
+        return {task_id: self._start_time(task_id) for task_id in self._tasks}
+
+    def schedule(self, tasks: Iterable[SchedulableTask]) -> Dict[int, Optional[datetime]]:
+        """
+        Schedules a batch of tasks from scratch.
+
+        Args:
+            tasks (Iterable[SchedulableTask]): The open tasks to place.
+
+        Returns:
+            Dict[int, Optional[datetime]]: The suggested start time of each task.
+        """
+        flexible = []
+        for task in tasks:
+            self._tasks[task.id] = task
+            if task.fixed:
+                self._place_fixed(task)
+            else:
+                flexible.append(task)
+        self._place_flexible(flexible)
+        return self.placements
+
+    def reschedule(self, task: SchedulableTask) -> Dict[int, Optional[datetime]]:
+        """
+        Places a new or changed task, moving only the tasks it displaces.
+
+        A changed flexible task is released and placed again in the earliest span
+        that is free or held only by flexible tasks ranked after it, e.g. once its
+        priority went up. A fixed task takes its span. Either way the flexible tasks
+        overlapping the new span are evicted and placed again in priority order. Use
+        reschedule_task to also write the moved start times back.
+
+        Args:
+            task (SchedulableTask): The task with its current field values.
+
+        Returns:
+            Dict[int, Optional[datetime]]: The new start time of every task that moved.
+        """
+        before = {task.id: self._start_time(task.id)}
+        self._unplace(task.id)
+        self._tasks[task.id] = task
+        span = self._fixed_span(task) if task.fixed else self._preempt_span(task)
+        if span is None:
+            return {task.id: None} if before[task.id] is not None else {}
+        evicted = [
+            self._tasks[task_id]
+            for task_id in self._overlapping(*span)
+            if not self._tasks[task_id].fixed
+        ]
+        for other in evicted:
+            before[other.id] = self._start_time(other.id)
+            self._unplace(other.id)
+        if task.fixed:
+            self._place_fixed(task)
+        else:
+            self._free.reserve(*span)
+            self._track(task.id, *span)
+        self._place_flexible(evicted)
+        return {
+            task_id: self._start_time(task_id)
+            for task_id, previous in before.items()
+            if self._start_time(task_id) != previous
+        }
+
+    def remove(self, task_id: int) -> None:
+        """Forgets a task and frees its slot, e.g. once it is completed or deleted."""
+        self._unplace(task_id)
+        self._tasks.pop(task_id, None)
+
+    def _offset(self, moment: datetime) -> int:
+        return int((moment - self.window_start).total_seconds())
+
+    def _duration(self, task: SchedulableTask) -> int:
+        return int(task.duration_seconds) if task.duration_seconds else self._default_duration
+
+    def _fixed_span(self, task: SchedulableTask) -> Tuple[int, int]:
+        start = self._offset(task.start_date)
+        return start, start + self._duration(task)
+
+    def _start_time(self, task_id: int) -> Optional[datetime]:
+        task = self._tasks.get(task_id)
+        if task is not None and task.fixed:
+            return task.start_date
+        span = self._placed.get(task_id)
+        return self.window_start + timedelta(seconds=span[0]) if span else None
+
+    def _rank(self, task: SchedulableTask) -> Tuple[int, float, int]:
+        priority = task.priority if task.priority is not None else DEFAULT_PRIORITY
+        due = self._offset(task.due_date) if task.due_date else math.inf
+        return priority, due, task.id
+
+    def _place_fixed(self, task: SchedulableTask) -> None:
+        start, end = self._fixed_span(task)
+        start, end = max(start, 0), min(end, self._horizon)
+        if start < end:
+            self._free.reserve(start, end)
+            self._track(task.id, start, end)
+
+    def _place_flexible(self, tasks: List[SchedulableTask]) -> None:
+        heap = [(*self._rank(task), task) for task in tasks]
+        heapq.heapify(heap)
+        # Free time only shrinks during a pass, so once no span of a duration fits
+        # before some point, later tasks of that duration can start searching there.
+        floors: Dict[int, int] = {}
+        while heap:
+            task = heapq.heappop(heap)[-1]
+            duration = self._duration(task)
+            earliest = max(self._offset(task.start_date), 0) if task.start_date else 0
+            floor = floors.get(duration, 0)
+            start = self._free.find(max(earliest, floor), duration)
+            if earliest <= floor:
+                floors[duration] = self._horizon if start is None else start
+            if start is None or start + duration > self._horizon:
+                continue
+            self._free.reserve(start, start + duration)
+            self._track(task.id, start, start + duration)
+
+    def _preempt_span(self, task: SchedulableTask) -> Optional[Tuple[int, int]]:
+        """Returns the earliest span of a flexible task that only overlaps flexible tasks ranked after it."""
+        duration = self._duration(task)
+        start = max(self._offset(task.start_date), 0) if task.start_date else 0
+        rank = self._rank(task)
+        index = self._index
+        for i in range(bisect_left(index, (start - self._longest,)), len(index)):
+            other_start, other_end, other_id = index[i]
+            if other_start >= start + duration:
+                break
+            other = self._tasks[other_id]
+            if other_end > start and (other.fixed or self._rank(other) < rank):
+                start = other_end
+        if start + duration > self._horizon:
+            return None
+        return start, start + duration
+
+    def _track(self, task_id: int, start: int, end: int) -> None:
+        self._placed[task_id] = (start, end)
+        insort(self._index, (start, end, task_id))
+        self._longest = max(self._longest, end - start)
+
+    def _unplace(self, task_id: int) -> None:
+        span = self._placed.pop(task_id, None)
+        if span is None:
+            return
+        start, end = span
+        del self._index[bisect_left(self._index, (start, end, task_id))]
+        self._free.release(start, end)
+        # Fixed tasks may overlap each other; keep the span of any other one reserved.
+        for other_id in self._overlapping(start, end):
+            if self._tasks[other_id].fixed:
+                other_start, other_end = self._placed[other_id]
+                self._free.reserve(other_start, other_end)
+
+    def _overlapping(self, start: int, end: int) -> List[int]:
+        """Returns the ids of placed tasks whose span overlaps ``[start, end)``."""
+        index = self._index
+        result = []
+        for i in range(bisect_left(index, (start - self._longest,)), len(index)):
+            other_start, other_end, task_id = index[i]
+            if other_start >= end:
+                break
+            if other_end > start:
+                result.append(task_id)
+        return result
+
+async def schedule_open_tasks(task_manager, window_start: datetime, window_end: datetime, default_duration: timedelta = timedelta(minutes=30)) -> Scheduler:
+    """
+    Schedules every open task and writes the suggested start times back in bulk.
+
+    Args:
+        task_manager: The TaskManager to read tasks from and write results with.
+        window_start (datetime): The earliest time a task may be placed.
+        window_end (datetime): The time by which placed tasks must end.
+        default_duration (timedelta): The duration assumed for tasks without one.
+
+    Returns:
+        Scheduler: The scheduler, for incremental rescheduling of later changes.
+    """
+    rows = await task_manager.get_scheduling_rows()
+    scheduler = Scheduler(window_start, window_end, default_duration)
+    placements = scheduler.schedule(SchedulableTask.from_row(row) for row in rows)
+    changed = [
+        {"id": row["id"], "suggested_start_time": placements[row["id"]]}
+        for row in rows
+        if placements[row["id"]] != row["suggested_start_time"]
+    ]
+    await task_manager.update_task_rows(changed)
+    return scheduler
+
+async def reschedule_task(task_manager, scheduler: Scheduler, task: SchedulableTask) -> Dict[int, Optional[datetime]]:
+    """
+    Reschedules one new or changed task and writes the moved start times back in bulk.
+
+    Args:
+        task_manager: The TaskManager to write results with.
+        scheduler (Scheduler): The scheduler returned by schedule_open_tasks.
+        task (SchedulableTask): The task with its current field values.
+
+    Returns:
+        Dict[int, Optional[datetime]]: The new start time of every task that moved.
+    """
+    moved = scheduler.reschedule(task)
+    await task_manager.update_task_rows([
+        {"id": task_id, "suggested_start_time": start} for task_id, start in moved.items()
+    ])
+    return moved
@@ -0,0 +1,161 @@
+# Standard library imports
+import argparse
+import asyncio
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Third-party imports
+from sqlmodel import select, func, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import column, literal_column, table
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+# Local application imports
+from src.models.model import Goal, Task
+
+# FTS5 index of each searchable model: (fts table, indexed columns).
+SEARCH_INDEXES: Dict[type, Tuple[str, Tuple[str, ...]]] = {
+    Task: ("task_fts", ("name", "description")),
+    Goal: ("goal_fts", ("name", "description")),
+}
+
+class SearchResult:
+    """
+    A search hit.
+
+    Attributes:
+        item: The matching Task or Goal.
+        rank (float): The bm25 score; lower is a better match.
+        snippet (str): The best matching fragment, with terms wrapped in ``[`` and ``]``.
+    """
+    __slots__ = ("item", "rank", "snippet")
+
+    def __init__(self, item, rank: float, snippet: str):
+        self.item = item
+        self.rank = rank
+        self.snippet = snippet
+
+def _index_ddl(model: type) -> List[str]:
+    """The statements creating a model's external-content FTS5 table and its sync triggers."""
+    fts, columns = SEARCH_INDEXES[model]
+    content = model.__tablename__
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{name}" for name in columns)
+    old = ", ".join(f"old.{name}" for name in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, content='{content}', "
+        f"content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {content} BEGIN "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {content} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} ON {content} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new}); END",
+    ]
+
+async def install_search(conn: AsyncConnection) -> None:
+    """
+    Creates the FTS5 tables and triggers that are missing.
+
+    A newly created index is rebuilt at once, so existing rows become searchable.
+
+    Args:
+        conn (AsyncConnection): A connection inside a transaction.
+    """
+    for model, (fts, _) in SEARCH_INDEXES.items():
+        exists = (await conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+        )).first()
+        for statement in _index_ddl(model):
+            await conn.exec_driver_sql(statement)
+        if not exists:
+            await conn.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+async def rebuild_search_index(engine: Optional[AsyncEngine] = None) -> None:
+    """
+    Rebuilds every full-text index from its content table.
+
+    Use it after rows were written with the triggers missing, e.g. on a database
+    created before search existed or restored from a plain copy of the tables.
+
+    Args:
+        engine (Optional[AsyncEngine]): The engine to use. Defaults to the application engine.
+    """
+    if engine is None:
+        from src.services.db_setup import get_engine
+        engine = get_engine()
+    async with engine.begin() as conn:
+        await install_search(conn)
+        for fts, _ in SEARCH_INDEXES.values():
+            await conn.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+def match_query(query: str, prefix: bool = True) -> str:
+    """
+    Turns user input into an FTS5 query matching all of its words.
+
+    Every word is quoted, so punctuation and FTS5 operators in the input are
+    searched for literally instead of raising syntax errors.
+
+    Args:
+        query (str): The user's search text.
+        prefix (bool): Whether the last word also matches longer words, for search-as-you-type.
+
+    Returns:
+        str: The MATCH expression; empty when the input has no words.
+    """
+    terms = [f'"{term}"' for term in re.findall(r"\w+", query)]
+    if prefix and terms:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+async def search(session: AsyncSession, model: type, query: str, limit: int = 20, goal_id: Optional[int] = None) -> List[SearchResult]:
+    """
+    Runs a ranked full-text search.
+
+    Args:
+        session (AsyncSession): The session to run in.
+        model (type): Task or Goal.
+        query (str): The user's search text, see match_query.
+        limit (int): The maximum number of results.
+        goal_id (Optional[int]): Only return tasks of this goal.
+
+    Returns:
+        List[SearchResult]: The matches, best first.
+    """
+    expression = match_query(query)
+    if not expression:
+        return []
+    fts, _ = SEARCH_INDEXES[model]
+    fts_table = table(fts, column("rowid"))
+    fts_ref = literal_column(fts)
+    stmt = (
+        select(
+            model,
+            func.bm25(fts_ref).label("score"),
+            func.snippet(fts_ref, -1, "[", "]", "…", 12).label("snippet"),
+        )
+        .select_from(fts_table)
+        .join(model, model.id == fts_table.c.rowid)
+        .where(text(f"{fts} MATCH :query").bindparams(query=expression))
+        .order_by(literal_column("score"), model.id)
+        .limit(limit)
+    )
+    if goal_id is not None:
+        stmt = stmt.where(model.goal_id == goal_id)
+    return [SearchResult(item, score, snippet) for item, score, snippet in await session.exec(stmt)]
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: ``python -m src.services.search rebuild``."""
+    parser = argparse.ArgumentParser(description="Manage the SmartTasker full-text search index.")
+    parser.add_argument("command", choices=["rebuild"], help="rebuild: re-index every task and goal")
+    parser.parse_args(argv)
+    from src.services.db_setup import create_db_and_tables
+
+    async def _rebuild() -> None:
+        await create_db_and_tables()
+        await rebuild_search_index()
+    asyncio.run(_rebuild())
+
+if __name__ == "__main__":
+    main()
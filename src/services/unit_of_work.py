@@ -0,0 +1,118 @@
+# Standard library imports
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Callable, Iterator, Optional
+
+# Third-party imports
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Local application imports
+from src.services.db_setup import get_engine
+
+_current_session: ContextVar[Optional[AsyncSession]] = ContextVar("smarttasker_uow_session", default=None)
+
+def current_session() -> Optional[AsyncSession]:
+    """Returns the session of the active unit of work, if any."""
+    return _current_session.get()
+
+def clear_current_session() -> None:
+    """
+    Detaches the current context from any active unit of work.
+
+    Background tasks copy the context they are created in; calling this at the
+    start of such a task keeps its writes out of the creator's transaction.
+    """
+    _current_session.set(None)
+
+# Session.info keys of the callbacks run by on_transaction_end.
+_END_CALLBACKS = "smarttasker_end_callbacks"
+_END_LISTENING = "smarttasker_end_listening"
+
+def on_transaction_end(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Calls ``callback`` once the session's current transaction commits or rolls back.
+
+    Use it for side effects that must not be seen before the commit, such as
+    dropping cache entries a concurrent reader could otherwise fill with old rows.
+    """
+    info = session.sync_session.info
+    info.setdefault(_END_CALLBACKS, []).append(callback)
+    if info.get(_END_LISTENING):
+        return
+    info[_END_LISTENING] = True
+
+    def _run_callbacks(*_) -> None:
+        for pending in info.pop(_END_CALLBACKS, []):
+            pending()
+
+    event.listen(session.sync_session, "after_commit", _run_callbacks)
+    event.listen(session.sync_session, "after_rollback", _run_callbacks)
+
+@contextmanager
+def bound_session(session: AsyncSession) -> Iterator[AsyncSession]:
+    """
+    Makes ``session`` the current unit-of-work session inside the block.
+
+    Manager calls in the block only flush on it; the caller owns its transaction.
+    """
+    token = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(token)
+
+class UnitOfWork:
+    """
+    Shares one session and transaction across manager calls.
+
+    While the unit of work is active, every BaseManager method running in the same
+    asyncio task uses its session and only flushes, so all changes are committed once
+    when the block exits without an error, and rolled back otherwise. A nested unit of
+    work joins the outer one instead of opening a second transaction.
+    """
+
+    def __init__(self, engine: Optional[AsyncEngine] = None):
+        """
+        Initializes the unit of work.
+
+        Args:
+            engine (Optional[AsyncEngine]): The engine to open the session on.
+                Defaults to the application engine.
+        """
+        self._engine = engine
+        self._token: Optional[Token] = None
+        self._owner = False
+        self.session: Optional[AsyncSession] = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        outer = current_session()
+        if outer is not None:
+            self.session = outer
+            return self
+        # Objects stay readable after the final commit, as with per-call sessions.
+        self.session = AsyncSession(self._engine or get_engine(), expire_on_commit=False)
+        self._token = _current_session.set(self.session)
+        self._owner = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if not self._owner:
+            return
+        try:
+            if exc_type is None:
+                await self.session.commit()
+            else:
+                await self.session.rollback()
+        finally:
+            _current_session.reset(self._token)
+            await self.session.close()
+
+    async def flush(self) -> None:
+        """Sends pending changes to the database without committing."""
+        await self.session.flush()
+
+def unit_of_work(engine: Optional[AsyncEngine] = None) -> UnitOfWork:
+    """Returns a unit of work for use as ``async with unit_of_work() as uow:``."""
+    return UnitOfWork(engine)
@@ -0,0 +1,166 @@
+# Standard library imports
+import operator
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union, get_args, get_origin
+
+# Third-party imports
+from annotated_types import Ge, Gt, Le, Lt, MaxLen, MinLen
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.orm.instrumentation import ClassManager, manager_of_class
+
+# Local application imports
+from src.models.model import Goal, Task, goal_errors, task_errors
+from src.services.columns import column_names
+
+# Model-level checks of each validated model, shared with its model_validator.
+ROW_CHECKS: Dict[type, Callable[[Mapping[str, Any]], List[str]]] = {
+    Goal: goal_errors,
+    Task: task_errors,
+}
+
+@lru_cache(maxsize=None)
+def _required_fields(model: type) -> Tuple[str, ...]:
+    return tuple(name for name, field in model.model_fields.items() if field.is_required())
+
+def _column_type(annotation: Any) -> Tuple[type, bool]:
+    """Splits a column field's annotation into its Python type and whether it is Optional."""
+    optional = False
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        optional = len(args) < len(get_args(annotation))
+        annotation = args[0]
+    return get_origin(annotation) or annotation, optional
+
+def _has_type(value: Any, python_type: type) -> bool:
+    """Whether ``value`` has ``python_type`` as Pydantic would store it, without coercion."""
+    if python_type is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    if python_type is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if python_type is date:
+        return isinstance(value, date) and not isinstance(value, datetime)
+    return isinstance(value, python_type)
+
+# Numeric Field constraints: the annotated_types class, its attribute, the comparison and its symbol.
+_BOUNDS = ((Gt, "gt", operator.gt, ">"), (Ge, "ge", operator.ge, ">="), (Lt, "lt", operator.lt, "<"), (Le, "le", operator.le, "<="))
+
+def _constraint_errors(name: str, value: Any, constraint: Any) -> List[str]:
+    if isinstance(constraint, MinLen) and len(value) < constraint.min_length:
+        return [f"Length of {name} must be >= {constraint.min_length}"]
+    if isinstance(constraint, MaxLen) and len(value) > constraint.max_length:
+        return [f"Length of {name} must be <= {constraint.max_length}"]
+    for bound, attribute, compare, symbol in _BOUNDS:
+        if isinstance(constraint, bound) and not compare(value, getattr(constraint, attribute)):
+            return [f"{name} must be {symbol} {getattr(constraint, attribute)}"]
+    return []
+
+@lru_cache(maxsize=None)
+def _field_checks(model: type) -> Tuple[Tuple[str, type, bool, bool, Tuple[Any, ...]], ...]:
+    """``(column, type, optional, required, constraints)`` of each column field of a model."""
+    checks = []
+    for name, field in model.model_fields.items():
+        if name not in column_names(model):
+            continue
+        python_type, optional = _column_type(field.annotation)
+        checks.append((name, python_type, optional, field.is_required(), tuple(field.metadata)))
+    return tuple(checks)
+
+def _field_errors(model: type, row: Mapping[str, Any]) -> Tuple[List[str], List[str]]:
+    """Checks each column value in ``row``; returns the type errors and the Field constraint errors."""
+    type_errors: List[str] = []
+    constraint_errors: List[str] = []
+    for name, python_type, optional, required, constraints in _field_checks(model):
+        if name not in row:
+            continue
+        value = row[name]
+        if value is None:
+            # Missing required values are reported by the required-field check.
+            if not optional and not required:
+                type_errors.append(f"Invalid {name}: expected {python_type.__name__}")
+            continue
+        if not _has_type(value, python_type):
+            type_errors.append(f"Invalid {name}: expected {python_type.__name__}, got {type(value).__name__}")
+            continue
+        for constraint in constraints:
+            constraint_errors.extend(_constraint_errors(name, value, constraint))
+    return type_errors, constraint_errors
+
+@lru_cache(maxsize=None)
+def _class_manager(model: type) -> ClassManager:
+    # Attribute access needs configured mappers, which __init__ would otherwise ensure.
+    configure_mappers()
+    return manager_of_class(model)
+
+@lru_cache(maxsize=None)
+def _defaults(model: type) -> Tuple[Tuple[str, Any, Optional[Callable[[], Any]]], ...]:
+    """``(column, default, default factory)`` of each optional column, for trusted rows that leave some out."""
+    fields = model.model_fields
+    return tuple(
+        (name, fields[name].default, fields[name].default_factory)
+        for name in fields if name in column_names(model) and not fields[name].is_required()
+    )
+
+def construct_trusted(model: type, row: Mapping[str, Any]) -> Any:
+    """
+    Builds a model instance from a trusted row without running its validators.
+
+    The instance is created the way the ORM creates rows it loads: the class is
+    instantiated without calling ``__init__`` and the column values are stored
+    directly. Use it for rows read back from the database or already checked with
+    validate_rows; the values are not converted or checked. Optional columns
+    missing from ``row`` get their defaults.
+
+    Args:
+        model (type): The model class.
+        row (Mapping[str, Any]): Column values keyed by column name.
+
+    Returns:
+        The new, transient instance.
+    """
+    item = _class_manager(model).new_instance()
+    values = item.__dict__
+    if len(row) < len(column_names(model)):
+        for name, default, factory in _defaults(model):
+            if name not in row:
+                values[name] = factory() if factory is not None else default
+    values.update(row)
+    item.__pydantic_fields_set__.update(row.keys())
+    return item
+
+def construct_many_trusted(model: type, rows: Iterable[Mapping[str, Any]]) -> List[Any]:
+    """Builds model instances from trusted rows, see construct_trusted."""
+    return [construct_trusted(model, row) for row in rows]
+
+def validate_rows(model: type, rows: Iterable[Mapping[str, Any]]) -> Dict[int, List[str]]:
+    """
+    Checks candidate rows of a model in one pass, without building instances.
+
+    Runs the checks Pydantic would run on the rows as plain dicts, so a large
+    import is validated without per-row model overhead: the required-field check,
+    the checks of the model's model_validator (see ROW_CHECKS), and each column
+    value's type and Field constraints, such as Goal.name's minimum length. Values
+    are not coerced, so a row valid here can be passed to construct_trusted as is;
+    convert strings to ints, dates and datetimes before validating.
+
+    Args:
+        model (type): The model the rows are for, e.g. Goal or Task.
+        rows (Iterable[Mapping[str, Any]]): The candidate rows.
+
+    Returns:
+        Dict[int, List[str]]: The problems of each invalid row, keyed by its position;
+            empty when every row is valid.
+    """
+    required = _required_fields(model)
+    check = ROW_CHECKS.get(model)
+    errors: Dict[int, List[str]] = {}
+    for index, row in enumerate(rows):
+        problems = [f"Field required: {name}" for name in required if row.get(name) is None]
+        type_errors, constraint_errors = _field_errors(model, row)
+        # The model-level checks assume the values have their column types.
+        if check is not None and not type_errors:
+            problems.extend(check(row))
+        problems.extend(type_errors + constraint_errors)
+        if problems:
+            errors[index] = problems
+    return errors
@@ -0,0 +1,227 @@
+# Standard library imports
+import asyncio
+import logging
+from typing import Any, Callable, Coroutine, List, Optional, Tuple
+
+# Third-party imports
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Local application imports
+from src.services.unit_of_work import bound_session, clear_current_session
+from src.services.metrics import acquire_connection
+
+logger = logging.getLogger(__name__)
+
+# Queue marker; it is not written, only counted as processed.
+_STOP = object()
+
+def is_busy_error(error: BaseException) -> bool:
+    """Returns True for SQLite's transient ``database is locked`` and ``database is busy`` errors."""
+    message = str(error).lower()
+    return isinstance(error, OperationalError) and ("database is locked" in message or "database is busy" in message)
+
+class _Request:
+    __slots__ = ("func", "args", "kwargs", "future")
+
+    def __init__(self, func, args, kwargs, future: asyncio.Future):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+
+class WritePipeline:
+    """
+    A single-writer queue that group-commits concurrent writes.
+
+    Writes are submitted as ``func(session, ...)`` coroutine functions, the same
+    shape BaseManager._execute_write runs, and executed by one background task.
+    It takes up to ``max_batch`` queued writes, waiting at most ``max_latency``
+    seconds for more after the first, runs them in order in one transaction and
+    commits once, so concurrent callers share one commit and never contend for
+    SQLite's write lock. Each caller gets its own result or error back.
+
+    A write that raises is rolled back with its batch, its error is returned to
+    its caller and the rest of the batch is run again without it; writes must
+    therefore be safe to run more than once, as the managers' writes are. Busy
+    errors are retried for the whole batch with exponential backoff. While a
+    write runs, the batch session is its unit of work, so manager calls it makes
+    join the batch instead of queueing behind it.
+
+    Enable it for the managers with BaseManager.use_write_pipeline.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[AsyncEngine] = None,
+        max_batch: int = 64,
+        max_latency: float = 0.002,
+        max_retries: int = 5,
+        backoff: float = 0.01,
+        max_queue: int = 10000,
+    ):
+        """
+        Initializes the pipeline.
+
+        Args:
+            engine (Optional[AsyncEngine]): The engine to write to. Defaults to the application engine.
+            max_batch (int): The maximum number of writes per transaction.
+            max_latency (float): The maximum seconds a write waits for others to share its commit.
+            max_retries (int): The number of times a batch is retried after a busy error.
+            backoff (float): Seconds before the first retry; doubled for each further retry.
+            max_queue (int): The number of queued writes at which ``submit`` blocks.
+        """
+        if engine is None:
+            from src.services.db_setup import get_engine
+            engine = get_engine()
+        self.engine = engine
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.batches = 0
+        self.committed = 0
+        self.failed = 0
+        self.retries = 0
+
+    async def __aenter__(self) -> "WritePipeline":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Starts the writer task if it is not running."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, func: Callable[..., Coroutine[Any, Any, Any]], *args, **kwargs) -> Any:
+        """
+        Queues ``func(session, *args, **kwargs)`` and waits until its batch is committed.
+
+        Returns:
+            The value returned by ``func``.
+
+        Raises:
+            RuntimeError: If the pipeline is stopped.
+            Exception: The error raised by ``func``, or by the batch commit.
+        """
+        if self._closed:
+            raise RuntimeError("WritePipeline is stopped")
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Request(func, args, kwargs, future))
+        return await future
+
+    async def stop(self) -> None:
+        """Commits every queued write and stops the writer task."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is None:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        # The task is created from a caller's context; never write on its unit of work.
+        clear_current_session()
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            taken = 1
+            batch: List[_Request] = []
+            deadline = loop.time() + self.max_latency
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                taken += 1
+            if batch:
+                await self._commit(batch)
+            for _ in range(taken):
+                self._queue.task_done()
+
+    async def _commit(self, batch: List[_Request]) -> None:
+        # Callers that gave up on their write are left out.
+        pending = [request for request in batch if not request.future.done()]
+        attempt = 0
+        while pending:
+            try:
+                results, failed = await self._attempt(pending)
+            except Exception as e:
+                if is_busy_error(e) and attempt < self.max_retries:
+                    self.retries += 1
+                    await asyncio.sleep(self.backoff * 2 ** attempt)
+                    attempt += 1
+                    continue
+                logger.error(f"Failed to commit {len(pending)} writes: {e}")
+                self.failed += len(pending)
+                for request in pending:
+                    _set(request.future, exception=e)
+                return
+            if failed is None:
+                self.batches += 1
+                self.committed += len(pending)
+                for request, result in zip(pending, results):
+                    _set(request.future, result=result)
+                return
+            request, error = failed
+            self.failed += 1
+            _set(request.future, exception=error)
+            pending.remove(request)
+
+    async def _attempt(self, pending: List[_Request]) -> Tuple[List[Any], Optional[Tuple[_Request, Exception]]]:
+        """
+        Runs the writes in one transaction and commits it.
+
+        Returns the results, or, when a write raised, rolls back and returns that
+        write with its error. Busy errors and commit errors are raised.
+        """
+        async with AsyncSession(self.engine, expire_on_commit=False) as session:
+            try:
+                await acquire_connection(session)
+                results = []
+                with bound_session(session):
+                    for request in pending:
+                        try:
+                            results.append(await request.func(session, *request.args, **request.kwargs))
+                            await session.flush()
+                        except Exception as e:
+                            if is_busy_error(e):
+                                raise
+                            await session.rollback()
+                            return [], (request, e)
+                await session.commit()
+                return results, None
+            except BaseException:
+                await session.rollback()
+                raise
+
+def _set(future: asyncio.Future, result: Any = None, exception: Optional[BaseException] = None) -> None:
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
@@ -0,0 +1,157 @@
+# Standard library imports
+import sys
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete
+
+pytest.importorskip("numpy")
+
+# Local application imports
+from src.models.model import Goal, Task, GoalStats
+from src.models.db_manager import GoalManager, TaskManager
+from src.services.analytics import TaskAnalytics
+from src.services.scheduler import schedule_open_tasks
+from src.services.db_setup import create_db_and_tables, get_engine
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(Task))
+        await session.exec(delete(GoalStats))
+        await session.exec(delete(Goal))
+        await session.commit()
+    yield
+
+@pytest_asyncio.fixture
+async def task_manager():
+    """Provide a TaskManager instance."""
+    return TaskManager()
+
+START = date(2024, 3, 1)
+
+def sample_task(name: str, day: int, hours: float = 1, **values) -> Task:
+    due = datetime.combine(START, datetime.min.time()) + timedelta(days=day, hours=9)
+    return Task(name=name, description=name, due_date=due, duration_seconds=int(hours * 3600), **values)
+
+class TestTaskAnalytics:
+    """Test suite for TaskAnalytics."""
+
+    @pytest.mark.asyncio
+    async def test_workload_and_overdue(self, task_manager: TaskManager):
+        """Test the hours due per day and the overdue counts per priority."""
+        # Given
+        await task_manager.create_tasks([
+            sample_task("Plan", 0, 2, priority=1, status="Not Started"),
+            sample_task("Write", 0, 1.5, priority=2),
+            sample_task("Done", 0, 4, priority=1, status="Completed"),
+            sample_task("Review", 2, priority=3),
+            sample_task("Later", 40, 8),
+            Task(name="Undated", description="no due date", duration_seconds=3600),
+        ])
+        analytics = TaskAnalytics(batch_size=2)
+
+        # When
+        read = await analytics.refresh()
+        workload = analytics.workload_by_day(START, days=3)
+        overdue = analytics.overdue_by_priority(now=datetime(2024, 3, 4))
+
+        # Then
+        assert read == len(analytics) == 6
+        assert workload == {START: 3.5, date(2024, 3, 2): 0.0, date(2024, 3, 3): 1.0}
+        assert analytics.workload_by_day(START, days=1, include_completed=True)[START] == 7.5
+        assert overdue == {1: 1, 2: 1, 3: 1}
+
+    @pytest.mark.asyncio
+    async def test_completion_rate_by_goal(self, task_manager: TaskManager):
+        """Test the share of completed tasks per goal."""
+        # Given
+        goal_ids = await GoalManager().create_goals([
+            Goal(name="Launch", description="Launch"),
+            Goal(name="Hire", description="Hire"),
+        ])
+        await task_manager.create_tasks([
+            sample_task("A", 0, goal_id=goal_ids[0], status="Completed"),
+            sample_task("B", 0, goal_id=goal_ids[0]),
+            sample_task("C", 0, goal_id=goal_ids[0], status="Completed"),
+            sample_task("D", 0, goal_id=goal_ids[1]),
+            sample_task("E", 0),
+        ])
+        analytics = TaskAnalytics()
+        await analytics.refresh()
+
+        # When
+        rates = analytics.completion_rate_by_goal()
+
+        # Then
+        assert rates == {goal_ids[0]: pytest.approx(2 / 3), goal_ids[1]: 0.0}
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh(self, task_manager: TaskManager):
+        """Test that a refresh reads only new and updated tasks and drops deleted ones."""
+        # Given
+        ids = await task_manager.create_tasks([sample_task(f"Task {i}", 0) for i in range(5)])
+        analytics = TaskAnalytics(overlap=0)
+        await analytics.refresh()
+
+        # When
+        await task_manager.update_task_values(ids[0], duration_seconds=7200)
+        await task_manager.delete_task(ids[1])
+        await task_manager.create_task(sample_task("New", 1, 3))
+        read = await analytics.refresh()
+
+        # Then
+        assert read == 2
+        assert len(analytics) == 5
+        assert list(analytics.columns["id"]) == sorted(analytics.columns["id"])
+        assert ids[1] not in analytics.columns["id"]
+        assert analytics.workload_by_day(START, days=2) == {START: 5.0, date(2024, 3, 2): 3.0}
+        assert await analytics.refresh() == 0
+
+    @pytest.mark.asyncio
+    async def test_updates_set_updated_at(self, task_manager: TaskManager):
+        """Test that every update path stamps updated_at."""
+        # Given
+        ids = await task_manager.create_tasks([sample_task(f"Task {i}", 0) for i in range(3)])
+        before = datetime.now()
+
+        # When
+        await task_manager.update_task(ids[0], priority=1)
+        await task_manager.update_tasks([ids[1]], priority=1)
+        await task_manager.update_task_rows([{"id": ids[2], "priority": 1}])
+
+        # Then
+        tasks = await task_manager.get_all_tasks()
+        assert all(task.updated_at is not None and task.updated_at >= before for task in tasks)
+
+    @pytest.mark.asyncio
+    async def test_scheduling_keeps_updated_at(self, task_manager: TaskManager):
+        """Test that writing suggested start times does not make a refresh re-read the tasks."""
+        # Given
+        ids = await task_manager.create_tasks([sample_task(f"Task {i}", 2) for i in range(3)])
+        analytics = TaskAnalytics(overlap=0)
+        await analytics.refresh()
+        window_start = datetime.combine(START, datetime.min.time())
+
+        # When
+        await schedule_open_tasks(task_manager, window_start, window_start + timedelta(days=7))
+        await task_manager.update_task_values(ids[0], suggested_start_time=window_start)
+        read = await analytics.refresh()
+
+        # Then
+        tasks = await task_manager.get_all_tasks()
+        assert all(task.suggested_start_time is not None for task in tasks)
+        assert all(task.updated_at is None for task in tasks)
+        assert read == 0
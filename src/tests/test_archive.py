@@ -0,0 +1,166 @@
+# Standard library imports
+import sys
+from pathlib import Path
+from datetime import datetime
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete, select, func
+
+# Local application imports
+from src.models.model import Goal, Task, TaskHistory, AISuggestion, TaskNotification, Feedback, GoalStats
+from src.models.db_manager import (
+    GoalManager, TaskManager, TaskHistoryManager, AISuggestionManager, TaskNotificationManager, FeedbackManager
+)
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.archive import ARCHIVE_TABLES, Archiver
+
+OLD = datetime(2020, 1, 1)
+CUTOFF = datetime(2023, 1, 1)
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        for model in (Feedback, AISuggestion, TaskNotification, TaskHistory, Task, GoalStats, Goal):
+            await session.exec(delete(model))
+        for table in ARCHIVE_TABLES.values():
+            await session.exec(delete(table))
+        await session.commit()
+    yield
+    TaskManager.maintain_goal_stats = False
+
+@pytest_asyncio.fixture
+async def task_manager():
+    """Provide a TaskManager instance."""
+    return TaskManager()
+
+async def count(table) -> int:
+    async with AsyncSession(get_engine()) as session:
+        return (await session.exec(select(func.count()).select_from(table))).one()
+
+async def create_old_completed_tasks(task_manager: TaskManager, number: int, goal_id=None):
+    return await task_manager.create_tasks([
+        Task(name=f"Old {i}", description="done", status="Completed", created_at=OLD, goal_id=goal_id)
+        for i in range(number)
+    ])
+
+class TestArchiver:
+    """Test suite for Archiver."""
+
+    @pytest.mark.asyncio
+    async def test_moves_completed_tasks_with_related_rows(self, task_manager: TaskManager):
+        """Test old completed tasks move to the archive with their related rows."""
+        # Given
+        archived_id, = await create_old_completed_tasks(task_manager, 1)
+        active = await task_manager.create_task(Task(name="Active", description="open", created_at=OLD))
+        recent = await task_manager.create_task(Task(name="Recent", description="done", status="Completed"))
+        history = await TaskHistoryManager().create_task_history(TaskHistory(task_id=archived_id, change_type="Update"))
+        suggestion = await AISuggestionManager().create_AIsuggestion(AISuggestion(task_id=archived_id, name="s", content="c"))
+        await FeedbackManager().create_feedback(Feedback(ai_suggestion_id=suggestion.id))
+        await TaskNotificationManager().create_task_notification(TaskNotification(task_id=archived_id, name="n", message="m"))
+
+        # When
+        moved = await Archiver().archive_completed_tasks(CUTOFF)
+
+        # Then
+        assert moved == 1
+        assert {task.id for task in await task_manager.get_all_tasks()} == {active.id, recent.id}
+        for model in (Task, TaskHistory, AISuggestion, TaskNotification, Feedback):
+            assert await count(ARCHIVE_TABLES[model]) == 1
+        assert await count(TaskHistory) == 0
+        assert await task_manager.search("old") == []
+
+    @pytest.mark.asyncio
+    async def test_read_through(self, task_manager: TaskManager):
+        """Test fetching an archived id returns the archived item."""
+        # Given
+        archived_id, = await create_old_completed_tasks(task_manager, 1)
+        history = await TaskHistoryManager().create_task_history(
+            TaskHistory(task_id=archived_id, change_type="Update", new_state={"priority": 1})
+        )
+        await Archiver().archive_completed_tasks(CUTOFF)
+
+        # When
+        task = await task_manager.get_task(archived_id)
+        entry = await TaskHistoryManager().get_task_history(history.id)
+
+        # Then
+        assert task.name == "Old 0"
+        assert task.status == "Completed"
+        assert entry.new_state == {"priority": 1}
+        assert await task_manager.get_task(999) is None
+
+    @pytest.mark.asyncio
+    async def test_bounded_batches(self, task_manager: TaskManager):
+        """Test archival moves at most batch_size rows per batch."""
+        # Given
+        await create_old_completed_tasks(task_manager, 5)
+        archiver = Archiver(batch_size=2)
+
+        # When
+        first = await archiver.archive_completed_tasks(CUTOFF, max_batches=1)
+        rest = await archiver.archive_completed_tasks(CUTOFF)
+
+        # Then
+        assert first == 2
+        assert rest == 3
+        assert await count(Task) == 0
+
+    @pytest.mark.asyncio
+    async def test_archived_ids_are_not_reused(self, task_manager: TaskManager):
+        """Test new rows never get the id of an archived row."""
+        # Given
+        archived_ids = await create_old_completed_tasks(task_manager, 2)
+        await Archiver().archive_completed_tasks(CUTOFF)
+
+        # When
+        task = await task_manager.create_task(Task(name="New", description="fresh"))
+
+        # Then
+        assert task.id > max(archived_ids)
+
+    @pytest.mark.asyncio
+    async def test_archive_history(self, task_manager: TaskManager):
+        """Test old history entries are archived on their own."""
+        # Given
+        task = await task_manager.create_task(Task(name="Active", description="open"))
+        await TaskHistoryManager().create_task_histories([
+            TaskHistory(task_id=task.id, change_type="Update", created_at=OLD),
+            TaskHistory(task_id=task.id, change_type="Update", created_at=datetime.now()),
+        ])
+
+        # When
+        moved = await Archiver().archive_history(CUTOFF)
+
+        # Then
+        assert moved == 1
+        assert await count(TaskHistory) == 1
+        assert await count(ARCHIVE_TABLES[TaskHistory]) == 1
+
+    @pytest.mark.asyncio
+    async def test_goal_stats_follow_archival(self, task_manager: TaskManager):
+        """Test archived tasks leave the maintained goal totals."""
+        # Given
+        TaskManager.maintain_goal_stats = True
+        goal = await GoalManager().create_goal(Goal(name="Goal", description="g"))
+        await create_old_completed_tasks(task_manager, 2, goal_id=goal.id)
+        await task_manager.create_task(Task(name="Open", description="o", goal_id=goal.id, status="Not Started"))
+
+        # When
+        await Archiver().archive_completed_tasks(CUTOFF)
+
+        # Then
+        progress = await GoalManager().get_progress(goal.id, use_summary=True)
+        assert progress.total_tasks == 1
+        assert progress.completed == 0
+        assert progress.not_started == 1
@@ -0,0 +1,110 @@
+# Standard library imports
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete, select, func
+
+# Local application imports
+from src.models.model import Goal, Task, TaskHistory, AISuggestion, TaskNotification, Feedback, GoalStats
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.benchmarks.generator import DatasetGenerator, parse_size, row_counts
+from src.benchmarks.workloads import WORKLOADS, percentile, summarize
+from src.benchmarks.run import run_benchmark
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        for model in (Feedback, AISuggestion, TaskNotification, TaskHistory, Task, GoalStats, Goal):
+            await session.exec(delete(model))
+        await session.commit()
+    yield
+
+def dump(chunks):
+    return [item.model_dump() for chunk in chunks for item in chunk]
+
+class TestDatasetGenerator:
+    """Test suite for DatasetGenerator."""
+
+    def test_deterministic(self):
+        """Test that the same seed produces the same rows regardless of chunk size."""
+        # Given
+        first = DatasetGenerator(300, seed=7, chunk_size=64)
+        second = DatasetGenerator(300, seed=7, chunk_size=1000)
+
+        # When / Then
+        assert dump(first.tasks()) == dump(second.tasks())
+        assert dump(first.task_histories()) == dump(second.task_histories())
+        assert dump(first.tasks()) != dump(DatasetGenerator(300, seed=8).tasks())
+
+    def test_row_counts_and_references(self):
+        """Test the generated sizes and that foreign keys point at generated rows."""
+        # Given
+        generator = DatasetGenerator(1000, chunk_size=300)
+
+        # When
+        tasks = dump(generator.tasks())
+        suggestions = dump(generator.ai_suggestions())
+
+        # Then
+        assert row_counts(1000) == {"goal": 10, "task": 1000, "taskhistory": 1000, "aisuggestion": 100}
+        assert [task["id"] for task in tasks] == list(range(1, 1001))
+        assert all(task["goal_id"] is None or 1 <= task["goal_id"] <= 10 for task in tasks)
+        assert all(1 <= suggestion["task_id"] <= 1000 for suggestion in suggestions)
+
+    def test_parse_size(self):
+        """Test named and numeric sizes."""
+        # When / Then
+        assert parse_size("100k") == 100_000
+        assert parse_size("1M") == 1_000_000
+        assert parse_size("250") == 250
+        with pytest.raises(ValueError):
+            parse_size("huge")
+
+class TestSummaries:
+    """Test suite for the latency summaries."""
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles."""
+        # Given
+        values = [i / 1000 for i in range(1, 101)]
+
+        # When
+        summary = summarize(values, elapsed=2.0)
+
+        # Then
+        assert percentile(values, 0.5) == 0.05
+        assert summary["operations"] == 100
+        assert summary["throughput"] == 50.0
+        assert summary["p50_ms"] == 50.0
+        assert summary["p99_ms"] == 99.0
+        assert summary["max_ms"] == 100.0
+
+class TestRunBenchmark:
+    """Test suite for run_benchmark."""
+
+    @pytest.mark.asyncio
+    async def test_runs_every_workload(self):
+        """Test a small run loads the dataset, runs every workload and cleans up its writes."""
+        # When
+        run = await run_benchmark(200, operations=10, concurrency=2)
+
+        # Then
+        assert run["rows"] == row_counts(200)
+        assert set(run["results"]) == set(WORKLOADS)
+        assert run["results"]["manager_get"]["operations"] == 10
+        async with AsyncSession(get_engine()) as session:
+            task_count = (await session.exec(select(func.count(Task.id)))).one()
+        # Only the creates of the mixed workload stay behind.
+        assert 200 <= task_count <= 210
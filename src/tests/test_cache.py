@@ -0,0 +1,227 @@
+# Standard library imports
+import sys
+import asyncio
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import SQLModel, delete
+
+# Local application imports
+from src.models.model import Goal
+from src.models.db_manager import BaseManager, GoalManager
+from src.services.cache import LRUCache
+from src.services.database_service import DatabaseService
+from src.services.db_setup import create_db_and_tables, create_engine_for_profile, get_engine
+from src.services.unit_of_work import clear_current_session, unit_of_work
+
+class FakeClock:
+    """A manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database and enable the goal cache before each test."""
+    await create_db_and_tables()
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(Goal))
+        await session.commit()
+    BaseManager.enable_cache(Goal, max_entries=16)
+    yield
+    BaseManager.disable_cache(Goal)
+
+async def read_outside(manager: GoalManager, goal_id: int) -> Goal:
+    """Reads a goal from a task that is not part of the caller's unit of work."""
+    clear_current_session()
+    return await manager.get_goal(goal_id)
+
+class SlowReadGoalManager(GoalManager):
+    """A GoalManager whose reads wait for ``proceed`` once the row is read."""
+
+    def __init__(self):
+        super().__init__()
+        self.read = asyncio.Event()
+        self.proceed = asyncio.Event()
+
+    async def _execute_read(self, func, *args, **kwargs):
+        result = await super()._execute_read(func, *args, **kwargs)
+        self.read.set()
+        await self.proceed.wait()
+        return result
+
+class TestLRUCache:
+    """Test suite for the LRU cache."""
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = LRUCache(max_entries=2, ttl=None)
+        cache.put(1, "a")
+        cache.put(2, "b")
+        cache.get(1)
+        cache.put(3, "c")
+        assert cache.get(2) is None
+        assert cache.get(1) == "a"
+        assert cache.get(3) == "c"
+        assert cache.evictions == 1
+
+    def test_ttl_expiry(self):
+        """Test entries expire after their time to live."""
+        clock = FakeClock()
+        cache = LRUCache(max_entries=4, ttl=10, clock=clock)
+        cache.put(1, "a")
+        clock.now = 9.9
+        assert cache.get(1) == "a"
+        clock.now = 10.0
+        assert cache.get(1) is None
+        assert len(cache) == 0
+
+    def test_memory_bound(self):
+        """Test the estimated memory bound evicts entries."""
+        cache = LRUCache(max_entries=100, ttl=None, max_bytes=250, sizer=lambda value: 100)
+        for key in range(3):
+            cache.put(key, key)
+        assert len(cache) == 2
+        assert cache.stats()["bytes"] == 200
+
+    def test_versioned_put(self):
+        """Test values loaded before an invalidation of their key are not stored."""
+        cache = LRUCache(max_entries=2, ttl=None)
+        version = cache.version
+        cache.invalidate(1)
+        cache.put(1, "stale", version=version)
+        cache.put(2, "other key", version=version)
+        assert cache.get(1) is None
+        assert cache.get(2) == "other key"
+        cache.put(1, "fresh", version=cache.version)
+        assert cache.get(1) == "fresh"
+        for key in range(3, 6):
+            cache.invalidate(key)
+        cache.put(1, "forgotten", version=version)
+        assert cache.get(1) == "fresh"
+
+class TestGoalManagerCache:
+    """Test suite for the GoalManager read-through cache."""
+
+    @pytest.mark.asyncio
+    async def test_read_through(self):
+        """Test repeated lookups are served from the cache."""
+        # Given
+        goal = await GoalManager().create_goal(Goal(name="Goal", description="d"))
+
+        # When
+        first = await GoalManager().get_goal(goal.id)
+        second = await GoalManager().get_goal(goal.id)
+
+        # Then
+        assert first is second
+        stats = BaseManager.cache_stats(Goal)
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate(self):
+        """Test update, delete and the bulk writers invalidate cached entries."""
+        # Given
+        manager = GoalManager()
+        ids = await manager.create_goals([Goal(name=f"Goal {i}", description="d") for i in range(3)])
+        for goal_id in ids:
+            await manager.get_goal(goal_id)
+
+        # When
+        await manager.update_goal(ids[0], name="Renamed")
+        await manager.update_goals(ids[1:2], status="Completed")
+        await manager.delete_goals(ids[2:])
+
+        # Then
+        assert (await manager.get_goal(ids[0])).name == "Renamed"
+        assert (await manager.get_goal(ids[1])).status == "Completed"
+        assert await manager.get_goal(ids[2]) is None
+        await manager.delete_goal(ids[0])
+        assert await manager.get_goal(ids[0]) is None
+
+    @pytest.mark.asyncio
+    async def test_read_racing_an_update(self):
+        """Test a read in flight while an update commits does not cache the old row."""
+        # Given
+        goal = await GoalManager().create_goal(Goal(name="old", description="d"))
+        reader = SlowReadGoalManager()
+        reading = asyncio.create_task(reader.get_goal(goal.id))
+        await reader.read.wait()
+
+        # When
+        await GoalManager().update_goal(goal.id, name="new")
+        reader.proceed.set()
+        raced = await reading
+
+        # Then
+        assert raced.name == "old"
+        assert (await GoalManager().get_goal(goal.id)).name == "new"
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_invalidates_after_commit(self, tmp_path):
+        """Test a read outside a unit of work cannot re-cache a row it is changing."""
+        # Given
+        engine = create_engine_for_profile(f"sqlite+aiosqlite:///{tmp_path / 'cache.sqlite3'}", profile="fast")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        manager = GoalManager()
+        manager._engine = manager._reader_engine = engine
+        goal = await manager.create_goal(Goal(name="old", description="d"))
+
+        # When
+        async with unit_of_work(engine):
+            await manager.update_goal(goal.id, name="new")
+            outside = await asyncio.create_task(read_outside(manager, goal.id))
+        after = await manager.get_goal(goal.id)
+        await engine.dispose()
+
+        # Then
+        assert outside.name == "old"
+        assert after.name == "new"
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_invalidates_after_rollback(self):
+        """Test entries cached during a unit of work are dropped when it rolls back."""
+        # Given
+        manager = GoalManager()
+        goal = await manager.create_goal(Goal(name="old", description="d"))
+
+        # When
+        with pytest.raises(RuntimeError):
+            async with unit_of_work():
+                await manager.update_goal(goal.id, name="new")
+                await asyncio.create_task(read_outside(manager, goal.id))
+                raise RuntimeError("abort")
+
+        # Then
+        assert (await manager.get_goal(goal.id)).name == "old"
+
+    @pytest.mark.asyncio
+    async def test_database_service_writes_invalidate(self):
+        """Test DatabaseService updates and deletes drop the managers' cached entries."""
+        # Given
+        manager = GoalManager()
+        service = DatabaseService(get_engine())
+        goal = await manager.create_goal(Goal(name="old", description="d"))
+        await manager.get_goal(goal.id)
+
+        # When
+        await service.update(Goal, goal.id, name="new")
+        renamed = await manager.get_goal(goal.id)
+        await service.delete(Goal, goal.id)
+
+        # Then
+        assert renamed.name == "new"
+        assert await manager.get_goal(goal.id) is None
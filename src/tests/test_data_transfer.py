@@ -0,0 +1,234 @@
+# Standard library imports
+import io
+import sys
+import sqlite3
+from pathlib import Path
+from datetime import datetime
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import SQLModel, delete, select
+from sqlalchemy import event
+
+# Local application imports
+from src.models.model import Goal, Task, TaskHistory, AISuggestion, TaskNotification, Feedback, GoalStats
+from src.models.db_manager import (
+    GoalManager, TaskManager, TaskHistoryManager, AISuggestionManager, TaskNotificationManager, FeedbackManager
+)
+from src.services.archive import ARCHIVE_TABLES, Archiver
+from src.services.db_setup import create_db_and_tables, create_engine_for_profile, get_engine
+from src.services.data_transfer import TRANSFER_MODELS, export_data, export_model, import_data, import_model
+
+async def clear_tables():
+    async with AsyncSession(get_engine()) as session:
+        for model in (Feedback, AISuggestion, TaskNotification, TaskHistory, Task, GoalStats, Goal):
+            await session.exec(delete(model))
+        for table in ARCHIVE_TABLES.values():
+            await session.exec(delete(table))
+        await session.commit()
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+    await clear_tables()
+    yield
+
+async def seed():
+    goal = await GoalManager().create_goal(Goal(name="Goal", description="Ship it"))
+    task = await TaskManager().create_task(Task(
+        name="Write, review", description='Line one\nline "two" — ünïcode',
+        goal_id=goal.id, due_date=datetime(2024, 5, 1, 9, 30), is_time_fixed=True, duration_seconds=1800,
+    ))
+    await TaskManager().create_task(Task(name="Loose", description="No goal"))
+    await TaskHistoryManager().create_task_history(
+        TaskHistory(task_id=task.id, change_type="Update", new_state={"priority": 1, "tags": ["a", "b"]})
+    )
+    suggestion = await AISuggestionManager().create_AIsuggestion(
+        AISuggestion(task_id=task.id, name="Split", content="Split it", confidence=80, implemented=False)
+    )
+    await FeedbackManager().create_feedback(Feedback(ai_suggestion_id=suggestion.id, feedback_type=True, comment="ok"))
+    await TaskNotificationManager().create_task_notification(
+        TaskNotification(task_id=task.id, name="Due", message="Soon", notify_at=datetime(2024, 5, 1, 9))
+    )
+
+async def snapshot():
+    rows = {}
+    async with AsyncSession(get_engine()) as session:
+        for model in TRANSFER_MODELS:
+            items = (await session.exec(select(model).order_by(model.id))).all()
+            rows[model] = [item.model_dump() for item in items]
+        for table in ARCHIVE_TABLES.values():
+            rows[table.name] = (await session.exec(select(*table.columns).order_by(table.c.id))).all()
+    return rows
+
+class TestDataTransfer:
+    """Test suite for streaming export and import."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fmt", ["ndjson", "csv"])
+    async def test_round_trip(self, tmp_path: Path, fmt: str):
+        """Test that an export imports back into identical rows with the same ids."""
+        # Given
+        await seed()
+        before = await snapshot()
+
+        # When
+        exported = await export_data(tmp_path, fmt, batch_size=1)
+        await clear_tables()
+        imported = await import_data(tmp_path, fmt, chunk_size=1)
+
+        # Then
+        assert exported == imported
+        assert imported["task"] == 2
+        assert await snapshot() == before
+        assert (tmp_path / f"task.{fmt}").exists()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fmt", ["ndjson", "csv"])
+    async def test_empty_strings_round_trip(self, tmp_path: Path, fmt: str):
+        """Test that empty strings stay apart from NULLs, and backslashes survive."""
+        # Given
+        await GoalManager().create_goals([
+            Goal(name="Empty", description=""),
+            Goal(name="\\N", description="\\path", status=None),
+        ])
+        before = await snapshot()
+
+        # When
+        await export_data(tmp_path, fmt)
+        await clear_tables()
+        await import_data(tmp_path, fmt)
+
+        # Then
+        goals = await GoalManager().get_all_goals()
+        assert [(goal.name, goal.description, goal.status) for goal in goals] == [("Empty", "", None), ("\\N", "\\path", None)]
+        assert await snapshot() == before
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fmt", ["ndjson", "csv"])
+    async def test_archived_rows_round_trip(self, tmp_path: Path, fmt: str):
+        """Test that archived rows are exported and imported back into the archive tables."""
+        # Given
+        await seed()
+        task_manager = TaskManager()
+        task = next(task for task in await task_manager.get_all_tasks() if task.goal_id is not None)
+        await task_manager.update_task(task.id, status="Completed")
+        await Archiver().archive_completed_tasks(datetime.max)
+        before = await snapshot()
+        archived = await task_manager.get_task(task.id)
+
+        # When
+        exported = await export_data(tmp_path, fmt)
+        await clear_tables()
+        imported = await import_data(tmp_path, fmt)
+
+        # Then
+        assert exported == imported
+        assert imported["archive_task"] == 1
+        assert imported["archive_feedback"] == 1
+        assert await snapshot() == before
+        assert (await task_manager.get_task(task.id)).model_dump() == archived.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_export_is_one_snapshot(self, tmp_path: Path):
+        """Test that rows committed while an export runs are left out of every table."""
+        # Given
+        path = tmp_path / "snapshot.sqlite3"
+        url = f"sqlite+aiosqlite:///{path}"
+        engine = create_engine_for_profile(url, profile="fast")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.exec_driver_sql("INSERT INTO goal (name, description) VALUES ('First', 'd'), ('Second', 'd')")
+        reader = create_engine_for_profile(url, profile="fast", read_only=True)
+        commits = []
+
+        def _commit_during_export(conn, cursor, statement, parameters, context, executemany):
+            if commits or "FROM goal" not in statement:
+                return
+            with sqlite3.connect(path) as other:
+                other.execute("INSERT INTO goal (name, description) VALUES ('Third', 'd')")
+                other.execute("INSERT INTO task (name, description) VALUES ('Late', 'd')")
+            commits.append(True)
+
+        event.listen(reader.sync_engine, "after_cursor_execute", _commit_during_export)
+
+        # When
+        counts = await export_data(tmp_path / "export", batch_size=1, engine=reader)
+        await reader.dispose()
+        await engine.dispose()
+
+        # Then
+        assert commits
+        assert counts["goal"] == 2
+        assert counts["task"] == 0
+
+    @pytest.mark.asyncio
+    async def test_import_maintains_goal_stats(self, tmp_path: Path):
+        """Test that imported tasks go through the bulk insert that maintains goal stats."""
+        # Given
+        TaskManager.maintain_goal_stats = True
+        try:
+            await seed()
+            await export_data(tmp_path)
+            await clear_tables()
+
+            # When
+            await import_data(tmp_path)
+
+            # Then
+            goal, = await GoalManager().get_all_goals()
+            progress = await GoalManager().get_progress(goal.id, use_summary=True)
+            assert progress.total_tasks == 1
+        finally:
+            TaskManager.maintain_goal_stats = False
+
+    @pytest.mark.asyncio
+    async def test_single_model_streams(self):
+        """Test exporting and importing one model through in-memory streams."""
+        # Given
+        await GoalManager().create_goals([Goal(name=f"Goal {i}", description="d") for i in range(5)])
+        stream = io.StringIO()
+
+        # When
+        count = await export_model(Goal, stream, "csv", batch_size=2)
+        await clear_tables()
+        stream.seek(0)
+        imported = await import_model(Goal, stream, "csv", chunk_size=2)
+
+        # Then
+        assert count == imported == 5
+        assert [goal.name for goal in await GoalManager().get_all_goals()] == [f"Goal {i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_unknown_format(self, tmp_path: Path):
+        """Test that an unknown format is rejected."""
+        # When / Then
+        with pytest.raises(ValueError):
+            await export_data(tmp_path, "xml")
+
+    @pytest.mark.asyncio
+    async def test_invalid_rows_are_rejected(self):
+        """Test that an import names the invalid rows and inserts nothing from their chunk."""
+        # Given
+        stream = io.StringIO(
+            '{"id": 1, "name": "Good", "description": "ok"}\n'
+            '{"id": 2, "name": "", "description": "no name", "status": "Done"}\n'
+        )
+
+        # When
+        with pytest.raises(ValueError) as raised:
+            await import_model(Goal, stream)
+
+        # Then
+        assert "row 2:" in str(raised.value)
+        assert "Goal name cannot be empty" in str(raised.value)
+        assert "row 1" not in str(raised.value)
+        assert await GoalManager().get_all_goals() == []
@@ -0,0 +1,99 @@
+# Standard library imports
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete
+
+# Local application imports
+from src.models.model import Goal
+from src.services.database_service import DatabaseService
+from src.services.db_setup import create_db_and_tables, get_engine
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(Goal))
+        await session.commit()
+    yield
+
+@pytest_asyncio.fixture
+async def service():
+    """Provide a DatabaseService instance."""
+    return DatabaseService(get_engine())
+
+@pytest.fixture
+def statements():
+    """Record the SQL statements executed on the application engine."""
+    executed = []
+    listener = lambda conn, cursor, statement, *args: executed.append(statement)
+    event.listen(get_engine().sync_engine, "before_cursor_execute", listener)
+    yield executed
+    event.remove(get_engine().sync_engine, "before_cursor_execute", listener)
+
+class TestDatabaseService:
+    """Test suite for DatabaseService."""
+
+    @pytest.mark.asyncio
+    async def test_update_single_statement(self, service: DatabaseService, statements):
+        """Test update issues one UPDATE ... RETURNING and returns the new state."""
+        # Given
+        goal = await service.create(Goal(name="Goal", description="d"))
+        statements.clear()
+
+        # When
+        updated = await service.update(Goal, goal.id, name="Renamed", status="Completed")
+
+        # Then
+        assert updated.name == "Renamed"
+        assert updated.status == "Completed"
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE goal") and "RETURNING" in statements[0]
+
+    @pytest.mark.asyncio
+    async def test_update_rejects_unknown_field(self, service: DatabaseService):
+        """Test unknown fields are rejected before touching the database."""
+        goal = await service.create(Goal(name="Goal", description="d"))
+        with pytest.raises(ValueError):
+            await service.update(Goal, goal.id, nmae="Typo")
+
+    @pytest.mark.asyncio
+    async def test_delete_single_statement(self, service: DatabaseService, statements):
+        """Test delete issues one DELETE ... RETURNING."""
+        # Given
+        goal = await service.create(Goal(name="Goal", description="d"))
+        statements.clear()
+
+        # When
+        deleted = await service.delete(Goal, goal.id)
+
+        # Then
+        assert deleted is True
+        assert len(statements) == 1
+        assert await service.delete(Goal, goal.id) is False
+        assert await service.update(Goal, goal.id, name="Gone") is None
+
+    @pytest.mark.asyncio
+    async def test_iter_all_and_get_page(self, service: DatabaseService):
+        """Test streaming and paging through items."""
+        # Given
+        ids = [(await service.create(Goal(name=f"Goal {i}", description="d"))).id for i in range(5)]
+
+        # When
+        streamed = [g.id async for g in service.iter_all(Goal, batch_size=2)]
+        page = await service.get_page(Goal, after_id=ids[1], limit=2)
+
+        # Then
+        assert streamed == ids
+        assert [g.id for g in page] == ids[2:4]
@@ -0,0 +1,202 @@
+# Standard library imports
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+from sqlalchemy.exc import OperationalError
+
+# Local application imports
+import src.models
+from src.services.db_setup import (
+    create_engine_for_profile, get_profile_name, is_memory_url, read_only_url, DATABASE_PROFILE_ENV, DATABASE_URL_ENV, READ_POOL_SIZE_ENV
+)
+from src.benchmarks.import_time import DRIVER_MODULE, loaded_modules
+
+async def read_pragmas(engine, names):
+    """Read the current value of each pragma from a fresh connection."""
+    async with engine.connect() as conn:
+        return {name: (await conn.exec_driver_sql(f"PRAGMA {name}")).scalar() for name in names}
+
+class TestEngineProfiles:
+    """Test suite for the engine factory and its pragma profiles."""
+
+    @pytest.mark.asyncio
+    async def test_fast_profile_file_database(self, tmp_path):
+        """Test the fast profile enables WAL and relaxed fsync on a file database."""
+        # Given
+        engine = create_engine_for_profile(f"sqlite+aiosqlite:///{tmp_path / 'fast.sqlite3'}", profile="fast")
+
+        # When
+        pragmas = await read_pragmas(engine, ["journal_mode", "synchronous", "foreign_keys", "busy_timeout", "temp_store"])
+        await engine.dispose()
+
+        # Then
+        assert pragmas == {"journal_mode": "wal", "synchronous": 1, "foreign_keys": 1, "busy_timeout": 5000, "temp_store": 2}
+
+    @pytest.mark.asyncio
+    async def test_durable_profile_full_sync(self, tmp_path):
+        """Test the durable profile keeps a full fsync on every commit."""
+        # Given
+        engine = create_engine_for_profile(f"sqlite+aiosqlite:///{tmp_path / 'durable.sqlite3'}", profile="durable")
+
+        # When
+        pragmas = await read_pragmas(engine, ["journal_mode", "synchronous"])
+        await engine.dispose()
+
+        # Then
+        assert pragmas == {"journal_mode": "wal", "synchronous": 2}
+
+    def test_unknown_profile(self):
+        """Test an unknown profile name is rejected."""
+        with pytest.raises(ValueError):
+            create_engine_for_profile("sqlite+aiosqlite:///:memory:", profile="turbo")
+
+    def test_default_profile_names(self, monkeypatch):
+        """Test in-memory databases default to the test profile and files to fast."""
+        monkeypatch.delenv(DATABASE_PROFILE_ENV, raising=False)
+        assert get_profile_name("sqlite+aiosqlite:///:memory:") == "test"
+        assert get_profile_name("sqlite+aiosqlite:///data.sqlite3") == "fast"
+        monkeypatch.setenv(DATABASE_PROFILE_ENV, "durable")
+        assert get_profile_name("sqlite+aiosqlite:///data.sqlite3") == "durable"
+
+    @pytest.mark.parametrize("url, memory", [
+        ("sqlite+aiosqlite://", True),
+        ("sqlite+aiosqlite:///:memory:", True),
+        ("sqlite+aiosqlite:///:memory:?uri=true", True),
+        ("sqlite+aiosqlite:///file::memory:?cache=shared", True),
+        ("sqlite+aiosqlite:///file::memory:?cache=shared&uri=true", True),
+        ("sqlite+aiosqlite:///file:shared?mode=memory&cache=shared&uri=true", True),
+        ("sqlite+aiosqlite:///data.sqlite3", False),
+        ("sqlite+aiosqlite:///file:/data/tasks.sqlite3?mode=ro&uri=true", False),
+    ])
+    def test_is_memory_url(self, url: str, memory: bool):
+        """Test that every form of in-memory SQLite URL is recognised."""
+        assert is_memory_url(url) is memory
+
+def run_python(code: str, **env) -> str:
+    """Run ``code`` in a fresh interpreter from the project root and return its output."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        cwd=project_root, env={**os.environ, **env},
+    )
+    return result.stdout.strip()
+
+class TestLazyEngine:
+    """Test suite for lazy engine creation and cheap model imports."""
+
+    def test_models_import_without_managers_or_driver(self):
+        """Test importing the models loads neither the managers, the engine setup nor the driver."""
+        # When
+        loaded = loaded_modules("src.models")
+
+        # Then
+        assert "src.models.db_manager" not in loaded
+        assert "src.services.db_setup" not in loaded
+        assert DRIVER_MODULE not in loaded
+
+    def test_managers_import_without_engine(self):
+        """Test importing the managers does not create the engine or load the driver."""
+        # When
+        output = run_python(
+            "import sys; import src.models.db_manager; from src.services import db_setup; "
+            f"print(db_setup._engine is None, {DRIVER_MODULE!r} in sys.modules)"
+        )
+
+        # Then
+        assert output == "True False"
+
+    def test_engine_reads_configuration_on_first_use(self, tmp_path):
+        """Test the URL set after import is the one the engine is created with."""
+        # Given
+        url = f"sqlite+aiosqlite:///{tmp_path / 'late.sqlite3'}"
+
+        # When
+        output = run_python(
+            "import os; from src.models import GoalManager; from src.services.db_setup import get_engine; "
+            f"os.environ[{DATABASE_URL_ENV!r}] = {url!r}; print(get_engine().url, GoalManager.__name__)"
+        )
+
+        # Then
+        assert output == f"{url} GoalManager"
+
+class TestReaderEngine:
+    """Test suite for the read-only connection pool of file databases."""
+
+    @pytest.mark.asyncio
+    async def test_read_only_connections(self, tmp_path):
+        """Test reader connections see committed writes but cannot write."""
+        # Given
+        url = f"sqlite+aiosqlite:///{tmp_path / 'readers.sqlite3'}"
+        writer = create_engine_for_profile(url, profile="fast", pool_size=1)
+        reader = create_engine_for_profile(url, profile="fast", pool_size=2, read_only=True)
+        async with writer.begin() as conn:
+            await conn.exec_driver_sql("CREATE TABLE item (id INTEGER PRIMARY KEY)")
+            await conn.exec_driver_sql("INSERT INTO item VALUES (1)")
+
+        # When
+        pragmas = await read_pragmas(reader, ["query_only", "busy_timeout"])
+        async with writer.begin() as conn:
+            await conn.exec_driver_sql("INSERT INTO item VALUES (2)")
+        async with reader.connect() as conn:
+            ids = list((await conn.exec_driver_sql("SELECT id FROM item ORDER BY id")).scalars())
+            with pytest.raises(OperationalError, match="readonly"):
+                await conn.exec_driver_sql("INSERT INTO item VALUES (3)")
+        sizes = (writer.pool.size(), reader.pool.size())
+        await reader.dispose()
+        await writer.dispose()
+
+        # Then
+        assert ids == [1, 2]
+        assert pragmas == {"query_only": 1, "busy_timeout": 5000}
+        assert sizes == (1, 2)
+
+    def test_read_only_url(self):
+        """Test the read-only URL opens the same file as a read-only SQLite URI."""
+        # When
+        url = read_only_url("sqlite+aiosqlite:////data/tasks.sqlite3")
+
+        # Then
+        assert url == "sqlite+aiosqlite:///file:/data/tasks.sqlite3?mode=ro&uri=true"
+
+    def test_managers_read_from_reader_pool(self, tmp_path):
+        """Test managers of a file database read through the reader pool and write through one connection."""
+        # Given
+        code = (
+            "import asyncio\n"
+            "from src.models.model import Goal\n"
+            "from src.models.db_manager import GoalManager\n"
+            "from src.services.db_setup import create_db_and_tables, get_engine, get_reader_engine\n"
+            "async def main():\n"
+            "    await create_db_and_tables()\n"
+            "    manager = GoalManager()\n"
+            "    goal = await manager.create_goal(Goal(name='Read', description='from a reader'))\n"
+            "    loaded = await manager.get_goal(goal.id)\n"
+            "    print(loaded.name, get_engine().pool.size(), get_reader_engine().pool.size(), "
+            "get_reader_engine() is not get_engine())\n"
+            "asyncio.run(main())\n"
+        )
+
+        # When
+        output = run_python(code, **{DATABASE_URL_ENV: f"sqlite+aiosqlite:///{tmp_path / 'app.sqlite3'}", READ_POOL_SIZE_ENV: "3"})
+
+        # Then
+        assert output.splitlines()[-1] == "Read 1 3 True"
+
+    def test_memory_database_reads_from_writer(self):
+        """Test an in-memory database has no separate reader engine."""
+        # When
+        output = run_python(
+            "from src.services.db_setup import get_engine, get_reader_engine; print(get_reader_engine() is get_engine())",
+            **{DATABASE_URL_ENV: "sqlite+aiosqlite:///:memory:"},
+        )
+
+        # Then
+        assert output == "True"
@@ -0,0 +1,202 @@
+# Standard library imports
+import sys
+import asyncio
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete
+
+# Local application imports
+from src.models.model import Goal, Task, GoalStats
+from src.models.db_manager import TaskManager
+from src.services.database_service import DatabaseService
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.metrics import Histogram, configure, registry
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(Task))
+        await session.exec(delete(GoalStats))
+        await session.exec(delete(Goal))
+        await session.commit()
+    registry.reset()
+    configure(enabled=True, slow_query_ms=-1)
+    yield
+    configure(enabled=False, slow_query_ms=-1, log_parameters=True)
+    registry.reset()
+
+@pytest_asyncio.fixture
+async def task_manager():
+    """Provide a TaskManager instance."""
+    return TaskManager()
+
+def sample_tasks(number: int):
+    return [Task(name=f"Task {i}", description="measured") for i in range(number)]
+
+class TestInstrumentation:
+    """Test suite for method and statement instrumentation."""
+
+    @pytest.mark.asyncio
+    async def test_records_method_calls(self, task_manager: TaskManager):
+        """Test that calls, statements, rows and timings are recorded per method."""
+        # Given
+        task = await task_manager.create_task(Task(name="Measured", description="measured"))
+
+        # When
+        await task_manager.get_task(task.id)
+        await task_manager.get_task(task.id)
+
+        # Then
+        get = registry.methods["TaskManager.get"]
+        assert get.calls == 2
+        assert get.errors == 0
+        assert get.statements == 2
+        assert get.rows == 2
+        assert get.duration.count == 2
+        assert get.db_time.total > 0
+        assert get.pool_wait.count == 2
+        assert registry.methods["TaskManager.create_task"].calls == 1
+        assert registry.statements.count >= 3
+
+    @pytest.mark.asyncio
+    async def test_nested_calls_roll_up(self, task_manager: TaskManager):
+        """Test that statements of an inner instrumented call also count for the outer call."""
+        # When
+        await task_manager.create_tasks(sample_tasks(5), chunk_size=2)
+
+        # Then
+        outer = registry.methods["TaskManager.create_tasks"]
+        inner = registry.methods["TaskManager.create_many"]
+        assert inner.statements >= 3
+        assert outer.statements == inner.statements
+        assert outer.rows == inner.rows == 5
+
+    @pytest.mark.asyncio
+    async def test_async_generators_and_service(self, task_manager: TaskManager):
+        """Test that streamed rows and DatabaseService calls are recorded."""
+        # Given
+        await task_manager.create_tasks(sample_tasks(5))
+        service = DatabaseService(get_engine())
+
+        # When
+        streamed = [task async for task in task_manager.iter_all_tasks(batch_size=2)]
+        await service.get_all(Task)
+
+        # Then
+        iter_all = registry.methods["TaskManager.iter_all"]
+        assert len(streamed) == 5
+        assert iter_all.rows == 5
+        assert iter_all.statements == 3
+        assert registry.methods["DatabaseService.get_all"].rows == 5
+
+    @pytest.mark.asyncio
+    async def test_breaking_out_of_async_generators(self, task_manager: TaskManager):
+        """Test that a stream left early is recorded without the consumer's statements."""
+        # Given
+        await task_manager.create_tasks(sample_tasks(5))
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+        # When
+        try:
+            async for task in task_manager.iter_all_tasks(batch_size=2):
+                await task_manager.get_task(task.id)
+                break
+            await task_manager.get_task(task.id)
+            for _ in range(5):
+                await asyncio.sleep(0)
+        finally:
+            loop.set_exception_handler(None)
+
+        # Then
+        iter_all = registry.methods["TaskManager.iter_all"]
+        assert errors == []
+        assert (iter_all.calls, iter_all.errors, iter_all.rows, iter_all.statements) == (1, 0, 1, 1)
+        assert registry.methods["TaskManager.get"].statements == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted(self, task_manager: TaskManager):
+        """Test that a call that raises is recorded as an error."""
+        # When
+        with pytest.raises(ValueError):
+            await task_manager.update_task_values(1, not_a_column=1)
+
+        # Then
+        assert registry.methods["TaskManager.update_values"].errors == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, task_manager: TaskManager):
+        """Test that nothing is recorded when instrumentation is off."""
+        # Given
+        configure(enabled=False)
+
+        # When
+        await task_manager.create_task(Task(name="Unmeasured", description="not measured"))
+
+        # Then
+        assert registry.methods == {}
+        assert registry.statements.count == 0
+
+class TestSlowQueryLog:
+    """Test suite for the slow-query log."""
+
+    @pytest.mark.asyncio
+    async def test_logs_statement_and_parameters(self, task_manager: TaskManager, caplog):
+        """Test that statements over the threshold are logged with their parameters."""
+        # Given
+        configure(enabled=False, slow_query_ms=0)
+
+        # When
+        with caplog.at_level(logging.WARNING, logger="src.services.metrics.slow_query"):
+            await task_manager.find_tasks(status="Completed")
+
+        # Then
+        entry = registry.slow_queries[-1]
+        assert entry["statement"].startswith("SELECT")
+        assert "Completed" in entry["parameters"]
+        assert any("Slow query" in record.message and "Completed" in record.message for record in caplog.records)
+
+    @pytest.mark.asyncio
+    async def test_parameters_can_be_left_out(self, task_manager: TaskManager):
+        """Test that parameters are not kept when parameter logging is off."""
+        # Given
+        configure(slow_query_ms=0, log_parameters=False)
+
+        # When
+        await task_manager.find_tasks(status="Completed")
+
+        # Then
+        assert "parameters" not in registry.slow_queries[-1]
+
+class TestHistogram:
+    """Test suite for Histogram."""
+
+    def test_percentiles(self):
+        """Test that percentiles report bucket bounds capped at the maximum."""
+        # Given
+        histogram = Histogram()
+
+        # When
+        for value in [0.0004] * 98 + [0.02, 30.0]:
+            histogram.observe(value)
+
+        # Then
+        assert histogram.count == 100
+        assert histogram.percentile(0.5) == 0.0005
+        assert histogram.percentile(0.99) == 0.025
+        assert histogram.percentile(1.0) == 30.0
+        assert histogram.snapshot()["buckets"]["inf"] == 1
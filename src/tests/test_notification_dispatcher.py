@@ -0,0 +1,210 @@
+# Standard library imports
+import sys
+import asyncio
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete, select
+
+# Local application imports
+from src.models.model import TaskNotification
+from src.models.db_manager import TaskNotificationManager
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.notification_dispatcher import NotificationDispatcher
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(TaskNotification))
+        await session.commit()
+    yield
+
+class Recorder:
+    """Collects the notifications passed to the dispatcher's handler."""
+
+    def __init__(self, fail_for=(), fail_once=()):
+        self.sent = []
+        self.fail_for = set(fail_for)
+        self.fail_once = set(fail_once)
+
+    async def __call__(self, notification: TaskNotification) -> None:
+        if notification.name in self.fail_for:
+            raise RuntimeError("delivery failed")
+        if notification.name in self.fail_once:
+            self.fail_once.discard(notification.name)
+            raise RuntimeError("delivery failed")
+        self.sent.append(notification.name)
+
+async def wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+async def sent_names():
+    async with AsyncSession(get_engine()) as session:
+        stmt = select(TaskNotification.name).where(TaskNotification.sent_at.is_not(None))
+        return sorted(await session.exec(stmt))
+
+def notification(name: str, delay: float = 0.0) -> TaskNotification:
+    return TaskNotification(name=name, message=f"{name} message", notify_at=datetime.now() + timedelta(seconds=delay))
+
+class TestNotificationDispatcher:
+    """Test suite for NotificationDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_seeds_from_unsent_rows(self):
+        """Test that due unsent rows are sent in time order and stamped."""
+        # Given
+        manager = TaskNotificationManager()
+        await manager.create_task_notifications([
+            notification("second", -1),
+            notification("first", -2),
+            notification("later", 3600),
+        ])
+        await manager.create_task_notification(
+            TaskNotification(name="done", message="sent before", sent_at=datetime.now())
+        )
+        recorder = Recorder()
+
+        # When
+        async with NotificationDispatcher(recorder, manager=manager, flush_interval=0.01) as dispatcher:
+            await wait_until(lambda: len(recorder.sent) == 2)
+
+        # Then
+        assert recorder.sent == ["first", "second"]
+        assert len(dispatcher) == 1
+        assert await sent_names() == ["done", "first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_picks_up_new_notifications(self):
+        """Test that notifications created through the manager are sent without a rescan."""
+        # Given
+        recorder = Recorder()
+        dispatcher = NotificationDispatcher(recorder, flush_interval=0.01)
+        manager = TaskNotificationManager(dispatcher=dispatcher)
+        await dispatcher.start()
+
+        # When
+        await manager.create_task_notification(notification("soon", 0.3))
+        await manager.create_task_notifications([notification("now"), notification("never", 3600)])
+        await wait_until(lambda: len(recorder.sent) == 2)
+        await dispatcher.stop()
+
+        # Then
+        assert recorder.sent == ["now", "soon"]
+        assert await sent_names() == ["now", "soon"]
+
+    @pytest.mark.asyncio
+    async def test_rescheduled_and_deleted_notifications(self):
+        """Test that changes and deletions through the manager reach the dispatcher."""
+        # Given
+        recorder = Recorder()
+        dispatcher = NotificationDispatcher(recorder, flush_interval=0.01)
+        manager = TaskNotificationManager(dispatcher=dispatcher)
+        await dispatcher.start()
+        moved = await manager.create_task_notification(notification("moved", 3600))
+        deleted = await manager.create_task_notification(notification("deleted", 0.05))
+
+        # When
+        await manager.update_task_notification(moved.id, notify_at=datetime.now())
+        await manager.delete_task_notfication(deleted.id)
+        await wait_until(lambda: len(recorder.sent) == 1)
+        await asyncio.sleep(0.1)
+        await dispatcher.stop()
+
+        # Then
+        assert recorder.sent == ["moved"]
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_is_not_stamped(self):
+        """Test that a notification whose handler raises stays unsent."""
+        # Given
+        manager = TaskNotificationManager()
+        await manager.create_task_notifications([notification("ok"), notification("broken")])
+        recorder = Recorder(fail_for={"broken"})
+
+        # When
+        async with NotificationDispatcher(recorder, manager=manager, flush_interval=0.01) as dispatcher:
+            await wait_until(lambda: dispatcher.sent + dispatcher.failed == 2)
+
+        # Then
+        assert dispatcher.failed == 1
+        assert await sent_names() == ["ok"]
+        assert [n.name for n in await manager.get_unsent_task_notifications()] == ["broken"]
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_is_retried(self):
+        """Test that a failed notification is sent on a later attempt and stamped."""
+        # Given
+        manager = TaskNotificationManager()
+        await manager.create_task_notifications([notification("flaky")])
+        recorder = Recorder(fail_once={"flaky"})
+
+        # When
+        async with NotificationDispatcher(recorder, manager=manager, flush_interval=0.01, retry_delay=0.01) as dispatcher:
+            await wait_until(lambda: dispatcher.sent == 1)
+
+        # Then
+        assert dispatcher.failed == 1
+        assert recorder.sent == ["flaky"]
+        assert await sent_names() == ["flaky"]
+
+    @pytest.mark.asyncio
+    async def test_retries_stop_after_max_attempts(self):
+        """Test that a notification that keeps failing is dropped after max_attempts."""
+        # Given
+        manager = TaskNotificationManager()
+        await manager.create_task_notifications([notification("broken")])
+        recorder = Recorder(fail_for={"broken"})
+
+        # When
+        async with NotificationDispatcher(recorder, manager=manager, max_attempts=3, retry_delay=0.01) as dispatcher:
+            await wait_until(lambda: dispatcher.failed == 3)
+            await asyncio.sleep(0.1)
+
+        # Then
+        assert dispatcher.failed == 3
+        assert len(dispatcher) == 0
+        assert await sent_names() == []
+
+    def test_stale_entries_are_compacted(self):
+        """Test that rescheduling one notification many times does not grow the heap."""
+        # Given
+        dispatcher = NotificationDispatcher(Recorder(), manager=TaskNotificationManager())
+        pending = TaskNotification(id=1, name="moved", message="moved", notify_at=datetime(2024, 1, 1))
+        dispatcher.schedule(TaskNotification(id=2, name="other", message="other", notify_at=datetime(2024, 1, 2)))
+
+        # When
+        for minute in range(100):
+            pending.notify_at = datetime(2024, 1, 1, 0, minute % 60, minute // 60)
+            dispatcher.schedule(pending)
+
+        # Then
+        assert len(dispatcher) == 2
+        assert len(dispatcher._heap) <= 4
+
+    @pytest.mark.asyncio
+    async def test_unsent_query_uses_partial_index(self):
+        """Test that seeding reads unsent rows through the partial index."""
+        # Given
+        sql = "SELECT id FROM tasknotification WHERE sent_at IS NULL ORDER BY notify_at"
+
+        # When
+        async with get_engine().connect() as conn:
+            plan = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")).all()
+
+        # Then
+        assert any("ix_tasknotification_unsent_notify_at" in row[-1] for row in plan)
@@ -0,0 +1,137 @@
+# Standard library imports
+import sys
+from pathlib import Path
+from datetime import datetime
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete
+
+# Local application imports
+from src.models.model import Goal, Task, GoalStats
+from src.models.db_manager import GoalManager, TaskManager
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.projection import record_type, resolve_fields
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(Task))
+        await session.exec(delete(GoalStats))
+        await session.exec(delete(Goal))
+        await session.commit()
+    yield
+
+@pytest_asyncio.fixture
+async def task_manager():
+    """Provide a TaskManager instance."""
+    return TaskManager()
+
+@pytest_asyncio.fixture
+async def goal_manager():
+    """Provide a GoalManager instance."""
+    return GoalManager()
+
+async def create_sample_tasks(task_manager: TaskManager, goal_id=None):
+    return await task_manager.create_tasks([
+        Task(name="Draft", description="a", status="Not Started", priority=1, goal_id=goal_id, due_date=datetime(2024, 3, 1)),
+        Task(name="Review", description="b", status="In Progress", priority=3, due_date=datetime(2024, 2, 1)),
+        Task(name="Ship", description="c", status="Completed", priority=2, goal_id=goal_id, due_date=datetime(2024, 1, 1)),
+    ])
+
+class TestListTasks:
+    """Test suite for TaskManager.list_tasks."""
+
+    @pytest.mark.asyncio
+    async def test_default_fields(self, task_manager: TaskManager):
+        """Test that records hold the default list columns and are not Task instances."""
+        # Given
+        await create_sample_tasks(task_manager)
+
+        # When
+        records = await task_manager.list_tasks(order_by="due_date")
+
+        # Then
+        assert [record.name for record in records] == ["Ship", "Review", "Draft"]
+        assert records[0]._fields == ("id", "name", "status", "due_date")
+        assert records[0] == (records[0].id, "Ship", "Completed", datetime(2024, 1, 1))
+        assert not isinstance(records[0], Task)
+        assert not hasattr(records[0], "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_fields_and_filters(self, task_manager: TaskManager, goal_manager: GoalManager):
+        """Test that filters and ordering may use columns outside the requested fields."""
+        # Given
+        goal = await goal_manager.create_goal(Goal(name="Launch", description="Launch the app"))
+        await create_sample_tasks(task_manager, goal_id=goal.id)
+
+        # When
+        records = await task_manager.list_tasks(fields=["name"], goal_id=goal.id, order_by="-priority")
+        single = await task_manager.list_tasks(fields=["priority"], status=["In Progress"])
+
+        # Then
+        assert records == [("Ship",), ("Draft",)]
+        assert single[0].priority == 3
+
+    @pytest.mark.asyncio
+    async def test_records_are_read_only(self, task_manager: TaskManager):
+        """Test that records cannot be changed."""
+        # Given
+        await create_sample_tasks(task_manager)
+        record = (await task_manager.list_tasks(limit=1))[0]
+
+        # When / Then
+        with pytest.raises(AttributeError):
+            record.name = "Changed"
+
+    @pytest.mark.asyncio
+    async def test_unknown_field(self, task_manager: TaskManager):
+        """Test that fields that are not columns are rejected."""
+        # When / Then
+        with pytest.raises(ValueError, match="Unknown field"):
+            await task_manager.list_tasks(fields=["name", "task_history"])
+        with pytest.raises(ValueError):
+            await task_manager.list_tasks(fields=[])
+
+class TestListGoals:
+    """Test suite for GoalManager.list_goals."""
+
+    @pytest.mark.asyncio
+    async def test_list_goals(self, goal_manager: GoalManager):
+        """Test that goals are listed as records in the requested order."""
+        # Given
+        await goal_manager.create_goals([
+            Goal(name="Alpha", description="first", status="In Progress"),
+            Goal(name="Beta", description="second", status="Completed"),
+        ])
+
+        # When
+        records = await goal_manager.list_goals(order_by="-name", limit=1)
+        names = await goal_manager.list_goals(fields=("name", "status"))
+
+        # Then
+        assert [record.name for record in records] == ["Beta"]
+        assert sorted(names) == [("Alpha", "In Progress"), ("Beta", "Completed")]
+
+class TestRecordType:
+    """Test suite for the projection helpers."""
+
+    def test_record_type_is_cached(self):
+        """Test that one record class is made per model and field list."""
+        # When
+        fields = resolve_fields(Task, ["id", "name"])
+
+        # Then
+        assert record_type(Task, fields) is record_type(Task, ("id", "name"))
+        assert record_type(Task, fields).__name__ == "TaskRecord"
+        assert resolve_fields(Goal) == ("id", "name", "status")
@@ -0,0 +1,264 @@
+# Standard library imports
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete
+
+# Local application imports
+from src.models.model import Task
+from src.models.db_manager import TaskManager
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.recurrence import OccurrenceCache, iter_occurrences, parse_rule, series_end
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(Task))
+        await session.commit()
+    TaskManager.occurrence_cache.clear()
+    yield
+
+@pytest_asyncio.fixture
+async def task_manager():
+    """Provide a TaskManager instance."""
+    return TaskManager()
+
+def expand(rule: str, dtstart: datetime, start=None, end=None):
+    return list(iter_occurrences(parse_rule(rule), dtstart, start, end))
+
+class TestParseRule:
+    """Test suite for recurrence rule parsing."""
+
+    def test_parse_full_rule(self):
+        """Test parsing every supported part."""
+        # When
+        rule = parse_rule("RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=WE,MO;COUNT=10")
+
+        # Then
+        assert rule.freq == "WEEKLY"
+        assert rule.interval == 2
+        assert rule.count == 10
+        assert rule.byday == (0, 2)
+
+    def test_parse_bare_frequency(self):
+        """Test that a bare frequency is accepted."""
+        # When / Then
+        assert parse_rule("daily").freq == "DAILY"
+
+    @pytest.mark.parametrize("text", [
+        "FREQ=HOURLY",
+        "FREQ=DAILY;INTERVAL=0",
+        "FREQ=DAILY;COUNT=2;UNTIL=20240101",
+        "FREQ=MONTHLY;BYDAY=MO",
+        "FREQ=DAILY;BYMONTH=1",
+        "every other day",
+    ])
+    def test_parse_invalid_rule(self, text: str):
+        """Test that malformed or unsupported rules are rejected."""
+        # When / Then
+        with pytest.raises(ValueError):
+            parse_rule(text)
+
+class TestIterOccurrences:
+    """Test suite for lazy occurrence expansion."""
+
+    def test_daily_window(self):
+        """Test a daily rule restricted to a window."""
+        # Given
+        dtstart = datetime(2024, 1, 1, 9, 0)
+
+        # When
+        occurrences = expand("FREQ=DAILY;INTERVAL=2", dtstart, datetime(2024, 1, 4), datetime(2024, 1, 10))
+
+        # Then
+        assert occurrences == [datetime(2024, 1, day, 9, 0) for day in (5, 7, 9)]
+
+    def test_far_window_is_not_materialised(self):
+        """Test that a window centuries after the start expands only its own occurrences."""
+        # Given
+        dtstart = datetime(2024, 1, 1, 9, 0)
+
+        # When
+        occurrences = expand("FREQ=DAILY", dtstart, datetime(2400, 1, 1), datetime(2400, 1, 3))
+
+        # Then
+        assert occurrences == [datetime(2400, 1, 1, 9, 0), datetime(2400, 1, 2, 9, 0)]
+
+    def test_weekly_byday_with_count(self):
+        """Test that COUNT is applied across weeks when jumping into a window."""
+        # Given: Wednesday 3 January 2024
+        dtstart = datetime(2024, 1, 3, 10, 0)
+
+        # When
+        everything = expand("FREQ=WEEKLY;BYDAY=MO,WE,FR;COUNT=5", dtstart)
+        windowed = expand("FREQ=WEEKLY;BYDAY=MO,WE,FR;COUNT=5", dtstart, datetime(2024, 1, 9), datetime(2024, 2, 1))
+
+        # Then
+        assert everything == [datetime(2024, 1, day, 10, 0) for day in (3, 5, 8, 10, 12)]
+        assert windowed == [datetime(2024, 1, 10, 10, 0), datetime(2024, 1, 12, 10, 0)]
+
+    def test_monthly_skips_missing_days(self):
+        """Test that months without the start day are skipped."""
+        # Given
+        dtstart = datetime(2024, 1, 31)
+
+        # When
+        occurrences = expand("FREQ=MONTHLY;COUNT=3", dtstart)
+
+        # Then
+        assert occurrences == [datetime(2024, 1, 31), datetime(2024, 3, 31), datetime(2024, 5, 31)]
+
+    def test_yearly_until(self):
+        """Test a yearly rule bounded by UNTIL."""
+        # Given
+        dtstart = datetime(2024, 2, 29)
+
+        # When
+        occurrences = expand("FREQ=YEARLY;UNTIL=20330101", dtstart)
+
+        # Then
+        assert occurrences == [datetime(2024, 2, 29), datetime(2028, 2, 29), datetime(2032, 2, 29)]
+
+    def test_series_end(self):
+        """Test the end of bounded, unbounded and unparseable series."""
+        # Given
+        dtstart = datetime(2024, 1, 1, 9)
+
+        # When / Then
+        assert series_end("FREQ=WEEKLY;BYDAY=MO,FR;COUNT=3", dtstart) == datetime(2024, 1, 8, 9)
+        assert series_end("FREQ=DAILY;UNTIL=20240110", dtstart) == datetime(2024, 1, 10)
+        assert series_end("FREQ=DAILY", dtstart) is None
+        assert series_end("FREQ=HOURLY", dtstart) == dtstart
+        assert series_end(None, dtstart) is None
+
+class TestOccurrenceCache:
+    """Test suite for OccurrenceCache."""
+
+    def test_cached_until_rule_changes(self):
+        """Test that expansions are cached and recomputed after a rule change."""
+        # Given
+        cache = OccurrenceCache()
+        dtstart = datetime(2024, 1, 1)
+        window = (datetime(2024, 1, 1), datetime(2024, 1, 8))
+
+        # When
+        first = cache.occurrences(1, "FREQ=DAILY", dtstart, *window)
+        second = cache.occurrences(1, "FREQ=DAILY", dtstart, *window)
+        changed = cache.occurrences(1, "FREQ=DAILY;INTERVAL=2", dtstart, *window)
+
+        # Then
+        assert first is second
+        assert len(first) == 7
+        assert len(changed) == 4
+
+class TestGetOccurrences:
+    """Test suite for TaskManager.get_occurrences."""
+
+    @pytest.mark.asyncio
+    async def test_week_view(self, task_manager: TaskManager):
+        """Test that one-off and recurring tasks are listed for a week."""
+        # Given
+        week_start = datetime(2024, 3, 18)
+        week_end = week_start + timedelta(days=7)
+        await task_manager.create_tasks([
+            Task(name="Standup", description="Team sync", due_date=datetime(2020, 1, 1, 9), reccurence="FREQ=WEEKLY;BYDAY=MO,TH"),
+            Task(name="Report", description="Once", due_date=datetime(2024, 3, 20, 12)),
+            Task(name="Old", description="Once", due_date=datetime(2024, 3, 1, 12)),
+            Task(name="Finished", description="Ended", due_date=datetime(2020, 1, 1), reccurence="FREQ=DAILY;COUNT=3"),
+        ])
+
+        # When
+        occurrences = await task_manager.get_occurrences(week_start, week_end)
+
+        # Then
+        assert [(task.name, due) for task, due in occurrences] == [
+            ("Standup", datetime(2024, 3, 18, 9)),
+            ("Report", datetime(2024, 3, 20, 12)),
+            ("Standup", datetime(2024, 3, 21, 9)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_occurrences(self, task_manager: TaskManager):
+        """Test that changing a task's rule changes its occurrences."""
+        # Given
+        window = (datetime(2024, 3, 18), datetime(2024, 3, 25))
+        task = await task_manager.create_task(
+            Task(name="Water plants", description="Garden", due_date=datetime(2024, 3, 1), reccurence="FREQ=DAILY")
+        )
+        assert len(await task_manager.get_occurrences(*window)) == 7
+
+        # When
+        await task_manager.update_task(task.id, reccurence="FREQ=WEEKLY")
+
+        # Then
+        assert [due for _, due in await task_manager.get_occurrences(*window)] == [datetime(2024, 3, 22)]
+
+    @pytest.mark.asyncio
+    async def test_ended_series_are_not_read(self, task_manager: TaskManager, monkeypatch: pytest.MonkeyPatch):
+        """Test that series ended before the window are not read, and that updates keep their end."""
+        # Given
+        window = (datetime(2024, 3, 18), datetime(2024, 3, 25))
+        finished_id, running_id, moved_id = await task_manager.create_tasks([
+            Task(name="Finished", description="Ended", due_date=datetime(2020, 1, 1), reccurence="FREQ=DAILY;COUNT=3"),
+            Task(name="Running", description="Open", due_date=datetime(2024, 1, 1), reccurence="FREQ=WEEKLY"),
+            Task(name="Moved", description="Ended", due_date=datetime(2020, 1, 1), reccurence="FREQ=DAILY;COUNT=2"),
+        ])
+        expanded = []
+        occurrences = TaskManager.occurrence_cache.occurrences
+        def _occurrences(key, *args):
+            expanded.append(key)
+            return occurrences(key, *args)
+        monkeypatch.setattr(TaskManager.occurrence_cache, "occurrences", _occurrences)
+
+        # When
+        await task_manager.get_occurrences(*window)
+        before = list(expanded)
+        await task_manager.update_task_values(finished_id, reccurence="FREQ=WEEKLY")
+        await task_manager.update_task_rows([{"id": moved_id, "due_date": datetime(2024, 3, 19)}])
+        expanded.clear()
+        await task_manager.get_occurrences(*window)
+
+        # Then
+        assert before == [running_id]
+        assert sorted(expanded) == [finished_id, running_id, moved_id]
+        assert (await task_manager.get_task(finished_id)).series_end is None
+        assert (await task_manager.get_task(moved_id)).series_end == datetime(2024, 3, 20)
+
+    @pytest.mark.asyncio
+    async def test_recurring_query_uses_partial_index(self):
+        """Test that recurring tasks are found through the occurrence window index."""
+        # Given
+        sql = "SELECT id FROM task WHERE reccurence IS NOT NULL AND due_date < '2024-01-01'"
+
+        # When
+        async with get_engine().connect() as conn:
+            plan = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")).all()
+
+        # Then
+        assert any("ix_task_recurring_due_date" in row[-1] for row in plan)
+
+    @pytest.mark.asyncio
+    async def test_running_series_query_uses_series_end_index(self):
+        """Test that series that have not ended are found through the series end index."""
+        # Given
+        sql = "SELECT id FROM task WHERE reccurence IS NOT NULL AND due_date < '2024-01-08' AND series_end >= '2024-01-01'"
+
+        # When
+        async with get_engine().connect() as conn:
+            plan = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")).all()
+
+        # Then
+        assert any("ix_task_recurring_series_end" in row[-1] for row in plan)
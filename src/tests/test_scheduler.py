@@ -0,0 +1,246 @@
+# Standard library imports
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete
+
+# Local application imports
+from src.models.model import Task
+from src.models.db_manager import TaskManager
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.scheduler import IntervalSet, SchedulableTask, Scheduler, reschedule_task, schedule_open_tasks
+
+WINDOW_START = datetime(2024, 3, 18, 9, 0)
+WINDOW_END = datetime(2024, 3, 18, 17, 0)
+HOUR = 3600
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(Task))
+        await session.commit()
+    yield
+
+@pytest_asyncio.fixture
+async def task_manager():
+    """Provide a TaskManager instance."""
+    return TaskManager()
+
+def at(hours: float) -> datetime:
+    return WINDOW_START + timedelta(hours=hours)
+
+class TestIntervalSet:
+    """Test suite for the free-time interval set."""
+
+    def test_reserve_and_release(self):
+        """Test that reserving splits intervals and releasing merges them back."""
+        # Given
+        free = IntervalSet(0, 100)
+
+        # When
+        free.reserve(10, 20)
+        free.reserve(50, 60)
+
+        # Then
+        assert list(free) == [(0, 10), (20, 50), (60, 100)]
+        assert free.find(0, 15) == 20
+        assert free.find(55, 10) == 60
+
+        # When
+        free.release(10, 20)
+        free.release(50, 60)
+
+        # Then
+        assert list(free) == [(0, 100)]
+
+class TestScheduler:
+    """Test suite for Scheduler."""
+
+    def test_orders_by_priority_then_due_date(self):
+        """Test that more important and earlier due tasks get earlier slots."""
+        # Given
+        scheduler = Scheduler(WINDOW_START, WINDOW_END)
+        tasks = [
+            SchedulableTask(1, priority=3, duration_seconds=HOUR),
+            SchedulableTask(2, priority=1, due_date=at(6), duration_seconds=HOUR),
+            SchedulableTask(3, priority=1, due_date=at(2), duration_seconds=HOUR),
+        ]
+
+        # When
+        placements = scheduler.schedule(tasks)
+
+        # Then
+        assert placements == {3: at(0), 2: at(1), 1: at(2)}
+
+    def test_respects_fixed_tasks(self):
+        """Test that fixed tasks keep their time and block it for the others."""
+        # Given
+        scheduler = Scheduler(WINDOW_START, WINDOW_END)
+        tasks = [
+            SchedulableTask(1, is_time_fixed=True, start_date=at(0.5), duration_seconds=HOUR),
+            SchedulableTask(2, priority=1, duration_seconds=HOUR),
+            SchedulableTask(3, priority=2, duration_seconds=HOUR // 2),
+        ]
+
+        # When
+        placements = scheduler.schedule(tasks)
+
+        # Then
+        assert placements == {1: at(0.5), 2: at(1.5), 3: at(0)}
+
+    def test_unplaceable_task_is_none(self):
+        """Test that a task that does not fit in the window gets no slot."""
+        # Given
+        scheduler = Scheduler(WINDOW_START, WINDOW_END)
+
+        # When
+        placements = scheduler.schedule([SchedulableTask(1, duration_seconds=9 * HOUR)])
+
+        # Then
+        assert placements == {1: None}
+
+    def test_reschedule_moves_only_displaced_tasks(self):
+        """Test that a new fixed task only evicts the tasks overlapping it."""
+        # Given
+        scheduler = Scheduler(WINDOW_START, WINDOW_END)
+        scheduler.schedule([SchedulableTask(i, priority=i, duration_seconds=HOUR) for i in range(1, 5)])
+
+        # When
+        moved = scheduler.reschedule(SchedulableTask(9, is_time_fixed=True, start_date=at(1), duration_seconds=HOUR))
+
+        # Then
+        assert moved == {9: at(1), 2: at(4)}
+        assert scheduler.placements[1] == at(0)
+        assert scheduler.placements[3] == at(2)
+        assert scheduler.placements[4] == at(3)
+
+    def test_raised_priority_evicts_lower_priority_tasks(self):
+        """Test that a flexible task whose priority went up takes the slot of a lower-priority task."""
+        # Given
+        scheduler = Scheduler(WINDOW_START, WINDOW_END)
+        scheduler.schedule([SchedulableTask(i, priority=i, duration_seconds=HOUR) for i in range(1, 5)])
+
+        # When
+        moved = scheduler.reschedule(SchedulableTask(4, priority=1, duration_seconds=HOUR))
+
+        # Then
+        assert moved == {4: at(1), 2: at(3)}
+        assert scheduler.placements == {1: at(0), 2: at(3), 3: at(2), 4: at(1)}
+
+    def test_remove_frees_slot(self):
+        """Test that removing a task lets a changed task take its slot."""
+        # Given
+        scheduler = Scheduler(WINDOW_START, WINDOW_END)
+        scheduler.schedule([SchedulableTask(i, priority=i, duration_seconds=HOUR) for i in range(1, 4)])
+
+        # When
+        scheduler.remove(1)
+        moved = scheduler.reschedule(SchedulableTask(3, priority=3, duration_seconds=HOUR))
+
+        # Then
+        assert moved == {3: at(0)}
+        assert 1 not in scheduler.placements
+
+    def test_large_schedule(self):
+        """Test that many tasks are placed without overlapping."""
+        # Given
+        window_end = WINDOW_START + timedelta(days=365)
+        scheduler = Scheduler(WINDOW_START, window_end)
+        tasks = [
+            SchedulableTask(i, priority=i % 5 + 1, duration_seconds=600 + i % 7 * 60, due_date=at(i % 97))
+            for i in range(1, 20001)
+        ]
+        tasks += [
+            SchedulableTask(30000 + i, is_time_fixed=True, start_date=at(i * 5), duration_seconds=HOUR)
+            for i in range(100)
+        ]
+
+        # When
+        placements = scheduler.schedule(tasks)
+
+        # Then
+        spans = sorted(
+            (placements[task.id], placements[task.id] + timedelta(seconds=task.duration_seconds))
+            for task in tasks
+        )
+        assert all(end <= next_start for (_, end), (next_start, _) in zip(spans, spans[1:]))
+
+class TestScheduleOpenTasks:
+    """Test suite for scheduling stored tasks."""
+
+    @pytest.mark.asyncio
+    async def test_writes_suggested_start_times(self, task_manager: TaskManager):
+        """Test that suggested start times are written back and completed tasks are skipped."""
+        # Given
+        ids = await task_manager.create_tasks([
+            Task(name="Low", description="Low", priority=3, duration_seconds=HOUR),
+            Task(name="High", description="High", priority=1, duration_seconds=HOUR),
+            Task(name="Done", description="Done", priority=1, duration_seconds=HOUR, status="Completed"),
+        ])
+
+        # When
+        scheduler = await schedule_open_tasks(task_manager, WINDOW_START, WINDOW_END)
+
+        # Then
+        tasks = {task.id: task for task in await task_manager.get_all_tasks()}
+        assert tasks[ids[1]].suggested_start_time == at(0)
+        assert tasks[ids[0]].suggested_start_time == at(1)
+        assert tasks[ids[2]].suggested_start_time is None
+        assert ids[2] not in scheduler.placements
+
+    @pytest.mark.asyncio
+    async def test_reschedule_task_writes_moved_start_times(self, task_manager: TaskManager):
+        """Test that rescheduling one task writes the start times of every task it moved."""
+        # Given
+        low, high = await task_manager.create_tasks([
+            Task(name="Low", description="Low", priority=2, duration_seconds=HOUR),
+            Task(name="Later", description="Later", priority=3, duration_seconds=HOUR),
+        ])
+        scheduler = await schedule_open_tasks(task_manager, WINDOW_START, WINDOW_END)
+
+        # When
+        await task_manager.update_task(high, priority=1)
+        moved = await reschedule_task(task_manager, scheduler, SchedulableTask(high, priority=1, duration_seconds=HOUR))
+
+        # Then
+        tasks = {task.id: task for task in await task_manager.get_all_tasks()}
+        assert moved == {high: at(0), low: at(1)}
+        assert tasks[high].suggested_start_time == at(0)
+        assert tasks[low].suggested_start_time == at(1)
+
+    @pytest.mark.asyncio
+    async def test_update_task_rows(self, task_manager: TaskManager):
+        """Test per-row bulk updates."""
+        # Given
+        ids = await task_manager.create_tasks([Task(name="A", description="A"), Task(name="B", description="B")])
+
+        # When
+        updated = await task_manager.update_task_rows([
+            {"id": ids[0], "priority": 1},
+            {"id": ids[1], "priority": 5},
+        ])
+
+        # Then
+        assert updated == 2
+        assert (await task_manager.get_task(ids[0])).priority == 1
+        assert (await task_manager.get_task(ids[1])).priority == 5
+
+    @pytest.mark.asyncio
+    async def test_update_task_rows_unknown_field(self, task_manager: TaskManager):
+        """Test that per-row updates reject unknown fields."""
+        # When / Then
+        with pytest.raises(ValueError):
+            await task_manager.update_task_rows([{"id": 1, "nonexistent": 1}])
@@ -0,0 +1,130 @@
+# Standard library imports
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete
+
+# Local application imports
+from src.models.model import Goal, Task
+from src.models.db_manager import GoalManager, TaskManager
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.search import match_query, rebuild_search_index
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(Task))
+        await session.exec(delete(Goal))
+        await session.commit()
+    yield
+
+@pytest_asyncio.fixture
+async def task_manager():
+    """Provide a TaskManager instance."""
+    return TaskManager()
+
+@pytest_asyncio.fixture
+async def goal_manager():
+    """Provide a GoalManager instance."""
+    return GoalManager()
+
+class TestMatchQuery:
+    """Test suite for match_query."""
+
+    def test_quotes_terms(self):
+        """Test that operators and punctuation are searched literally."""
+        # When / Then
+        assert match_query('budget "report" OR -draft') == '"budget" "report" "OR" "draft"*'
+        assert match_query("budget", prefix=False) == '"budget"'
+        assert match_query("  --  ") == ""
+
+class TestSearch:
+    """Test suite for full-text search."""
+
+    @pytest.mark.asyncio
+    async def test_ranked_results_with_snippets(self, task_manager: TaskManager):
+        """Test that better matches rank first and carry snippets."""
+        # Given
+        await task_manager.create_tasks([
+            Task(name="Write report", description="Quarterly budget report for the budget committee"),
+            Task(name="Budget", description="Review the budget"),
+            Task(name="Gardening", description="Plant tomatoes"),
+        ])
+
+        # When
+        results = await task_manager.search("budget")
+
+        # Then
+        assert [result.item.name for result in results] == ["Budget", "Write report"]
+        assert results[0].rank <= results[1].rank
+        assert "[budget]" in results[1].snippet.lower()
+
+    @pytest.mark.asyncio
+    async def test_prefix_and_goal_filter(self, task_manager: TaskManager, goal_manager: GoalManager):
+        """Test prefix matching and restricting tasks to a goal."""
+        # Given
+        goal = await goal_manager.create_goal(Goal(name="Fitness", description="Run a marathon"))
+        await task_manager.create_tasks([
+            Task(name="Running shoes", description="Buy them", goal_id=goal.id),
+            Task(name="Running errands", description="Post office"),
+        ])
+
+        # When
+        everything = await task_manager.search("runn")
+        for_goal = await task_manager.search("runn", goal_id=goal.id)
+        goals = await goal_manager.search("marathon")
+
+        # Then
+        assert len(everything) == 2
+        assert [result.item.name for result in for_goal] == ["Running shoes"]
+        assert [result.item.id for result in goals] == [goal.id]
+
+    @pytest.mark.asyncio
+    async def test_triggers_keep_index_in_sync(self, task_manager: TaskManager):
+        """Test that updates and deletes are reflected in search results."""
+        # Given
+        kept = await task_manager.create_task(Task(name="Call plumber", description="Leaking sink"))
+        removed = await task_manager.create_task(Task(name="Call electrician", description="Broken lamp"))
+
+        # When
+        await task_manager.update_task(kept.id, name="Email plumber")
+        await task_manager.delete_task(removed.id)
+
+        # Then
+        assert await task_manager.search("call") == []
+        assert [result.item.id for result in await task_manager.search("email plumber")] == [kept.id]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_indexes_untracked_rows(self, task_manager: TaskManager):
+        """Test that rebuilding indexes rows written while the triggers were missing."""
+        # Given
+        async with get_engine().begin() as conn:
+            await conn.exec_driver_sql("DROP TRIGGER task_fts_ai")
+            await conn.exec_driver_sql(
+                "INSERT INTO task (name, description, priority, status) VALUES ('Legacy', 'Imported row', 3, 'In Progress')"
+            )
+        assert await task_manager.search("legacy") == []
+
+        # When
+        await rebuild_search_index()
+
+        # Then
+        assert [result.item.name for result in await task_manager.search("legacy")] == ["Legacy"]
+
+    @pytest.mark.asyncio
+    async def test_empty_query(self, task_manager: TaskManager):
+        """Test that a query without words returns nothing."""
+        # When / Then
+        assert await task_manager.search("?!") == []
@@ -13,20 +13,24 @@ import pytest
 import pytest_asyncio
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import event
 from sqlmodel import delete
 
 # Local application imports
-from src.models.model import Goal
-from src.models.db_manager import GoalManager
-from src.services.db_setup import create_db_and_tables, get_engine
+from src.models.model import Goal, Task, TaskHistory, GoalStats
+from src.models.db_manager import GoalManager, TaskManager, TaskHistoryManager
+from src.services.db_setup import create_db_and_tables, get_engine, get_reader_engine
 
 @pytest_asyncio.fixture(autouse=True)
 async def setup_database():
     """Setup test database before each test."""
     await create_db_and_tables()
     
-    # Clear all data from the goals table
+    # Clear all data from the goals table and the tasks referring to it
     async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(TaskHistory))
+        await session.exec(delete(Task))
+        await session.exec(delete(GoalStats))
         await session.exec(delete(Goal))
         await session.commit()
     yield
@@ -166,4 +170,190 @@ class TestGoalManager:
         delete_success = await goal_manager.delete_goal(999)
         
         # Then
-        assert delete_success is False
\ No newline at end of file
+        assert delete_success is False
+
+class TestGoalManagerBulk:
+    """Test suite for GoalManager bulk operations."""
+
+    @pytest.mark.asyncio
+    async def test_create_goals(self, goal_manager: GoalManager):
+        """Test bulk goal creation across several chunks."""
+        # Given
+        goals = [Goal(name=f"Goal {i}", description="Bulk goal") for i in range(7)]
+
+        # When
+        ids = await goal_manager.create_goals(goals, chunk_size=3)
+
+        # Then
+        assert len(ids) == 7
+        assert len(set(ids)) == 7
+        assert [g.id for g in goals] == ids
+        assert all(g.created_at is not None for g in goals)
+        all_goals = await goal_manager.get_all_goals()
+        assert sorted(g.id for g in all_goals) == sorted(ids)
+
+    @pytest.mark.asyncio
+    async def test_update_goals(self, goal_manager: GoalManager):
+        """Test set-based bulk goal update."""
+        # Given
+        ids = await goal_manager.create_goals(
+            [Goal(name=f"Goal {i}", description="Bulk goal") for i in range(5)]
+        )
+
+        # When
+        updated = await goal_manager.update_goals(ids[:3], chunk_size=2, status="Completed")
+
+        # Then
+        assert updated == 3
+        statuses = {g.id: g.status for g in await goal_manager.get_all_goals()}
+        assert all(statuses[i] == "Completed" for i in ids[:3])
+        assert all(statuses[i] is None for i in ids[3:])
+
+    @pytest.mark.asyncio
+    async def test_delete_goals(self, goal_manager: GoalManager):
+        """Test bulk goal deletion, ignoring unknown ids."""
+        # Given
+        ids = await goal_manager.create_goals(
+            [Goal(name=f"Goal {i}", description="Bulk goal") for i in range(4)]
+        )
+
+        # When
+        deleted = await goal_manager.delete_goals(ids[:2] + [999])
+
+        # Then
+        assert deleted == 2
+        remaining = await goal_manager.get_all_goals()
+        assert sorted(g.id for g in remaining) == sorted(ids[2:])
+
+    @pytest.mark.asyncio
+    async def test_bulk_empty_input(self, goal_manager: GoalManager):
+        """Test bulk operations on empty input are no-ops."""
+        assert await goal_manager.create_goals([]) == []
+        assert await goal_manager.update_goals([], status="Completed") == 0
+        assert await goal_manager.delete_goals([]) == 0
+
+
+class TestGoalManagerEagerLoading:
+    """Test suite for relationship eager loading."""
+
+    @pytest.mark.asyncio
+    async def test_get_goal_with_tasks(self, goal_manager: GoalManager):
+        """Test a goal and all its tasks load in a fixed number of queries."""
+        # Given
+        goal = await goal_manager.create_goal(Goal(name="Goal", description="d"))
+        await TaskManager().create_tasks(
+            [Task(name=f"Task {i}", description="d", goal_id=goal.id) for i in range(50)]
+        )
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(get_reader_engine().sync_engine, "before_cursor_execute", listener)
+
+        # When
+        loaded = await goal_manager.get_goal_with_tasks(goal.id)
+        event.remove(get_reader_engine().sync_engine, "before_cursor_execute", listener)
+
+        # Then
+        assert len(loaded.tasks) == 50
+        assert len(statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_all_goals_nested_load(self, goal_manager: GoalManager):
+        """Test nested relationship paths are loaded before the session closes."""
+        # Given
+        goal = await goal_manager.create_goal(Goal(name="Goal", description="d"))
+        task = await TaskManager().create_task(Task(name="Task", description="d", goal_id=goal.id))
+        await TaskHistoryManager().create_task_history(TaskHistory(task_id=task.id, change_type="Update"))
+
+        # When
+        goals = await goal_manager.get_all_goals(load=["tasks.task_history", "tasks.goal"])
+
+        # Then
+        assert [h.change_type for h in goals[0].tasks[0].task_history] == ["Update"]
+        assert goals[0].tasks[0].goal.id == goal.id
+
+    @pytest.mark.asyncio
+    async def test_unknown_relationship(self, goal_manager: GoalManager):
+        """Test an unknown relationship path is rejected."""
+        with pytest.raises(ValueError):
+            await goal_manager.get_all_goals(load=["tasks.missing"])
+
+
+
+class TestGoalProgress:
+    """Test suite for SQL-side goal progress and the goal_stats summary table."""
+
+    @pytest_asyncio.fixture
+    async def goals(self, goal_manager: GoalManager):
+        """Provide two goals, one of them with tasks."""
+        ids = await goal_manager.create_goals([Goal(name="Busy", description="d"), Goal(name="Idle", description="d")])
+        await TaskManager().create_tasks([
+            Task(name="A", description="d", goal_id=ids[0], status="Completed", duration_seconds=600),
+            Task(name="B", description="d", goal_id=ids[0], status="In Progress", duration_seconds=300,
+                 due_date=datetime(2000, 1, 1)),
+            Task(name="C", description="d", goal_id=ids[0], status="Not Started", due_date=datetime(2999, 1, 1)),
+            Task(name="D", description="d", goal_id=ids[0], status="Completed", due_date=datetime(2000, 1, 1)),
+        ])
+        return ids
+
+    @pytest.mark.asyncio
+    async def test_get_progress(self, goal_manager: GoalManager, goals):
+        """Test progress is aggregated per goal in SQL."""
+        # When
+        busy = await goal_manager.get_progress(goals[0])
+        everything = await goal_manager.get_all_progress()
+
+        # Then
+        assert busy.total_tasks == 4
+        assert (busy.not_started, busy.in_progress, busy.completed) == (1, 1, 2)
+        assert busy.total_duration_seconds == 900
+        assert busy.overdue == 1
+        assert busy.completion_rate == 0.5
+        assert [p.goal_id for p in everything] == goals
+        assert everything[1].total_tasks == 0
+        assert await goal_manager.get_progress(999) is None
+
+    @pytest.mark.asyncio
+    async def test_summary_table_maintained(self, goal_manager: GoalManager, goals, monkeypatch):
+        """Test TaskManager writes keep goal_stats equal to the computed progress."""
+        # Given
+        monkeypatch.setattr(TaskManager, "maintain_goal_stats", True)
+        assert await goal_manager.rebuild_goal_stats() == 1
+        task_manager = TaskManager()
+
+        # When
+        task = await task_manager.create_task(Task(name="E", description="d", goal_id=goals[1], duration_seconds=60))
+        await task_manager.update_task(task.id, status="Completed", duration_seconds=120)
+        ids = await task_manager.create_tasks(
+            [Task(name=f"F{i}", description="d", goal_id=goals[1]) for i in range(3)]
+        )
+        await task_manager.update_tasks(ids[:2], goal_id=goals[0], status="Completed")
+        await task_manager.delete_tasks(ids[2:])
+        busy_tasks = await task_manager.find_tasks(goal_id=goals[0], status="In Progress")
+        await task_manager.delete_task(busy_tasks[0].id)
+
+        # Then
+        computed = await goal_manager.get_all_progress()
+        summary = await goal_manager.get_all_progress(use_summary=True)
+        assert summary == computed
+        assert (computed[0].total_tasks, computed[0].completed) == (5, 4)
+        assert (computed[1].total_tasks, computed[1].total_duration_seconds) == (1, 120)
+
+    @pytest.mark.asyncio
+    async def test_summary_table_maintained_by_update_values(self, goal_manager: GoalManager, goals, monkeypatch):
+        """Test update_task_values keeps goal_stats up to date too."""
+        # Given
+        monkeypatch.setattr(TaskManager, "maintain_goal_stats", True)
+        await goal_manager.rebuild_goal_stats()
+        task_manager = TaskManager()
+        task = await task_manager.create_task(Task(name="G", description="d", goal_id=goals[1], duration_seconds=60))
+
+        # When
+        updated = await task_manager.update_task_values(task.id, status="Completed", duration_seconds=90)
+        missing = await task_manager.update_task_values(999, status="Completed")
+
+        # Then
+        assert updated is True
+        assert missing is False
+        assert await goal_manager.get_all_progress(use_summary=True) == await goal_manager.get_all_progress()
+        progress = await goal_manager.get_progress(goals[1], use_summary=True)
+        assert (progress.completed, progress.total_duration_seconds) == (1, 90)
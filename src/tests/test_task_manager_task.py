@@ -16,8 +16,8 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import delete
 
 # Local application imports
-from src.models.model import Task
-from src.models.db_manager import TaskManager
+from src.models.model import Task, Goal, TaskHistory
+from src.models.db_manager import TaskManager, GoalManager, TaskHistoryManager
 from src.services.db_setup import create_db_and_tables, get_engine
 
 @pytest_asyncio.fixture(autouse=True)
@@ -168,3 +168,147 @@ class TestTaskManager:
         
         # Then
         assert delete_success is False
+
+    @pytest.mark.asyncio
+    async def test_create_update_delete_tasks(self, task_manager: TaskManager):
+        """Test the bulk task writers in a single round trip each."""
+        # Given
+        tasks = [Task(name=f"Task {i}", description="Bulk task", priority=i % 3) for i in range(10)]
+
+        # When
+        ids = await task_manager.create_tasks(tasks, chunk_size=4)
+        updated = await task_manager.update_tasks(ids[:5], status="Completed")
+        deleted = await task_manager.delete_tasks(ids[5:])
+
+        # Then
+        assert len(ids) == 10
+        assert updated == 5
+        assert deleted == 5
+        remaining = await task_manager.get_all_tasks()
+        assert sorted(t.id for t in remaining) == sorted(ids[:5])
+        assert all(t.status == "Completed" for t in remaining)
+
+    @pytest.mark.asyncio
+    async def test_iter_all_tasks_keyset(self, task_manager: TaskManager):
+        """Test streaming tasks page by page in primary key and column order."""
+        # Given
+        due_dates = [datetime(2024, 1, d) if d else None for d in (2, None, 1, 2, 3, None, 1)]
+        ids = await task_manager.create_tasks(
+            [Task(name=f"Task {i}", description="Paged", due_date=d) for i, d in enumerate(due_dates)]
+        )
+
+        # When
+        by_id = [t.id async for t in task_manager.iter_all_tasks(batch_size=2)]
+        by_due = [t.id async for t in task_manager.iter_all_tasks(batch_size=2, order_by="due_date")]
+        by_due_desc = [t.id async for t in task_manager.iter_all_tasks(batch_size=3, order_by="-due_date")]
+
+        # Then
+        assert by_id == sorted(ids)
+        expected = sorted(zip(due_dates, ids), key=lambda p: (p[0] is not None, p[0] or datetime.min, p[1]))
+        assert by_due == [i for _, i in expected]
+        assert by_due_desc == [i for _, i in reversed(expected)]
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_page(self, task_manager: TaskManager):
+        """Test fetching tasks one page at a time."""
+        # Given
+        ids = await task_manager.create_tasks([Task(name=f"Task {i}", description="Paged") for i in range(5)])
+
+        # When
+        first = await task_manager.get_tasks_page(limit=3)
+        second = await task_manager.get_tasks_page(after_id=first[-1].id, limit=3)
+
+        # Then
+        assert [t.id for t in first] == ids[:3]
+        assert [t.id for t in second] == ids[3:]
+        assert await task_manager.get_tasks_page(after_id=ids[-1]) == []
+
+    @pytest.mark.asyncio
+    async def test_iter_all_tasks_unknown_order(self, task_manager: TaskManager):
+        """Test ordering by an unknown column is rejected."""
+        with pytest.raises(ValueError):
+            [t async for t in task_manager.iter_all_tasks(order_by="missing")]
+
+    @pytest.mark.asyncio
+    async def test_find_tasks(self, task_manager: TaskManager):
+        """Test filtering tasks in SQL by status, due date range and priority."""
+        # Given
+        goal = await GoalManager().create_goal(Goal(name="Goal", description="d"))
+        await task_manager.create_tasks([
+            Task(name="Overdue", description="d", status="In Progress", priority=1, due_date=datetime(2024, 1, 1)),
+            Task(name="Due soon", description="d", status="In Progress", priority=2, due_date=datetime(2024, 1, 10)),
+            Task(name="Done", description="d", status="Completed", priority=1, due_date=datetime(2024, 1, 1)),
+            Task(name="Later", description="d", status="Not Started", priority=5, due_date=datetime(2024, 2, 1)),
+            Task(name="Goal task", description="d", status="Not Started", goal_id=goal.id, priority=3),
+        ])
+
+        # When
+        overdue = await task_manager.find_tasks(status="In Progress", due_before=datetime(2024, 1, 5))
+        open_tasks = await task_manager.find_tasks(status=["In Progress", "Not Started"], order_by="-priority")
+        january = await task_manager.find_tasks(
+            due_after=datetime(2024, 1, 1), due_before=datetime(2024, 2, 1), priority_max=1, order_by="name"
+        )
+        by_goal = await task_manager.find_tasks(goal_id=goal.id, status="Not Started")
+        limited = await task_manager.find_tasks(order_by="due_date", limit=2)
+
+        # Then
+        assert [t.name for t in overdue] == ["Overdue"]
+        assert [t.name for t in open_tasks] == ["Later", "Goal task", "Due soon", "Overdue"]
+        assert [t.name for t in january] == ["Done", "Overdue"]
+        assert [t.name for t in by_goal] == ["Goal task"]
+        assert len(limited) == 2
+
+    @pytest.mark.asyncio
+    async def test_find_tasks_uses_index(self, task_manager: TaskManager):
+        """Test the status and due date filter is answered from the composite index."""
+        # Given
+        stmt = task_manager._find_tasks_statement(status="In Progress", due_before=datetime(2024, 1, 5))
+        compiled = stmt.compile(get_engine().sync_engine, compile_kwargs={"literal_binds": True})
+
+        # When
+        async with get_engine().connect() as conn:
+            plan = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")).all()
+
+        # Then
+        assert any("ix_task_status_due_date" in row[-1] for row in plan)
+
+    @pytest.mark.asyncio
+    async def test_update_task_values(self, task_manager: TaskManager, sample_task: Task):
+        """Test the hydration-free update fast path."""
+        # Given
+        created_task = await task_manager.create_task(sample_task)
+
+        # When
+        updated = await task_manager.update_task_values(created_task.id, status="Completed")
+        missing = await task_manager.update_task_values(999, status="Completed")
+
+        # Then
+        assert updated is True
+        assert missing is False
+        assert (await task_manager.get_task(created_task.id)).status == "Completed"
+
+    @pytest.mark.asyncio
+    async def test_update_task_unknown_field(self, task_manager: TaskManager, sample_task: Task):
+        """Test unknown and relationship fields are rejected up front."""
+        created_task = await task_manager.create_task(sample_task)
+        with pytest.raises(ValueError):
+            await task_manager.update_task(created_task.id, nmae="Typo")
+        with pytest.raises(ValueError):
+            await task_manager.update_task(created_task.id, goal=None)
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_with_history(self, task_manager: TaskManager):
+        """Test tasks are returned with their history loaded."""
+        # Given
+        ids = await task_manager.create_tasks([Task(name=f"Task {i}", description="d") for i in range(3)])
+        await TaskHistoryManager().create_task_histories(
+            [TaskHistory(task_id=ids[0], change_type="Update"), TaskHistory(task_id=ids[0], change_type="Update")]
+        )
+
+        # When
+        tasks = await task_manager.get_tasks_with_history(ids[:2])
+
+        # Then
+        assert [t.id for t in tasks] == ids[:2]
+        assert len(tasks[0].task_history) == 2
+        assert tasks[1].task_history == []
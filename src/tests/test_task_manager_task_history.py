@@ -1,5 +1,6 @@
 # Standard library imports
 import sys
+import asyncio
 from pathlib import Path
 from datetime import datetime, date
 
@@ -13,12 +14,15 @@ import pytest
 import pytest_asyncio
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import event
 from sqlmodel import delete
 
 # Local application imports
 from src.models.model import Task, TaskHistory
 from src.models.db_manager import TaskManager, TaskHistoryManager
 from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.history_writer import TaskHistoryWriter
+from src.services.unit_of_work import unit_of_work
 
 @pytest_asyncio.fixture(autouse=True)
 async def setup_database():
@@ -98,3 +102,253 @@ class TestTaskHistory:
         #then
         retrived_task_history = await task_history_manager.get_task_history(created_task_history.id)
         assert retrived_task_history is None
+
+    @pytest.mark.asyncio
+    async def test_delete_task_keeps_history(self, task_history_manager: TaskHistoryManager, sample_task_history: TaskHistory):
+        """Test deleting a task detaches its history instead of failing the foreign key."""
+        #given
+        created_task_history = await task_history_manager.create_task_history(sample_task_history)
+
+        #when
+        deleted = await TaskManager().delete_task(created_task_history.task_id)
+
+        #then
+        assert deleted is True
+        retrived_task_history = await task_history_manager.get_task_history(created_task_history.id)
+        assert retrived_task_history.task_id is None
+
+
+class TestTaskHistoryCapture:
+    """Test suite for automatic TaskHistory capture through TaskHistoryWriter."""
+
+    @pytest.mark.asyncio
+    async def test_update_records_changed_fields(self, task_history_manager: TaskHistoryManager):
+        """Test update_task records only the fields that changed."""
+        #given
+        async with TaskHistoryWriter(flush_interval=10) as writer:
+            task_manager = TaskManager(history_writer=writer)
+            task = await task_manager.create_task(Task(name="Task", description="d", priority=3))
+
+            #when
+            await task_manager.update_task(task.id, priority=1, description="d", due_date=datetime(2024, 5, 1, 9, 30))
+            await writer.flush()
+
+            #then
+            histories = await task_history_manager.get_all_task_histories()
+            assert len(histories) == 1
+            assert histories[0].task_id == task.id
+            assert histories[0].change_type == "Update"
+            assert histories[0].previous_state == {"priority": 3, "due_date": None}
+            assert histories[0].new_state == {"priority": 1, "due_date": "2024-05-01T09:30:00"}
+            assert histories[0].created_at is not None
+
+    @pytest.mark.asyncio
+    async def test_update_values_records_history(self, task_history_manager: TaskHistoryManager):
+        """Test update_task_values records history like update_task."""
+        #given
+        async with TaskHistoryWriter(flush_interval=10) as writer:
+            task_manager = TaskManager(history_writer=writer)
+            task = await task_manager.create_task(Task(name="Task", description="d", priority=3))
+
+            #when
+            updated = await task_manager.update_task_values(task.id, priority=1)
+            missing = await task_manager.update_task_values(9999, priority=1)
+            await writer.flush()
+
+        #then
+        assert updated is True
+        assert missing is False
+        histories = await task_history_manager.get_all_task_histories()
+        assert [(h.previous_state, h.new_state) for h in histories] == [({"priority": 3}, {"priority": 1})]
+
+    @pytest.mark.asyncio
+    async def test_stopped_writer(self, task_history_manager: TaskHistoryManager, caplog):
+        """Test a stopped writer refuses writes, and one stopping mid-write does not fail the committed write."""
+        #given
+        writer = TaskHistoryWriter()
+        task_manager = TaskManager(history_writer=writer)
+        task = await task_manager.create_task(Task(name="Task", description="d", priority=3))
+
+        #when
+        updated, _ = await asyncio.gather(task_manager.update_task(task.id, priority=1), writer.stop())
+
+        #then
+        assert updated.priority == 1
+        assert "Dropped Update history" in caplog.text
+        with pytest.raises(RuntimeError):
+            await task_manager.update_task(task.id, priority=2)
+        assert (await TaskManager().get_task(task.id)).priority == 1
+        assert await task_history_manager.get_all_task_histories() == []
+
+    @pytest.mark.asyncio
+    async def test_entries_are_batched(self, task_history_manager: TaskHistoryManager):
+        """Test queued entries are written in batches of at most batch_size."""
+        #given
+        task = await TaskManager().create_task(Task(name="Task", description="d"))
+        commits = []
+        listener = lambda conn: commits.append(conn)
+        event.listen(get_engine().sync_engine, "commit", listener)
+        writer = TaskHistoryWriter(batch_size=4, flush_interval=10)
+
+        #when
+        for priority in range(10):
+            await writer.record(TaskHistory(task_id=task.id, change_type="Update", new_state={"priority": priority}))
+        await writer.stop()
+        event.remove(get_engine().sync_engine, "commit", listener)
+
+        #then
+        assert writer.written == 10
+        assert len(commits) == 3
+        histories = await task_history_manager.get_all_task_histories()
+        assert [h.new_state["priority"] for h in histories] == list(range(10))
+        with pytest.raises(RuntimeError):
+            await writer.record(TaskHistory(task_id=task.id, change_type="Update"))
+
+    @pytest.mark.asyncio
+    async def test_delete_records_previous_state(self, task_history_manager: TaskHistoryManager):
+        """Test delete_task records the full state of the deleted task."""
+        #given
+        async with TaskHistoryWriter() as writer:
+            task_manager = TaskManager(history_writer=writer)
+            task = await task_manager.create_task(Task(name="Task", description="d"))
+
+            #when
+            assert await task_manager.delete_task(task.id) is True
+            assert await task_manager.delete_task(task.id) is False
+
+        #then
+        histories = await task_history_manager.get_all_task_histories()
+        assert len(histories) == 1
+        assert histories[0].change_type == "Delete"
+        assert histories[0].previous_state["id"] == task.id
+        assert histories[0].previous_state["name"] == "Task"
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_writes_history_in_transaction(self, task_history_manager: TaskHistoryManager):
+        """Test entries recorded inside a unit of work skip the queue and share its commit."""
+        #given
+        writer = TaskHistoryWriter()
+        task_manager = TaskManager(history_writer=writer)
+
+        #when
+        async with unit_of_work():
+            task = await task_manager.create_task(Task(name="Task", description="d"))
+            await task_manager.update_task(task.id, status="Completed")
+
+        #then
+        assert writer.written == 0
+        histories = await task_history_manager.get_all_task_histories()
+        assert [h.new_state for h in histories] == [{"status": "Completed"}]
+        await writer.stop()
+
+class TestDeltaHistory:
+    """Test suite for delta-mode TaskHistory and point-in-time reconstruction."""
+
+    @pytest.mark.asyncio
+    async def test_updates_store_new_values_only(self, task_history_manager: TaskHistoryManager):
+        """Test delta entries hold no previous state, after a checkpoint on create."""
+        #given
+        async with TaskHistoryWriter(flush_interval=10) as writer:
+            task_manager = TaskManager(history_writer=writer, history_mode="delta")
+            task = await task_manager.create_task(Task(name="Task", description="d", priority=3))
+
+            #when
+            await task_manager.update_task(task.id, priority=1)
+            await writer.flush()
+
+        #then
+        histories = await task_history_manager.get_all_task_histories()
+        assert [h.change_type for h in histories] == ["Checkpoint", "Update"]
+        assert histories[0].new_state["priority"] == 3
+        assert histories[1].previous_state is None
+        assert histories[1].new_state == {"priority": 1}
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_every_n_changes(self, task_history_manager: TaskHistoryManager):
+        """Test a full checkpoint is written after every checkpoint_interval updates."""
+        #given
+        task_manager = TaskManager(history_writer=TaskHistoryWriter(), history_mode="delta", checkpoint_interval=3)
+        async with unit_of_work():
+            task = await task_manager.create_task(Task(name="Task", description="d"))
+
+            #when
+            for priority in range(1, 8):
+                await task_manager.update_task(task.id, priority=priority)
+
+        #then
+        histories = await task_history_manager.get_all_task_histories()
+        assert [h.change_type[0] for h in histories] == list("CUUUCUUUCU")
+        assert histories[-2].new_state["priority"] == 6
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_count_queued_entries(self, task_history_manager: TaskHistoryManager):
+        """Test checkpoints are due by interval while the entries are still queued on the writer."""
+        #given
+        existing = await TaskManager().create_task(Task(name="Existing", description="no history"))
+        async with TaskHistoryWriter(flush_interval=10) as writer:
+            task_manager = TaskManager(history_writer=writer, history_mode="delta", checkpoint_interval=3)
+            task = await task_manager.create_task(Task(name="Task", description="d"))
+
+            #when
+            for priority in range(1, 11):
+                await task_manager.update_task(task.id, priority=priority)
+            for priority in range(1, 3):
+                await task_manager.update_task(existing.id, priority=priority)
+            queued = writer.queued_change_types(task.id)
+            await writer.flush()
+
+        #then
+        histories = await task_history_manager.get_all_task_histories()
+        assert "".join(h.change_type[0] for h in histories if h.task_id == task.id) == "CUUUCUUUCUUUCU"
+        assert "".join(h.change_type[0] for h in histories if h.task_id == existing.id) == "CUU"
+        assert queued == ("Update",) * 3 + ("Checkpoint",) + ("Update",) * 3 + ("Checkpoint",) + ("Update",) * 3 + ("Checkpoint", "Update")
+        assert writer.queued_change_types(task.id) == ()
+
+    @pytest.mark.asyncio
+    async def test_state_at(self, task_history_manager: TaskHistoryManager):
+        """Test past states are rebuilt from the nearest checkpoint and later deltas."""
+        #given
+        task_manager = TaskManager(history_writer=TaskHistoryWriter(), history_mode="delta", checkpoint_interval=2)
+        before_create = datetime.now()
+        async with unit_of_work():
+            task = await task_manager.create_task(Task(name="Task", description="d", priority=3))
+        moments = []
+        for priority, status in [(2, "In Progress"), (1, "In Progress"), (1, "Completed")]:
+            moments.append(datetime.now())
+            async with unit_of_work():
+                await task_manager.update_task(task.id, priority=priority, status=status)
+        moments.append(datetime.now())
+
+        #when
+        states = [await task_history_manager.state_at(task.id, moment) for moment in moments]
+
+        #then
+        assert await task_history_manager.state_at(task.id, before_create) is None
+        assert [(s["priority"], s["status"]) for s in states] == [
+            (3, "In Progress"), (2, "In Progress"), (1, "In Progress"), (1, "Completed"),
+        ]
+        assert states[-1]["name"] == "Task"
+
+    @pytest.mark.asyncio
+    async def test_first_change_of_existing_task_starts_chain(self, task_history_manager: TaskHistoryManager):
+        """Test a task created without history gets a checkpoint of its state before the first change."""
+        #given
+        task = await TaskManager().create_task(Task(name="Task", description="d", priority=3))
+        task_manager = TaskManager(history_writer=TaskHistoryWriter(), history_mode="delta")
+
+        #when
+        async with unit_of_work():
+            await task_manager.update_task(task.id, priority=1)
+        after = datetime.now()
+
+        #then
+        histories = await task_history_manager.get_all_task_histories()
+        assert [h.change_type for h in histories] == ["Checkpoint", "Update"]
+        assert histories[0].new_state["priority"] == 3
+        assert (await task_history_manager.state_at(task.id, after))["priority"] == 1
+
+    def test_invalid_history_mode(self):
+        """Test unknown history modes are rejected."""
+        #when / then
+        with pytest.raises(ValueError):
+            TaskManager(history_mode="compressed")
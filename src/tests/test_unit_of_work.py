@@ -0,0 +1,109 @@
+# Standard library imports
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete
+
+# Local application imports
+from src.models.model import Task, TaskHistory
+from src.models.db_manager import TaskManager, TaskHistoryManager
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.unit_of_work import unit_of_work, current_session
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    # Clear task history before the tasks it refers to
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(TaskHistory))
+        await session.exec(delete(Task))
+        await session.commit()
+    yield
+
+@pytest.fixture
+def commit_counter():
+    """Count the transactions committed on the application engine."""
+    commits = []
+    listener = lambda conn: commits.append(conn)
+    event.listen(get_engine().sync_engine, "commit", listener)
+    yield commits
+    event.remove(get_engine().sync_engine, "commit", listener)
+
+class TestUnitOfWork:
+    """Test suite for the shared unit-of-work session scope."""
+
+    @pytest.mark.asyncio
+    async def test_commits_once(self, commit_counter):
+        """Test a task and its history are written in a single transaction."""
+        # When
+        async with unit_of_work() as uow:
+            task = await TaskManager().create_task(Task(name="Task", description="d"))
+            history = await TaskHistoryManager().create_task_history(
+                TaskHistory(task_id=task.id, change_type="Create")
+            )
+            assert current_session() is uow.session
+
+        # Then
+        assert len(commit_counter) == 1
+        assert current_session() is None
+        assert task.name == "Task"
+        stored = await TaskHistoryManager().get_task_history(history.id)
+        assert stored.task_id == task.id
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_on_error(self):
+        """Test no changes are kept when the block raises."""
+        # When
+        with pytest.raises(RuntimeError):
+            async with unit_of_work():
+                task = await TaskManager().create_task(Task(name="Task", description="d"))
+                await TaskManager().update_task(task.id, name="Renamed")
+                raise RuntimeError("abort")
+
+        # Then
+        assert await TaskManager().get_all_tasks() == []
+
+    @pytest.mark.asyncio
+    async def test_nested_joins_outer(self, commit_counter):
+        """Test a nested unit of work shares the outer transaction."""
+        # When
+        with pytest.raises(RuntimeError):
+            async with unit_of_work() as outer:
+                async with unit_of_work() as inner:
+                    assert inner.session is outer.session
+                    await TaskManager().create_tasks([Task(name="Task", description="d")])
+                raise RuntimeError("abort")
+
+        # Then
+        assert commit_counter == []
+        assert await TaskManager().get_all_tasks() == []
+
+    @pytest.mark.asyncio
+    async def test_reads_see_pending_writes(self):
+        """Test reads inside the unit of work see its uncommitted changes."""
+        async with unit_of_work():
+            task = await TaskManager().create_task(Task(name="Task", description="d"))
+            found = await TaskManager().find_tasks(status="In Progress")
+            assert [t.id for t in found] == [task.id]
+
+    @pytest.mark.asyncio
+    async def test_per_call_transactions_without_scope(self, commit_counter):
+        """Test each manager call still commits on its own outside a unit of work."""
+        # When
+        task = await TaskManager().create_task(Task(name="Task", description="d"))
+        await TaskManager().update_task(task.id, name="Renamed")
+
+        # Then
+        assert len(commit_counter) == 2
@@ -0,0 +1,171 @@
+# Standard library imports
+import sys
+from pathlib import Path
+from datetime import date, datetime
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from pydantic import ValidationError
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete
+
+# Local application imports
+from src.models.model import Goal, Task, GoalStats
+from src.models.db_manager import GoalManager, TaskManager
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.validation import construct_trusted, construct_many_trusted, validate_rows
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(Task))
+        await session.exec(delete(GoalStats))
+        await session.exec(delete(Goal))
+        await session.commit()
+    yield
+
+@pytest_asyncio.fixture
+async def task_manager():
+    """Provide a TaskManager instance."""
+    return TaskManager()
+
+def task_row(**values):
+    row = {
+        "id": None, "goal_id": None, "name": "Row", "description": "From a row", "priority": 2,
+        "status": "Not Started", "due_date": datetime(2024, 3, 1, 9), "suggested_start_time": None,
+        "start_date": None, "duration_seconds": 600, "is_time_fixed": False, "reccurence": None,
+        "ai_generated": False, "created_at": datetime(2024, 1, 1), "updated_at": None,
+    }
+    row.update(values)
+    return row
+
+class TestConstructTrusted:
+    """Test suite for construct_trusted."""
+
+    def test_matches_regular_construction(self):
+        """Test a trusted instance holds the same values as one built through __init__."""
+        # Given
+        row = task_row(id=7)
+
+        # When
+        trusted = construct_trusted(Task, row)
+
+        # Then
+        assert trusted.model_dump() == Task(**row).model_dump()
+        assert trusted.model_dump(exclude_unset=True) == row
+        assert trusted.duration.total_seconds() == 600
+
+    def test_fills_defaults(self):
+        """Test optional columns left out of the row get their defaults."""
+        # When
+        task = construct_trusted(Task, {"name": "Partial", "description": "Few columns"})
+        goal = construct_trusted(Goal, {"name": "Goal", "description": "Defaults"})
+
+        # Then
+        assert task.priority == 3
+        assert task.status == "In Progress"
+        assert task.id is None
+        assert isinstance(goal.created_at, datetime)
+
+    def test_skips_validators(self):
+        """Test the model_validator hooks do not run on trusted rows."""
+        # When
+        task = construct_trusted(Task, task_row(status="Legacy"))
+
+        # Then
+        assert task.status == "Legacy"
+
+    @pytest.mark.asyncio
+    async def test_trusted_instances_can_be_written(self, task_manager: TaskManager):
+        """Test trusted instances go through both the single and the bulk insert path."""
+        # Given
+        single = construct_trusted(Task, task_row(name="Single"))
+        many = construct_many_trusted(Task, [task_row(name=f"Bulk {i}") for i in range(3)])
+
+        # When
+        created = await task_manager.create_task(single)
+        ids = await task_manager.create_tasks(many)
+
+        # Then
+        assert created.id is not None
+        assert len(ids) == 3
+        assert sorted(task.name for task in await task_manager.get_all_tasks()) == ["Bulk 0", "Bulk 1", "Bulk 2", "Single"]
+
+class TestValidateRows:
+    """Test suite for validate_rows."""
+
+    def test_reports_errors_per_row(self):
+        """Test each invalid row is reported by position with all its problems."""
+        # Given
+        rows = [
+            {"name": "Fine", "description": "ok", "status": "Completed"},
+            {"name": "  ", "description": "blank name", "status": "Done"},
+            {"name": "No description"},
+            {"name": "Backwards", "description": "dates", "start_date": date(2024, 2, 1), "end_date": date(2024, 1, 1)},
+        ]
+
+        # When
+        errors = validate_rows(Goal, rows)
+
+        # Then
+        assert errors == {
+            1: ["Goal name cannot be empty", "Invalid status. Must be one of: Not Started, In Progress, Completed or None"],
+            2: ["Field required: description"],
+            3: ["Start date cannot be after end date"],
+        }
+
+    def test_valid_rows(self):
+        """Test valid task rows produce no errors."""
+        # When / Then
+        assert validate_rows(Task, [task_row(), task_row(status=None)]) == {}
+        assert validate_rows(Task, [task_row(name="")]) == {0: ["Task name cannot be empty"]}
+
+    def test_checks_types_and_constraints(self):
+        """Test values are checked against their column types and Field constraints, without coercion."""
+        # Given
+        rows = [
+            task_row(priority="2", due_date="2024-03-01T09:00:00", is_time_fixed=1),
+            task_row(name=5, description=None),
+            task_row(priority=True, duration_seconds=600),
+        ]
+
+        # When
+        task_errors = validate_rows(Task, rows)
+        goal_errors = validate_rows(Goal, [{"name": "", "description": "d", "start_date": datetime(2024, 1, 1)}])
+
+        # Then
+        assert task_errors == {
+            0: [
+                "Invalid priority: expected int, got str",
+                "Invalid due_date: expected datetime, got str",
+                "Invalid is_time_fixed: expected bool, got int",
+            ],
+            1: ["Field required: description", "Invalid name: expected str, got int"],
+            2: ["Invalid priority: expected int, got bool"],
+        }
+        # A type error skips the model-level checks, which expect typed values.
+        assert goal_errors == {0: ["Invalid start_date: expected date, got datetime", "Length of name must be >= 1"]}
+        assert validate_rows(Goal, [{"name": "", "description": "d"}]) == {
+            0: ["Goal name cannot be empty", "Length of name must be >= 1"],
+        }
+
+    def test_matches_model_validator(self):
+        """Test the model validators raise the first problem validate_rows reports."""
+        # Given
+        row = {"name": "Goal", "description": "d", "status": "Unknown"}
+
+        # When
+        with pytest.raises(ValidationError) as raised:
+            Goal.model_validate(row)
+
+        # Then
+        assert validate_rows(Goal, [row])[0][0] in str(raised.value)
@@ -0,0 +1,173 @@
+# Standard library imports
+import sys
+import asyncio
+import sqlite3
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import delete, insert
+from sqlalchemy.exc import OperationalError
+
+# Local application imports
+from src.models.model import Goal, Task, TaskHistory, GoalStats
+from src.models.db_manager import BaseManager, TaskManager
+from src.services.db_setup import create_db_and_tables, get_engine
+from src.services.history_writer import TaskHistoryWriter
+from src.services.unit_of_work import unit_of_work
+from src.services.write_pipeline import WritePipeline, is_busy_error
+
+@pytest_asyncio.fixture(autouse=True)
+async def setup_database():
+    """Setup test database before each test."""
+    await create_db_and_tables()
+
+    async with AsyncSession(get_engine()) as session:
+        await session.exec(delete(TaskHistory))
+        await session.exec(delete(Task))
+        await session.exec(delete(GoalStats))
+        await session.exec(delete(Goal))
+        await session.commit()
+    yield
+    BaseManager.use_write_pipeline(None)
+
+@pytest_asyncio.fixture
+async def pipeline():
+    """Provide a started WritePipeline used by the managers."""
+    pipeline = WritePipeline(max_batch=20, max_latency=0.01, backoff=0.001)
+    BaseManager.use_write_pipeline(pipeline)
+    async with pipeline:
+        yield pipeline
+
+@pytest_asyncio.fixture
+async def task_manager():
+    """Provide a TaskManager instance."""
+    return TaskManager()
+
+def busy_error() -> OperationalError:
+    return OperationalError("INSERT", {}, sqlite3.OperationalError("database is locked"))
+
+class TestWritePipeline:
+    """Test suite for WritePipeline."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_commits(self, pipeline: WritePipeline, task_manager: TaskManager):
+        """Test that concurrent creates are committed in batches and return their own rows."""
+        # When
+        tasks = await asyncio.gather(*[
+            task_manager.create_task(Task(name=f"Task {i}", description="grouped")) for i in range(50)
+        ])
+
+        # Then
+        assert [task.name for task in tasks] == [f"Task {i}" for i in range(50)]
+        assert len({task.id for task in tasks}) == 50
+        assert pipeline.committed == 50
+        assert pipeline.batches < 50
+        assert len(await task_manager.get_all_tasks()) == 50
+
+    @pytest.mark.asyncio
+    async def test_failed_write_does_not_fail_its_batch(self, pipeline: WritePipeline, task_manager: TaskManager):
+        """Test that a failing write gets its own error and the rest of its batch commits."""
+        # Given
+        writes = [task_manager.create_task(Task(name=f"Task {i}", description="ok")) for i in range(5)]
+        writes.insert(2, task_manager.create_task(Task(name="Orphan", description="bad goal", goal_id=999)))
+
+        # When
+        results = await asyncio.gather(*writes, return_exceptions=True)
+
+        # Then
+        assert isinstance(results[2], ValueError)
+        assert all(isinstance(result, Task) for i, result in enumerate(results) if i != 2)
+        assert pipeline.failed == 1
+        assert sorted(task.name for task in await task_manager.get_all_tasks()) == [f"Task {i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_busy_errors_are_retried(self, pipeline: WritePipeline):
+        """Test that a batch hitting a busy error is retried."""
+        # Given
+        attempts = []
+
+        async def _flaky_insert(session: AsyncSession) -> int:
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise busy_error()
+            await session.exec(insert(Task).values(name="Retried", description="busy twice"))
+            return len(attempts)
+
+        # When
+        result = await pipeline.submit(_flaky_insert)
+
+        # Then
+        assert result == 3
+        assert pipeline.retries == 2
+        assert is_busy_error(busy_error())
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, pipeline: WritePipeline):
+        """Test that a batch that stays busy fails with the busy error."""
+        # Given
+        pipeline.max_retries = 1
+
+        async def _always_busy(session: AsyncSession) -> None:
+            raise busy_error()
+
+        # When / Then
+        with pytest.raises(OperationalError, match="database is locked"):
+            await pipeline.submit(_always_busy)
+        assert pipeline.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_history_joins_the_batch(self, pipeline: WritePipeline):
+        """Test that writes made by a queued write join its transaction instead of queueing."""
+        # Given
+        async with TaskHistoryWriter() as writer:
+            task_manager = TaskManager(history_writer=writer)
+            task = await task_manager.create_task(Task(name="Tracked", description="history"))
+
+            # When
+            updated = await asyncio.wait_for(task_manager.update_task(task.id, priority=1), timeout=5)
+
+        # Then
+        assert updated.priority == 1
+        async with AsyncSession(get_engine()) as session:
+            history = list(await session.exec(TaskHistory.__table__.select()))
+        assert len(history) == 1
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_bypasses_pipeline(self, pipeline: WritePipeline, task_manager: TaskManager):
+        """Test that writes inside a unit of work keep its transaction."""
+        # When
+        async with unit_of_work():
+            await task_manager.create_task(Task(name="In a unit of work", description="direct"))
+
+        # Then
+        assert pipeline.committed == 0
+        assert len(await task_manager.get_all_tasks()) == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_commits_queued_writes(self, task_manager: TaskManager):
+        """Test that stop commits everything queued before it and refuses new writes."""
+        # Given
+        pipeline = WritePipeline(max_latency=0.05)
+        BaseManager.use_write_pipeline(pipeline)
+        writes = [asyncio.ensure_future(task_manager.create_task(Task(name=f"Task {i}", description="queued"))) for i in range(3)]
+        await asyncio.sleep(0)
+
+        # When
+        await pipeline.stop()
+
+        # Then
+        assert all(write.done() for write in writes)
+        assert pipeline.committed == 3
+        with pytest.raises(RuntimeError):
+            await pipeline.submit(_noop)
+
+async def _noop(session: AsyncSession) -> None:
+    return None